@@ -0,0 +1,161 @@
+"""
+관리자 API 라우터
+
+운영 중 설정을 확인하고 다시 불러오는 엔드포인트와
+저장된 대화 재검사 작업 엔드포인트를 관리합니다.
+"""
+
+import hmac
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.config.settings import settings
+from app.domain.gaurdrails.audit import guardrail_audit
+from app.domain.gaurdrails.guardrails import guardrail_system
+from app.domain.graph.SqliteChatMemory import SqliteChatMemory
+from app.domain.graph.memory import chat_memory
+
+
+def verify_admin_key(x_admin_key: Optional[str] = Header(None)):
+    """
+    X-Admin-Key 헤더를 ADMIN_API_KEY와 비교합니다.
+    키가 설정되지 않았으면 모든 관리자 요청을 거부합니다.
+    """
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=503, detail="관리자 API가 비활성화되어 있습니다. (ADMIN_API_KEY 미설정)")
+    if x_admin_key is None or not hmac.compare_digest(
+        x_admin_key.encode("utf-8"), settings.ADMIN_API_KEY.encode("utf-8")
+    ):
+        raise HTTPException(status_code=401, detail="관리자 키가 올바르지 않습니다.")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(verify_admin_key)])
+
+# 재검사 작업은 CPU를 많이 쓰고 결과에 세션 ID와 매칭 키워드가 포함되므로,
+# 라우터 설정과 관계없이 엔드포인트에서도 관리자 키를 요구 (요청당 한 번만 검사됨)
+RESCAN_DEPENDENCIES = [Depends(verify_admin_key)]
+
+
+@router.get("/guardrails")
+async def get_guardrail_patterns() -> Dict[str, Any]:
+    """
+    활성 가드레일 패턴 세트 정보를 반환합니다.
+
+    Returns:
+        패턴 버전, 출처와 리로드 통계
+    """
+    return {
+        "patterns": guardrail_system.get_pattern_stats(),
+        "cache": guardrail_system.get_cache_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.post("/guardrails/reload")
+async def reload_guardrail_patterns() -> Dict[str, Any]:
+    """
+    설정된 패턴 파일(GUARDRAIL_PATTERNS_PATH)을 다시 읽어 가드레일 패턴을 교체합니다.
+    파일이 잘못되었으면 기존 패턴을 유지하고 400을 반환합니다.
+
+    Returns:
+        새로 활성화된 패턴 세트 정보
+    """
+    previous = guardrail_system.patterns.version
+    try:
+        patterns = await guardrail_system.reload_patterns()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "message": f"가드레일 패턴이 {previous}에서 {patterns.version}(으)로 교체되었습니다.",
+        "patterns": guardrail_system.get_pattern_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.post("/guardrails/rescan", status_code=202, dependencies=RESCAN_DEPENDENCIES)
+async def start_guardrail_rescan(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    저장된 모든 대화를 현재 가드레일 패턴으로 다시 검사하는 작업을 시작합니다.
+    한 번에 하나의 작업만 실행되며, 진행 상황은 GET /admin/guardrails/rescan/{job_id}로 확인합니다.
+
+    Args:
+        path: 검사할 SQLite 대화 저장소 덤프 경로 (GUARDRAIL_RESCAN_DUMP_DIR 기준, 없으면 현재 대화 저장소)
+
+    Returns:
+        시작된 작업 정보
+    """
+    if path is not None:
+        dump_path = _resolve_dump_path(path)
+        try:
+            # 덤프 파일은 읽기 전용으로 열어 스키마 생성이나 WAL 전환으로 변경되지 않게 함
+            memory = SqliteChatMemory(dump_path, read_only=True)
+        except sqlite3.DatabaseError as e:
+            raise HTTPException(status_code=400, detail=f"대화 저장소 파일이 아닙니다: {path} ({str(e)})")
+        source, close_memory = dump_path, True
+    else:
+        memory, source, close_memory = chat_memory, settings.CHAT_MEMORY_BACKEND, False
+
+    try:
+        job = guardrail_audit.start(memory, source=source, close_memory=close_memory)
+    except RuntimeError as e:
+        if close_memory:
+            memory.close()
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return {
+        "job": job.get_info(include_findings=False),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _resolve_dump_path(path: str) -> str:
+    """덤프 경로가 GUARDRAIL_RESCAN_DUMP_DIR 안의 파일인지 확인하고 실제 경로를 반환합니다."""
+    if not settings.GUARDRAIL_RESCAN_DUMP_DIR:
+        raise HTTPException(status_code=400, detail="덤프 검사가 설정되지 않았습니다. (GUARDRAIL_RESCAN_DUMP_DIR)")
+
+    dump_dir = os.path.realpath(settings.GUARDRAIL_RESCAN_DUMP_DIR)
+    dump_path = os.path.realpath(os.path.join(dump_dir, path))
+    if os.path.commonpath([dump_dir, dump_path]) != dump_dir:
+        raise HTTPException(status_code=400, detail=f"덤프 디렉터리 밖의 경로는 사용할 수 없습니다: {path}")
+    if not os.path.isfile(dump_path):
+        raise HTTPException(status_code=400, detail=f"저장소 파일을 찾을 수 없습니다: {path}")
+    return dump_path
+
+
+@router.get("/guardrails/rescan/{job_id}", dependencies=RESCAN_DEPENDENCIES)
+async def get_guardrail_rescan(job_id: str) -> Dict[str, Any]:
+    """
+    재검사 작업의 진행 상황과 차단/경고된 메시지 목록을 반환합니다.
+
+    Returns:
+        작업 정보
+    """
+    job = guardrail_audit.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="재검사 작업을 찾을 수 없습니다.")
+    return {
+        "job": job.get_info(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.delete("/guardrails/rescan/{job_id}", dependencies=RESCAN_DEPENDENCIES)
+async def cancel_guardrail_rescan(job_id: str) -> Dict[str, Any]:
+    """
+    실행 중인 재검사 작업을 취소합니다.
+
+    Returns:
+        작업 정보
+    """
+    job = guardrail_audit.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="재검사 작업을 찾을 수 없습니다.")
+    return {
+        "job": job.get_info(include_findings=False),
+        "timestamp": datetime.now().isoformat()
+    }
@@ -4,21 +4,58 @@
 채팅 관련 엔드포인트를 관리합니다.
 """
 
+import json
 import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional, Sequence
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage, AIMessage
 
 from app.MessageRequest import MessageRequest
-from app.domain.graph.TravelChatGraph import TravelChatGraph
+from app.component.http.HttpClientPool import http_client_pool
+from app.component.calendar.cache.CalendarEventCache import calendar_event_cache
+from app.component.search.cache.MemorySearchCache import search_cache
+from app.component.search.local.LocalSearchIndex import get_local_search_index
+from app.component.search.metrics import search_metrics
+from app.domain.agents.supervisor.ruleRouter import rule_router
+from app.domain.graph.context import context_builder
 from app.domain.graph.memory import chat_memory
+from app.domain.graph.metrics import graph_metrics
+from app.domain.gaurdrails.guardrails import guardrail_system
+from app.domain.graph.registry import graph_registry, GraphNotReadyError
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# 전역 인스턴스
-travel_chatbot = TravelChatGraph()
+# 스트리밍 시 진행 상황을 알릴 그래프 노드
+STREAM_PROGRESS_NODES = {
+    "input_guardrail",
+    "guarded_supervisor",
+    "supervisor",
+    "Researcher",
+    "Calender",
+    "Mail",
+    "Chat",
+    "plan_worker",
+    "merge",
+    "output_guardrail",
+    "guardrail_response",
+    "output_guardrail_response",
+}
+
+
+# 라우팅 결정(next)을 반환하는 그래프 노드
+ROUTING_NODES = ("supervisor", "guarded_supervisor")
+
+
+async def _get_graph():
+    """컴파일된 그래프를 반환합니다. 초기화에 실패했으면 다시 시도하고, 준비되지 않았으면 503을 반환합니다."""
+    await graph_registry.retry_startup()
+    try:
+        return graph_registry.get()
+    except GraphNotReadyError as e:
+        raise HTTPException(status_code=503, detail=f"서비스 준비 중입니다: {str(e)}")
 
 
 @router.post("/")
@@ -32,41 +69,46 @@ async def chat(request: MessageRequest) -> Dict[str, Any]:
     Returns:
         채팅 응답과 세션 ID
     """
+    graph = await _get_graph()
+
+    # 세션 ID 생성 또는 기존 세션 사용
+    session_id = request.session_id or str(uuid.uuid4())
+
     try:
-        # 세션 ID 생성 또는 기존 세션 사용
-        session_id = request.session_id or str(uuid.uuid4())
-        
-        # 기존 메시지 히스토리 가져오기
-        existing_messages = chat_memory.get_messages(session_id)
-        
         # 새로운 사용자 메시지 추가
         user_message = HumanMessage(content=request.message)
         chat_memory.add_message(session_id, user_message)
         
-        # 현재 세션의 모든 메시지로 상태 초기화
-        current_messages = existing_messages + [user_message]
+        # 현재 세션의 메시지를 토큰 예산에 맞춰 상태 초기화 (오래된 턴은 요약으로 대체)
+        current_messages = await context_builder.build(session_id, chat_memory.get_messages(session_id))
         
         messages = []
         final_response = None
+        hops = 0
         
         # 그래프 실행
-        for s in travel_chatbot.start().stream(
+        async for s in graph.astream(
             {
                 "messages": current_messages,
                 "agent_scratchpad": [],
-                "session_id": session_id
+                "session_id": session_id,
+                "hops": 0,
+                "terminal": False,
+                "multi_step": False
             }
         ):
             # 각 노드의 메시지 수집
             for key, value in s.items():
                 if key != "__end__" and isinstance(value, dict) and "messages" in value:
                     messages.extend(value["messages"])
+                if isinstance(value, dict) and "hops" in value:
+                    hops = value["hops"]
             
             # 최종 결과 확인
             if "__end__" in s:
                 final_response = s["__end__"]
                 break
-            elif "supervisor" in s and s["supervisor"].get("next") == "FINISH":
+            elif any(node in s and (s[node] or {}).get("next") == "FINISH" for node in ROUTING_NODES):
                 # supervisor가 FINISH를 반환한 경우, 수집된 메시지에서 응답 추출
                 if messages:
                     # 마지막 메시지의 내용을 반환
@@ -75,6 +117,12 @@ async def chat(request: MessageRequest) -> Dict[str, Any]:
                     final_response = "대화가 완료되었습니다."
                 break
         
+        # supervisor를 거치지 않고 종료된 경우 (종료 응답, 가드레일 차단) 마지막 메시지가 응답
+        if final_response is None and messages:
+            final_response = getattr(messages[-1], "content", messages[-1])
+        
+        graph_metrics.record_turn(hops)
+        
         if final_response:
             # AI 응답을 메모리에 저장
             ai_message = AIMessage(content=final_response)
@@ -90,6 +138,161 @@ async def chat(request: MessageRequest) -> Dict[str, Any]:
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"채팅 처리 중 오류: {str(e)}")
+    finally:
+        # 이번 턴의 메시지를 저장소에 한 번에 반영
+        chat_memory.commit_turn(session_id)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 프레임을 생성합니다."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _node_progress(node: str, output: Any) -> Dict[str, Any]:
+    """노드 실행 결과에서 클라이언트에 전달할 진행 정보를 추출합니다."""
+    progress: Dict[str, Any] = {"node": node}
+
+    if node == "supervisor":
+        progress["next"] = output.get("next") if isinstance(output, dict) else getattr(output, "next", None)
+    elif node == "guarded_supervisor" and isinstance(output, dict):
+        progress["blocked"] = bool(output.get("guardrail_blocked", False))
+        progress["next"] = output.get("next")
+    elif node == "plan_worker" and isinstance(output, dict):
+        results = output.get("step_results") or [{}]
+        progress["step"] = results[0].get("id")
+        progress["member"] = results[0].get("member")
+    elif node == "input_guardrail" and isinstance(output, dict):
+        progress["blocked"] = bool(output.get("guardrail_blocked", False))
+    elif node == "output_guardrail" and isinstance(output, dict):
+        progress["blocked"] = bool(output.get("output_guardrail_blocked", False))
+    elif isinstance(output, dict) and output.get("output_guardrail_blocked"):
+        # 에이전트가 스트리밍 중에 응답을 차단한 경우 (클라이언트는 받은 토큰을 폐기)
+        progress["blocked"] = True
+
+    return progress
+
+
+async def _stream_chat_events(graph, session_id: str, current_messages: Sequence[Any]) -> AsyncIterator[str]:
+    """
+    그래프의 비동기 이벤트 스트림을 SSE 프레임으로 변환합니다.
+
+    Args:
+        graph: 컴파일된 그래프
+        session_id: 세션 ID
+        current_messages: 그래프 입력 메시지
+
+    Yields:
+        SSE 프레임 문자열
+    """
+    # 클라이언트 연결이 끊겨도(GeneratorExit/CancelledError) 이번 턴의 메시지가 반영되도록 finally에서 커밋
+    try:
+        yield _sse("start", {"session_id": session_id})
+
+        messages = []
+        hops = 0
+
+        try:
+            async for event in graph.astream_events(
+                {
+                    "messages": current_messages,
+                    "agent_scratchpad": [],
+                    "session_id": session_id,
+                    "hops": 0,
+                    "terminal": False,
+                    "multi_step": False
+                },
+                version="v2"
+            ):
+                kind = event["event"]
+                name = event.get("name")
+                node = event.get("metadata", {}).get("langgraph_node")
+
+                # LLM 토큰 스트리밍
+                if kind == "on_chat_model_stream":
+                    content = getattr(event["data"].get("chunk"), "content", "")
+                    if content:
+                        yield _sse("token", {"node": node, "content": content})
+
+                # 도구 호출 시작/종료
+                elif kind == "on_tool_start":
+                    yield _sse("tool", {"node": node, "tool": name, "status": "start",
+                                        "input": event["data"].get("input")})
+                elif kind == "on_tool_end":
+                    output = event["data"].get("output")
+                    yield _sse("tool", {"node": node, "tool": name, "status": "end",
+                                        "output": getattr(output, "content", output)})
+
+                # 그래프 노드 완료
+                elif kind == "on_chain_end" and name in STREAM_PROGRESS_NODES and node == name:
+                    output = event["data"].get("output")
+                    if isinstance(output, dict) and "messages" in output:
+                        messages.extend(output["messages"])
+                    if isinstance(output, dict) and "hops" in output:
+                        hops = output["hops"]
+                    yield _sse("node", _node_progress(name, output))
+
+        except Exception as e:
+            yield _sse("error", {"session_id": session_id, "detail": f"채팅 처리 중 오류: {str(e)}"})
+            return
+
+        if messages:
+            final_response = getattr(messages[-1], "content", messages[-1])
+        else:
+            final_response = "대화가 완료되었습니다."
+
+        graph_metrics.record_turn(hops)
+
+        # AI 응답을 메모리에 저장 (이번 턴의 메시지는 finally에서 한 번에 반영)
+        chat_memory.add_message(session_id, AIMessage(content=final_response))
+
+        yield _sse("final", {
+            "response": final_response,
+            "session_id": session_id,
+            "timestamp": datetime.now().isoformat()
+        })
+    finally:
+        chat_memory.commit_turn(session_id)
+
+
+@router.post("/stream")
+async def chat_stream(request: MessageRequest) -> StreamingResponse:
+    """
+    채팅 메시지를 처리하고 진행 상황과 LLM 토큰을 SSE로 스트리밍합니다.
+
+    이벤트 종류:
+        start: 세션 ID
+        node: 그래프 노드 완료 (supervisor 라우팅 결정, 가드레일 차단 여부 등)
+        tool: 도구 호출 시작/종료
+        token: LLM 토큰
+        final: 세션 ID와 최종 응답
+        error: 처리 중 오류
+
+    Args:
+        request: 채팅 요청
+
+    Returns:
+        text/event-stream 응답
+    """
+    graph = await _get_graph()
+
+    # 세션 ID 생성 또는 기존 세션 사용
+    session_id = request.session_id or str(uuid.uuid4())
+
+    # 새로운 사용자 메시지 추가
+    user_message = HumanMessage(content=request.message)
+    chat_memory.add_message(session_id, user_message)
+
+    current_messages = await context_builder.build(session_id, chat_memory.get_messages(session_id))
+
+    return StreamingResponse(
+        _stream_chat_events(graph, session_id, current_messages),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
 
 
 @router.get("/history/{session_id}")
@@ -134,11 +337,18 @@ async def clear_chat_history(session_id: str) -> Dict[str, str]:
     """
     try:
         chat_memory.clear_session(session_id)
+        context_builder.clear_session(session_id)
         return {"message": f"세션 {session_id}의 히스토리가 삭제되었습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"히스토리 삭제 중 오류: {str(e)}")
 
 
+def _search_index_stats() -> Optional[Dict[str, Any]]:
+    """열려 있는 로컬 검색 인덱스의 통계 (통계 조회만으로 인덱스 파일을 만들지 않음)"""
+    index = get_local_search_index(create=False)
+    return index.get_stats() if index is not None else None
+
+
 @router.get("/stats")
 async def get_chat_stats() -> Dict[str, Any]:
     """
@@ -151,6 +361,16 @@ async def get_chat_stats() -> Dict[str, Any]:
         return {
             "active_sessions": chat_memory.get_session_count(),
             "total_messages": chat_memory.get_total_messages(),
+            "evictions": chat_memory.get_eviction_stats(),
+            "router": rule_router.get_stats(),
+            "graph": graph_metrics.get_stats(),
+            "guardrail_patterns": guardrail_system.get_pattern_stats(),
+            "guardrail_cache": guardrail_system.get_cache_stats(),
+            "http": http_client_pool.get_stats(),
+            "search": search_metrics.get_stats(),
+            "search_cache": search_cache.get_stats(),
+            "search_index": _search_index_stats(),
+            "calendar_cache": calendar_event_cache.get_stats() if calendar_event_cache is not None else None,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 class CalendarInterface(ABC):
     """
@@ -68,4 +69,69 @@ class CalendarInterface(ABC):
             True if successful, False otherwise
         """
         pass
-    
\ No newline at end of file
+
+    @abstractmethod
+    def list_events(self, start_at: str, end_at: str) -> List[Dict[str, Any]]:
+        """
+        List calendar events overlapping a time range.
+
+        Args:
+            start_at: Range start (ISO 8601 format)
+            end_at: Range end (ISO 8601 format)
+
+        Returns:
+            Events ordered by start time
+        """
+        pass
+
+    async def acreate_event(self, title: str, description: str, start_at: str, end_at: str) -> Dict[str, Any]:
+        """
+        Create a new calendar event asynchronously.
+
+        The default implementation runs create_event in a worker thread so the
+        event loop is never blocked. Providers with an async client override it.
+        """
+        return await asyncio.to_thread(self.create_event, title, description, start_at, end_at)
+
+    async def aget_events(self, event_id: str) -> Dict[str, Any]:
+        """
+        Get calendar events asynchronously.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Event details as dictionary
+        """
+        return await asyncio.to_thread(self.get_events, event_id)
+
+    async def aupdate_event(self, event_id: str, title: Optional[str] = None,
+                            description: Optional[str] = None, start_at: Optional[str] = None,
+                            end_at: Optional[str] = None, all_day: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Update an existing calendar event asynchronously.
+
+        Returns:
+            Updated event as dictionary
+        """
+        return await asyncio.to_thread(
+            self.update_event, event_id, title, description, start_at, end_at, all_day
+        )
+
+    async def adelete_event(self, event_id: str) -> bool:
+        """
+        Delete a calendar event asynchronously.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await asyncio.to_thread(self.delete_event, event_id)
+
+    async def alist_events(self, start_at: str, end_at: str) -> List[Dict[str, Any]]:
+        """
+        List calendar events overlapping a time range asynchronously.
+
+        Returns:
+            Events ordered by start time
+        """
+        return await asyncio.to_thread(self.list_events, start_at, end_at)
@@ -1,28 +1,45 @@
-import requests
-from typing import Optional, Dict, Any
+import asyncio
+import httpx
+import time
+from typing import Optional, Dict, Any, List, Tuple
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.config.settings import settings
 from app.component.calendar.CalendarInterface import CalendarInterface
+from app.component.calendar.cache.CalendarEventCache import (
+    CalendarEventCache, calendar_event_cache, event_interval, format_event_time, parse_event_time
+)
+from app.component.http.HttpClientPool import http_client_pool
+
+# 일정 목록 API가 한 번에 조회할 수 있는 최대 기간과 페이지당 최대 일정 수
+MAX_LIST_DAYS = 31
+MAX_LIST_LIMIT = 100
 
 class KakaoCalendarComponent(CalendarInterface):
     """
     Kakao Calendar Component for managing calendar events.
     Spring Boot style component that handles all Kakao Calendar API communications.
+
+    Created, updated and fetched events are kept in an event cache, and a
+    background sync periodically reconciles the cache with the list API so
+    range queries are served locally.
     """
     
-    def __init__(self, auth_token: Optional[str] = None):
+    def __init__(self, auth_token: Optional[str] = None, event_cache: Optional[CalendarEventCache] = None):
         """
         Initialize Kakao Calendar Component.
         
         Args:
             auth_token: Optional custom auth token (defaults to settings.KAKAO_KEY)
+            event_cache: Optional event cache (defaults to the shared calendar_event_cache)
         """
         self.auth_token = auth_token or f"Bearer {settings.KAKAO_KEY}"
         self.base_url = "https://kapi.kakao.com/v2/api/calendar"
         self.headers = {
             "Authorization": self.auth_token
         }
+        self.event_cache = event_cache or calendar_event_cache
+        self._syncer: Optional[asyncio.Task] = None
     
     def create_event(self, title: str, description: str, start_at: str, end_at: str) -> Dict[str, Any]:
         """
@@ -37,6 +54,22 @@ class KakaoCalendarComponent(CalendarInterface):
         Returns:
             API response as dictionary
         """
+        result = self._send(*self._create_event_request(title, description, start_at, end_at),
+                            error="Failed to create calendar event").json()
+        self._cache_created(result, title, description, start_at, end_at)
+        return result
+
+    async def acreate_event(self, title: str, description: str, start_at: str, end_at: str) -> Dict[str, Any]:
+        """
+        Create a new calendar event with the shared async client.
+        """
+        response = await self._asend(*self._create_event_request(title, description, start_at, end_at),
+                                     error="Failed to create calendar event")
+        result = response.json()
+        self._cache_created(result, title, description, start_at, end_at)
+        return result
+
+    def _create_event_request(self, title: str, description: str, start_at: str, end_at: str) -> Tuple[str, str, Dict[str, Any]]:
         url = f"{self.base_url}/create/event"
         
         # 이벤트 데이터 구성
@@ -55,17 +88,7 @@ class KakaoCalendarComponent(CalendarInterface):
             "event": json.dumps(event_data)  # JSON 문자열로 변환
         }
         
-        try:
-            response = requests.post(
-                url, 
-                headers=self.headers, 
-                data=data,  # form-data 방식
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to create calendar event: {str(e)}")
+        return "POST", url, {"data": data}  # form-data 방식
 
     def get_events(self,
                    event_id: str) -> Dict[str, Any]:
@@ -78,23 +101,33 @@ class KakaoCalendarComponent(CalendarInterface):
         Returns:
             Event details as dictionary
         """
+        cached = self._cached_event(event_id)
+        if cached is not None:
+            return cached
+        result = self._send(*self._get_event_request(event_id), error="Failed to get calendar events").json()
+        self._cache_fetched(result)
+        return result
+
+    async def aget_events(self, event_id: str) -> Dict[str, Any]:
+        """
+        Get calendar events with the shared async client.
+        """
+        cached = self._cached_event(event_id)
+        if cached is not None:
+            return cached
+        response = await self._asend(*self._get_event_request(event_id), error="Failed to get calendar events")
+        result = response.json()
+        self._cache_fetched(result)
+        return result
+
+    def _get_event_request(self, event_id: str) -> Tuple[str, str, Dict[str, Any]]:
         url = f"{self.base_url}/event"
 
         params = {
             "event_id": event_id
         }
 
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to get calendar events: {str(e)}")
+        return "GET", url, {"params": params}
     
     def update_event(self, event_id: str, title: Optional[str] = None, 
                     description: Optional[str] = None, start_at: Optional[str] = None,
@@ -113,6 +146,26 @@ class KakaoCalendarComponent(CalendarInterface):
         Returns:
             Updated event as dictionary
         """
+        request = self._update_event_request(event_id, title, description, start_at, end_at, all_day)
+        result = self._send(*request, error="Failed to update calendar event").json()
+        self._cache_updated(event_id, request)
+        return result
+
+    async def aupdate_event(self, event_id: str, title: Optional[str] = None,
+                            description: Optional[str] = None, start_at: Optional[str] = None,
+                            end_at: Optional[str] = None, all_day: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Update an existing calendar event with the shared async client.
+        """
+        request = self._update_event_request(event_id, title, description, start_at, end_at, all_day)
+        response = await self._asend(*request, error="Failed to update calendar event")
+        result = response.json()
+        self._cache_updated(event_id, request)
+        return result
+
+    def _update_event_request(self, event_id: str, title: Optional[str] = None,
+                              description: Optional[str] = None, start_at: Optional[str] = None,
+                              end_at: Optional[str] = None, all_day: Optional[bool] = None) -> Tuple[str, str, Dict[str, Any]]:
         url = f"{self.base_url}/update/event/host"
         
         payload = {
@@ -134,17 +187,7 @@ class KakaoCalendarComponent(CalendarInterface):
             "event": json.dumps(payload)
         }
 
-        try:
-            response = requests.post(
-                url, 
-                headers=self.headers, 
-                data=data,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to update calendar event: {str(e)}")
+        return "POST", url, {"data": data}
     
     def delete_event(self, event_id: str) -> bool:
         """
@@ -156,22 +199,246 @@ class KakaoCalendarComponent(CalendarInterface):
         Returns:
             True if successful, False otherwise
         """
+        self._send(*self._delete_event_request(event_id), error="Failed to delete calendar event")
+        if self.event_cache is not None:
+            self.event_cache.remove(event_id)
+        return True
+
+    async def adelete_event(self, event_id: str) -> bool:
+        """
+        Delete a calendar event with the shared async client.
+        """
+        await self._asend(*self._delete_event_request(event_id), error="Failed to delete calendar event")
+        if self.event_cache is not None:
+            self.event_cache.remove(event_id)
+        return True
+
+    def _delete_event_request(self, event_id: str) -> Tuple[str, str, Dict[str, Any]]:
         url = f"{self.base_url}/delete/event"
         
         params = {
             "event_id": event_id
         }
         
+        return "DELETE", url, {"params": params}  # query parameter 방식
+
+    def list_events(self, start_at: str, end_at: str) -> List[Dict[str, Any]]:
+        """
+        List calendar events overlapping a time range.
+
+        Served from the event cache while the whole range is covered by a fresh
+        sync; otherwise the range is listed from the API and stored in the cache.
+
+        Args:
+            start_at: Range start (ISO 8601 format)
+            end_at: Range end (ISO 8601 format)
+
+        Returns:
+            Events ordered by start time
+        """
+        start, end = parse_event_time(start_at), parse_event_time(end_at)
+        if self.event_cache is not None and self.event_cache.is_synced(start, end):
+            return self.event_cache.range(start, end)
+        return self._fetch_range(start, end)[0]
+
+    async def alist_events(self, start_at: str, end_at: str) -> List[Dict[str, Any]]:
+        """
+        List calendar events overlapping a time range with the shared async client.
+        """
+        start, end = parse_event_time(start_at), parse_event_time(end_at)
+        if self.event_cache is not None and self.event_cache.is_synced(start, end):
+            return self.event_cache.range(start, end)
+        return (await self._afetch_range(start, end))[0]
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Reconcile the event cache with the list API over the sync window
+        (CALENDAR_SYNC_PAST_DAYS before today to CALENDAR_SYNC_FUTURE_DAYS after).
+
+        Only differences are applied to the cache: new and changed events are
+        stored and events missing from the listing are removed.
+
+        Returns:
+            Counts of added, updated, unchanged and removed events
+        """
+        return self._fetch_range(*self._sync_window())[1]
+
+    async def async_sync(self) -> Dict[str, int]:
+        """
+        Reconcile the event cache with the list API asynchronously.
+
+        Returns:
+            Counts of added, updated, unchanged and removed events
+        """
+        return (await self._afetch_range(*self._sync_window()))[1]
+
+    def start_sync(self, interval: float) -> None:
+        """Periodically sync the event cache in the background."""
+        if self.event_cache is None or interval <= 0:
+            return
+        if self._syncer is None or self._syncer.done():
+            self._syncer = asyncio.create_task(self._sync_forever(interval))
+
+    async def stop_sync(self) -> None:
+        """Stop the background sync."""
+        if self._syncer is not None:
+            self._syncer.cancel()
+            try:
+                await self._syncer
+            except asyncio.CancelledError:
+                pass
+            self._syncer = None
+
+    async def _sync_forever(self, interval: float) -> None:
+        while True:
+            try:
+                counts = await self.async_sync()
+                if any(counts.get(key) for key in ("added", "updated", "removed")):
+                    print(f"Kakao calendar sync: {counts}")
+            except Exception as e:
+                print(f"Kakao calendar sync failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def _fetch_range(self, start: datetime, end: datetime) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """List a range from the API chunk by chunk and reconcile each chunk into the cache."""
+        events, counts = [], {}
+        for chunk_start, chunk_end in self._list_chunks(start, end):
+            listed_at = time.time()
+            chunk = []
+            request = self._list_events_request(chunk_start, chunk_end)
+            while request is not None:
+                page = self._send(*request, error="Failed to list calendar events").json()
+                chunk.extend(page.get("events", []))
+                request = self._next_page_request(page)
+            self._cache_listed(chunk_start, chunk_end, chunk, listed_at, counts)
+            events.extend(chunk)
+        return self._in_range(events, start, end), counts
+
+    async def _afetch_range(self, start: datetime, end: datetime) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        events, counts = [], {}
+        for chunk_start, chunk_end in self._list_chunks(start, end):
+            listed_at = time.time()
+            chunk = []
+            request = self._list_events_request(chunk_start, chunk_end)
+            while request is not None:
+                response = await self._asend(*request, error="Failed to list calendar events")
+                page = response.json()
+                chunk.extend(page.get("events", []))
+                request = self._next_page_request(page)
+            self._cache_listed(chunk_start, chunk_end, chunk, listed_at, counts)
+            events.extend(chunk)
+        return self._in_range(events, start, end), counts
+
+    def _list_events_request(self, start: datetime, end: datetime) -> Tuple[str, str, Dict[str, Any]]:
+        url = f"{self.base_url}/events"
+
+        params = {
+            "from": format_event_time(start),
+            "to": format_event_time(end),
+            "limit": MAX_LIST_LIMIT
+        }
+
+        return "GET", url, {"params": params}
+
+    @staticmethod
+    def _next_page_request(page: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        # 다음 페이지는 응답의 next URL에 조회 조건이 모두 포함됨
+        if page.get("has_next") and page.get("next"):
+            return "GET", page["next"], {}
+        return None
+
+    @staticmethod
+    def _list_chunks(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """Split a range into chunks the list API accepts."""
+        chunks = []
+        while start < end:
+            chunk_end = min(end, start + timedelta(days=MAX_LIST_DAYS))
+            chunks.append((start, chunk_end))
+            start = chunk_end
+        return chunks
+
+    @staticmethod
+    def _in_range(events: List[Dict[str, Any]], start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """Drop duplicates across chunks and events outside the range, ordered by start time."""
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        unique = {}
+        for event in events:
+            interval = event_interval(event)
+            if interval is None or interval[0] >= end_ts:
+                continue
+            if interval[1] > start_ts or interval[0] == interval[1] == start_ts:
+                unique[event.get("id")] = (interval[0], event)
+        return [event for _, event in sorted(unique.values(), key=lambda pair: pair[0])]
+
+    @staticmethod
+    def _sync_window() -> Tuple[datetime, datetime]:
+        today = datetime.now().astimezone().replace(hour=0, minute=0, second=0, microsecond=0)
+        return (
+            today - timedelta(days=settings.CALENDAR_SYNC_PAST_DAYS),
+            today + timedelta(days=settings.CALENDAR_SYNC_FUTURE_DAYS + 1)
+        )
+
+    def _cached_event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        if self.event_cache is None:
+            return None
+        event = self.event_cache.get(event_id)
+        return {"event": event} if event is not None else None
+
+    def _cache_created(self, result: Dict[str, Any], title: str, description: str, start_at: str, end_at: str):
+        # 생성 API는 이벤트 ID만 반환하므로 요청 내용으로 일정을 구성
+        if self.event_cache is not None and result.get("event_id"):
+            self.event_cache.put({
+                "id": result["event_id"],
+                "title": title,
+                "description": description,
+                "time": {"start_at": start_at, "end_at": end_at, "all_day": False}
+            })
+
+    def _cache_fetched(self, result: Dict[str, Any]):
+        if self.event_cache is not None and result.get("event"):
+            self.event_cache.put(result["event"])
+
+    def _cache_updated(self, event_id: str, request: Tuple[str, str, Dict[str, Any]]):
+        if self.event_cache is not None:
+            self.event_cache.update(event_id, json.loads(request[2]["data"]["event"]))
+
+    def _cache_listed(self, start: datetime, end: datetime, events: List[Dict[str, Any]],
+                      listed_at: float, counts: Dict[str, int]):
+        if self.event_cache is None:
+            return
+        for key, value in self.event_cache.reconcile(start, end, events, listed_at).items():
+            counts[key] = counts.get(key, 0) + value
+
+    def _send(self, method: str, url: str, request_args: Dict[str, Any], error: str) -> httpx.Response:
+        """
+        Send a request through the shared keep-alive client.
+
+        Raises:
+            Exception: On connection errors, timeouts or non-2xx responses
+        """
         try:
-            response = requests.delete(
-                url, 
-                headers=self.headers,
-                params=params,  # query parameter 방식
-                timeout=30
-            )
+            response = http_client_pool.request(method, url, headers=self.headers, **request_args)
             response.raise_for_status()
-            return True
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to delete calendar event: {str(e)}")
+            return response
+        except httpx.HTTPError as e:
+            raise Exception(f"{error}: {str(e)}")
+
+    async def _asend(self, method: str, url: str, request_args: Dict[str, Any], error: str) -> httpx.Response:
+        """
+        Send a request through the shared async keep-alive client.
+
+        Raises:
+            Exception: On connection errors, timeouts or non-2xx responses
+        """
+        try:
+            response = await http_client_pool.arequest(method, url, headers=self.headers, **request_args)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            raise Exception(f"{error}: {str(e)}")
+    
     
-    
\ No newline at end of file
+
+
+# 전역 카카오 캘린더 컴포넌트 인스턴스 (일정 캐시 동기화 공유)
+kakao_calendar_component = KakaoCalendarComponent()
@@ -0,0 +1,284 @@
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config.settings import settings
+
+
+def parse_event_time(value: str) -> datetime:
+    """
+    Parse an ISO 8601 time into an aware datetime.
+
+    "Z" suffixes are accepted, and naive times are read as local time.
+    """
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed
+
+
+def format_event_time(value: datetime) -> str:
+    """Format a datetime as the UTC RFC 3339 string the calendar APIs expect."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class CachedEvent:
+    """A cached event with its interval as UTC timestamps."""
+    event_id: str
+    start: float
+    end: float
+    event: Dict[str, Any]
+    cached_at: float
+
+
+class CalendarEventCache:
+    """
+    In-memory calendar event cache indexed by event ID and by time interval.
+
+    Events are kept in a dict by ID and in a list sorted by start time. A range
+    query bisects the start list: every event overlapping [start, end) starts
+    before end and no earlier than start minus the longest cached duration.
+
+    The cache also remembers which time ranges were fully listed from the
+    provider (synced) and when, so range reads can be served locally only while
+    the whole range is covered by a fresh listing.
+    """
+
+    def __init__(self, max_age: float = 600.0):
+        """
+        Args:
+            max_age: Seconds a cached event or synced range stays fresh
+        """
+        self.max_age = max_age
+        self._events: Dict[str, CachedEvent] = {}
+        self._starts: List[Tuple[float, str]] = []
+        self._max_duration = 0.0
+        # (start, end, synced_at) ranges listed from the provider
+        self._synced: List[Tuple[float, float, float]] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, event: Dict[str, Any], cached_at: Optional[float] = None) -> Optional[CachedEvent]:
+        """
+        Add or replace an event.
+
+        Args:
+            event: Provider event with "id" and "time": {"start_at", "end_at"}
+            cached_at: Time the event was read (defaults to now)
+
+        Returns:
+            The cached entry, or None if the event has no ID or valid time
+        """
+        interval = event_interval(event)
+        if not event.get("id") or interval is None:
+            return None
+        entry = CachedEvent(
+            event_id=str(event["id"]),
+            start=interval[0],
+            end=interval[1],
+            event=event,
+            cached_at=time.time() if cached_at is None else cached_at,
+        )
+        with self._lock:
+            self._remove(entry.event_id)
+            self._events[entry.event_id] = entry
+            bisect.insort(self._starts, (entry.start, entry.event_id))
+            self._max_duration = max(self._max_duration, entry.end - entry.start)
+        return entry
+
+    def get(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh cached event by ID.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            The event, or None if it is not cached or is older than max_age
+        """
+        with self._lock:
+            entry = self._events.get(event_id)
+            if entry is None or time.time() - entry.cached_at > self.max_age:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.event
+
+    def update(self, event_id: str, changes: Dict[str, Any]) -> Optional[CachedEvent]:
+        """
+        Merge changed fields into a cached event.
+
+        Args:
+            event_id: Event ID
+            changes: Changed top-level fields; "time" is merged key by key
+
+        Returns:
+            The updated entry, or None if the event was not cached
+        """
+        with self._lock:
+            entry = self._events.get(event_id)
+        if entry is None:
+            return None
+        event = {**entry.event, **{key: value for key, value in changes.items() if key != "time"}}
+        if changes.get("time"):
+            event["time"] = {**entry.event.get("time", {}), **changes["time"]}
+        return self.put(event)
+
+    def remove(self, event_id: str) -> bool:
+        """Remove an event. Returns True if it was cached."""
+        with self._lock:
+            return self._remove(event_id)
+
+    def range(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Return cached events overlapping [start, end), ordered by start time.
+
+        Args:
+            start: Range start
+            end: Range end
+
+        Returns:
+            Events overlapping the range
+        """
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        with self._lock:
+            low = bisect.bisect_left(self._starts, (start_ts - self._max_duration,))
+            high = bisect.bisect_left(self._starts, (end_ts,))
+            entries = [self._events[event_id] for _, event_id in self._starts[low:high]]
+        return [
+            entry.event for entry in entries
+            # 끝 시간이 범위 시작과 같은 일정은 제외 (종일 일정이 다음 날에 걸리지 않도록)
+            if entry.end > start_ts or entry.start == entry.end == start_ts
+        ]
+
+    def is_synced(self, start: datetime, end: datetime) -> bool:
+        """
+        Return True if [start, end) is fully covered by fresh provider listings.
+        Counted as a cache hit or miss.
+        """
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        oldest = time.time() - self.max_age
+        with self._lock:
+            covered = start_ts
+            for low, high in sorted((low, high) for low, high, synced_at in self._synced if synced_at >= oldest):
+                if low > covered:
+                    break
+                covered = max(covered, high)
+            synced = covered >= end_ts
+            if synced:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return synced
+
+    def reconcile(
+        self,
+        start: datetime,
+        end: datetime,
+        events: Iterable[Dict[str, Any]],
+        listed_at: float
+    ) -> Dict[str, int]:
+        """
+        Apply a full provider listing of [start, end) to the cache.
+
+        Listed events are added or replaced, and cached events overlapping the
+        range that the listing no longer contains are removed. Events cached
+        after the listing was requested are kept, since they may have been
+        created while it was in flight.
+
+        Args:
+            start: Listed range start
+            end: Listed range end
+            events: Every event the provider returned for the range
+            listed_at: Time the listing was requested
+
+        Returns:
+            Counts of added, updated, unchanged and removed events
+        """
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        listed = set()
+        for event in events:
+            event_id = str(event.get("id", ""))
+            with self._lock:
+                previous = self._events.get(event_id)
+            if previous is not None and previous.cached_at > listed_at:
+                listed.add(event_id)
+                continue
+            if self.put(event, cached_at=listed_at) is None:
+                continue
+            listed.add(event_id)
+            if previous is None:
+                counts["added"] += 1
+            elif previous.event != event:
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        with self._lock:
+            for event_id in [
+                entry.event_id for entry in self._events.values()
+                if entry.event_id not in listed and entry.cached_at <= listed_at
+                and entry.start < end_ts and entry.end > start_ts
+            ]:
+                self._remove(event_id)
+                counts["removed"] += 1
+
+            oldest = time.time() - self.max_age
+            self._synced = [synced for synced in self._synced if synced[2] >= oldest]
+            self._synced.append((start_ts, end_ts, listed_at))
+        return counts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._starts.clear()
+            self._synced.clear()
+            self._max_duration = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "events": len(self._events),
+                "synced_ranges": len(self._synced),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _remove(self, event_id: str) -> bool:
+        entry = self._events.pop(event_id, None)
+        if entry is None:
+            return False
+        index = bisect.bisect_left(self._starts, (entry.start, event_id))
+        if index < len(self._starts) and self._starts[index] == (entry.start, event_id):
+            del self._starts[index]
+        return True
+
+
+def event_interval(event: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """Return an event's (start, end) as UTC timestamps, or None if its time is missing or invalid."""
+    event_time = event.get("time") or {}
+    try:
+        start = parse_event_time(event_time["start_at"]).timestamp()
+        end = parse_event_time(event_time.get("end_at") or event_time["start_at"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return None
+    return start, max(start, end)
+
+
+def create_calendar_event_cache() -> Optional[CalendarEventCache]:
+    """Create the event cache if it is enabled in settings."""
+    if not settings.CALENDAR_CACHE_ENABLED:
+        return None
+    return CalendarEventCache(max_age=settings.CALENDAR_CACHE_MAX_AGE)
+
+
+# 전역 캘린더 일정 캐시 인스턴스 (사용하지 않으면 None)
+calendar_event_cache = create_calendar_event_cache()
@@ -0,0 +1,353 @@
+"""
+공유 HTTP 클라이언트 풀
+
+외부 API(네이버, 카카오, OpenAI) 호출이 연결을 재사용하도록 프로세스 전체에서
+하나의 동기/비동기 httpx 클라이언트를 공유합니다.
+
+- 연결 풀과 keep-alive (h2 패키지가 설치되어 있으면 HTTP/2)
+- 호스트별 동시 요청 수 제한
+- 연결/읽기 타임아웃
+- 호스트별 요청 통계와 연결 풀 상태
+"""
+
+import asyncio
+import importlib.util
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from app.config.settings import settings
+
+
+def _http2_available() -> bool:
+    """HTTP/2에 필요한 h2 패키지가 설치되어 있는지 확인합니다."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HostStats:
+    """호스트별 요청 통계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.waiting = 0
+        self.total_seconds = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        completed = self.requests - self.in_flight
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "avg_ms": round(self.total_seconds / completed * 1000, 1) if completed > 0 else 0.0,
+        }
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """응답 본문을 닫을 때 호스트 슬롯을 반환하는 스트림"""
+
+    def __init__(self, stream: httpx.SyncByteStream, release):
+        self.stream = stream
+        self.release = release
+
+    def __iter__(self):
+        yield from self.stream
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            self.release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """응답 본문을 닫을 때 호스트 슬롯을 반환하는 비동기 스트림"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self.stream = stream
+        self.release = release
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            self.release()
+
+
+class _HostLimitedTransport(httpx.BaseTransport):
+    """
+    호스트별 동시 요청 수를 제한하고 통계를 기록하는 동기 전송 계층
+    슬롯은 응답 본문을 다 읽거나 닫을 때 반환되므로 스트리밍 응답도 제한에 포함됩니다.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, pool: "HttpClientPool"):
+        self.transport = transport
+        self.pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        limiter = self.pool._sync_limiter(host)
+        self.pool._request_started(host)
+        limiter.acquire()
+        release = self.pool._request_acquired(host, limiter.release)
+        try:
+            response = self.transport.handle_request(request)
+        except Exception:
+            release(error=True)
+            raise
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class _AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """호스트별 동시 요청 수를 제한하고 통계를 기록하는 비동기 전송 계층"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, pool: "HttpClientPool"):
+        self.transport = transport
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        limiter = self.pool._async_limiter(host)
+        self.pool._request_started(host)
+        try:
+            await limiter.acquire()
+        except BaseException:
+            # 슬롯을 기다리는 중에 취소된 요청
+            self.pool._request_abandoned(host)
+            raise
+        release = self.pool._request_acquired(host, limiter.release)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            release(error=True)
+            raise
+        response.stream = _AsyncReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HttpClientPool:
+    """프로세스 전체에서 공유하는 동기/비동기 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        per_host_limit: int = 50,
+        host_limits: Optional[Dict[str, int]] = None,
+        http2: bool = True
+    ):
+        """
+        Args:
+            max_connections: 클라이언트당 최대 연결 수
+            max_keepalive_connections: 유지할 최대 유휴 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기/쓰기/풀 대기 타임아웃 (초)
+            per_host_limit: 호스트별 최대 동시 요청 수
+            host_limits: 호스트별 최대 동시 요청 수 재정의
+            http2: h2 패키지가 있으면 HTTP/2 사용
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.per_host_limit = per_host_limit
+        self.host_limits = dict(host_limits or {})
+        self.http2 = http2 and _http2_available()
+
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._client_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._sync_limiters: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_limiters: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, HostStats] = {}
+
+    @property
+    def client(self) -> httpx.Client:
+        """공유 동기 클라이언트"""
+        if self._client is None or self._client.is_closed:
+            with self._client_lock:
+                if self._client is None or self._client.is_closed:
+                    transport = httpx.HTTPTransport(limits=self.limits, http2=self.http2)
+                    self._client = httpx.Client(
+                        transport=_HostLimitedTransport(transport, self),
+                        timeout=self.timeout
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """공유 비동기 클라이언트"""
+        if self._async_client is None or self._async_client.is_closed:
+            with self._client_lock:
+                if self._async_client is None or self._async_client.is_closed:
+                    transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+                    self._async_client = httpx.AsyncClient(
+                        transport=_AsyncHostLimitedTransport(transport, self),
+                        timeout=self.timeout
+                    )
+                    self._async_limiters = {}
+        return self._async_client
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        공유 동기 클라이언트로 요청을 보냅니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: httpx 요청 옵션 (params, data, headers, timeout 등)
+
+        Returns:
+            httpx.Response
+        """
+        return self.client.request(method, url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        공유 비동기 클라이언트로 요청을 보냅니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: httpx 요청 옵션 (params, data, headers, timeout 등)
+
+        Returns:
+            httpx.Response
+        """
+        return await self.async_client.request(method, url, **kwargs)
+
+    async def warm_up(self, *urls: str) -> None:
+        """
+        각 호스트에 미리 연결하여 첫 요청의 TCP/TLS 연결 지연을 없앱니다.
+        응답 상태 코드는 확인하지 않습니다.
+        """
+        await asyncio.gather(*(self.async_client.head(url) for url in urls))
+
+    async def aclose(self) -> None:
+        """두 클라이언트의 연결을 모두 닫습니다."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        if self._client is not None:
+            self._client.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 풀 설정과 상태, 호스트별 요청 통계를 반환합니다."""
+        with self._stats_lock:
+            hosts = {host: stats.get_stats() for host, stats in self._stats.items()}
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "per_host_limit": self.per_host_limit,
+            "connections": {
+                "sync": self._connection_stats(self._client),
+                "async": self._connection_stats(self._async_client),
+            },
+            "hosts": hosts,
+        }
+
+    def _limit_for(self, host: str) -> int:
+        return self.host_limits.get(host, self.per_host_limit)
+
+    def _host_stats(self, host: str) -> HostStats:
+        stats = self._stats.get(host)
+        if stats is None:
+            with self._stats_lock:
+                stats = self._stats.setdefault(host, HostStats())
+        return stats
+
+    def _request_started(self, host: str) -> None:
+        """호스트 슬롯을 기다리기 시작한 요청을 기록합니다."""
+        stats = self._host_stats(host)
+        with self._stats_lock:
+            stats.waiting += 1
+
+    def _request_abandoned(self, host: str) -> None:
+        """슬롯을 얻기 전에 취소된 요청을 기록합니다."""
+        stats = self._host_stats(host)
+        with self._stats_lock:
+            stats.waiting -= 1
+            stats.errors += 1
+
+    def _request_acquired(self, host: str, release_slot: Callable[[], None]) -> Callable[..., None]:
+        """슬롯을 얻은 요청을 기록하고, 한 번만 실행되는 슬롯 반환 함수를 반환합니다."""
+        stats = self._host_stats(host)
+        with self._stats_lock:
+            stats.waiting -= 1
+            stats.requests += 1
+            stats.in_flight += 1
+        started = time.perf_counter()
+        released = False
+
+        def release(error: bool = False) -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            with self._stats_lock:
+                stats.in_flight -= 1
+                stats.errors += int(error)
+                stats.total_seconds += time.perf_counter() - started
+            release_slot()
+        return release
+
+    def _sync_limiter(self, host: str) -> threading.BoundedSemaphore:
+        limiter = self._sync_limiters.get(host)
+        if limiter is None:
+            with self._stats_lock:
+                limiter = self._sync_limiters.setdefault(host, threading.BoundedSemaphore(self._limit_for(host)))
+        return limiter
+
+    def _async_limiter(self, host: str) -> asyncio.Semaphore:
+        limiter = self._async_limiters.get(host)
+        if limiter is None:
+            limiter = self._async_limiters.setdefault(host, asyncio.Semaphore(self._limit_for(host)))
+        return limiter
+
+    @staticmethod
+    def _connection_stats(client) -> Dict[str, int]:
+        """httpcore 연결 풀의 전체/유휴 연결 수"""
+        if client is None or client.is_closed:
+            return {"total": 0, "idle": 0}
+        transport = getattr(client, "_transport", None)
+        pool = getattr(getattr(transport, "transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        return {
+            "total": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+        }
+
+
+# 전역 HTTP 클라이언트 풀
+http_client_pool = HttpClientPool(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+    read_timeout=settings.HTTP_READ_TIMEOUT,
+    per_host_limit=settings.HTTP_PER_HOST_LIMIT,
+    host_limits=settings.HTTP_HOST_LIMITS,
+    http2=settings.HTTP2_ENABLED
+)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 
@@ -31,4 +32,25 @@ class MailInterface(ABC):
         Returns:
             True if connection is successful, False otherwise
         """
-        pass 
\ No newline at end of file
+        pass
+
+    async def asend_email(self, to: List[str], subject: str, body: str) -> Dict[str, Any]:
+        """
+        Send an email asynchronously.
+
+        The default implementation runs send_email in a worker thread so the
+        event loop is never blocked. Providers with an async client override it.
+
+        Returns:
+            API response as dictionary
+        """
+        return await asyncio.to_thread(self.send_email, to, subject, body)
+
+    async def atest_connection(self) -> bool:
+        """
+        Test the connection to mail service asynchronously.
+
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        return await asyncio.to_thread(self.test_connection)
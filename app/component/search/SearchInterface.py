@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -20,4 +21,20 @@ class SearchInterface(ABC):
         Returns:
             검색 결과 문자열
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def asearch(self, query: str, **kwargs: Any) -> str:
+        """
+        검색을 비동기로 수행합니다.
+
+        기본 구현은 동기 search를 스레드 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+        비동기 클라이언트를 가진 구현체는 이 메서드를 재정의합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        return await asyncio.to_thread(self.search, query, **kwargs)
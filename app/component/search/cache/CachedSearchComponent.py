@@ -0,0 +1,179 @@
+import asyncio
+import json
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+
+from app.component.search.SearchInterface import SearchInterface
+from app.component.search.cache.SearchCacheInterface import CachedSearchResult, SearchCacheInterface
+from app.component.search.metrics import search_metrics
+
+# 캐시 키에 포함하는 검색 옵션 (값이 없으면 검색 컴포넌트의 기본값 사용)
+KEY_OPTIONS = ("type", "sort", "display", "start")
+
+
+def normalize_query(query: str) -> str:
+    """대소문자, 유니코드 형태와 공백 차이를 없앤 검색어를 반환합니다."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", query)).strip().lower()
+
+
+class CachedSearchComponent(SearchInterface):
+    """
+    검색 결과를 캐시하는 SearchInterface 래퍼.
+
+    - ttl 이내의 결과는 검색 API를 호출하지 않고 반환합니다.
+    - ttl이 지났지만 stale_ttl 이내인 결과는 즉시 반환하고 백그라운드에서 갱신합니다.
+    - 같은 검색이 동시에 들어오면 API는 한 번만 호출하고 결과를 공유합니다. (비동기 검색)
+    """
+
+    def __init__(
+        self,
+        search_component: SearchInterface,
+        cache: SearchCacheInterface,
+        ttl: float = 600.0,
+        stale_ttl: float = 3600.0
+    ):
+        """
+        Args:
+            search_component: 실제 검색을 수행할 컴포넌트
+            cache: 검색 결과 저장소
+            ttl: 결과를 그대로 사용할 시간 (초)
+            stale_ttl: ttl 이후 갱신하는 동안 이전 결과를 사용할 시간 (초)
+        """
+        self.search_component = search_component
+        self.cache = cache
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refreshing: Set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+
+    def search(self, query: str, **kwargs: Any) -> str:
+        """
+        캐시된 결과가 있으면 반환하고, 없으면 검색 후 저장합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        key = self.cache_key(query, **kwargs)
+        entry = self.cache.get(key)
+        state = self._state(entry)
+        search_metrics.record_cache_lookup(state)
+
+        if state == "stale":
+            self._refresh_in_background(key, query, kwargs)
+        if state in ("fresh", "stale"):
+            return entry.value
+        return self._fetch(key, query, kwargs)
+
+    async def asearch(self, query: str, **kwargs: Any) -> str:
+        """
+        캐시된 결과가 있으면 반환하고, 없으면 비동기로 검색 후 저장합니다.
+        같은 키의 검색이 진행 중이면 그 결과를 기다립니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        key = self.cache_key(query, **kwargs)
+        entry = self.cache.get(key)
+        state = self._state(entry)
+
+        if state == "miss" and key in self._inflight:
+            state = "coalesced"
+        search_metrics.record_cache_lookup(state)
+
+        if state == "stale":
+            if key not in self._inflight:
+                self._fetch_task(key, query, kwargs, refresh=True).add_done_callback(self._log_refresh_error)
+            return entry.value
+        if state == "fresh":
+            return entry.value
+        # 기다리던 호출이 취소되어도 다른 대기자를 위해 검색은 계속 진행
+        return await asyncio.shield(self._fetch_task(key, query, kwargs))
+
+    def cache_key(self, query: str, **kwargs: Any) -> str:
+        """정규화된 검색어와 검색 옵션으로 캐시 키를 만듭니다."""
+        options = {
+            name: kwargs.get(name, getattr(self.search_component, name, None))
+            for name in KEY_OPTIONS
+        }
+        extra = sorted((name, value) for name, value in kwargs.items() if name not in KEY_OPTIONS)
+        return json.dumps(
+            [type(self.search_component).__name__, normalize_query(query), options, extra],
+            ensure_ascii=False,
+            default=str
+        )
+
+    def _state(self, entry: Optional[CachedSearchResult]) -> str:
+        if entry is None:
+            return "miss"
+        age = time.time() - entry.stored_at
+        if age < self.ttl:
+            return "fresh"
+        if age < self.ttl + self.stale_ttl:
+            return "stale"
+        return "miss"
+
+    def _fetch(self, key: str, query: str, kwargs: Dict[str, Any], refresh: bool = False) -> str:
+        try:
+            value = self.search_component.search(query, **kwargs)
+        except Exception:
+            search_metrics.record_upstream_call(refresh=refresh, error=True)
+            raise
+        search_metrics.record_upstream_call(refresh=refresh)
+        self.cache.set(key, value, time.time())
+        return value
+
+    async def _afetch(self, key: str, query: str, kwargs: Dict[str, Any], refresh: bool) -> str:
+        try:
+            value = await self.search_component.asearch(query, **kwargs)
+        except Exception:
+            search_metrics.record_upstream_call(refresh=refresh, error=True)
+            raise
+        search_metrics.record_upstream_call(refresh=refresh)
+        self.cache.set(key, value, time.time())
+        return value
+
+    def _fetch_task(self, key: str, query: str, kwargs: Dict[str, Any], refresh: bool = False) -> asyncio.Task:
+        """키별로 하나의 검색 작업만 실행되도록 진행 중인 작업을 재사용합니다."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._afetch(key, query, kwargs, refresh))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    def _refresh_in_background(self, key: str, query: str, kwargs: Dict[str, Any]):
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch(key, query, kwargs, refresh=True)
+            except Exception as e:
+                print(f"Search cache refresh failed: {str(e)}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Search cache refresh failed: {str(task.exception())}")
@@ -0,0 +1,66 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.component.search.cache.SearchCacheInterface import CachedSearchResult, SearchCacheInterface
+from app.component.search.cache.SqliteSearchCache import SqliteSearchCache
+from app.config.settings import settings
+
+
+class MemorySearchCache(SearchCacheInterface):
+    """
+    프로세스 메모리 기반의 LRU 검색 결과 캐시.
+    최대 항목 수를 넘으면 가장 오래 사용되지 않은 결과부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Args:
+            max_entries: 최대 저장 결과 수
+        """
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, CachedSearchResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedSearchResult]:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: str, stored_at: float):
+        with self._lock:
+            self.entries[key] = CachedSearchResult(value=value, stored_at=stored_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            expired = [key for key, entry in self.entries.items() if entry.stored_at < older_than]
+            for key in expired:
+                del self.entries[key]
+            return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": "memory", "entries": len(self.entries), "max_entries": self.max_entries}
+
+
+def create_search_cache() -> SearchCacheInterface:
+    """설정된 백엔드(memory, sqlite)에 맞는 검색 결과 캐시를 생성합니다."""
+    backend = settings.SEARCH_CACHE_BACKEND
+
+    if backend == "sqlite":
+        return SqliteSearchCache(
+            path=settings.SEARCH_CACHE_SQLITE_PATH,
+            max_entries=settings.SEARCH_CACHE_MAX_ENTRIES
+        )
+    if backend == "memory":
+        return MemorySearchCache(max_entries=settings.SEARCH_CACHE_MAX_ENTRIES)
+    raise ValueError(f"Unknown search cache backend: {backend}")
+
+
+# 전역 검색 결과 캐시 인스턴스
+search_cache = create_search_cache()
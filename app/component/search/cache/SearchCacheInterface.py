@@ -0,0 +1,99 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CachedSearchResult:
+    """캐시된 검색 결과"""
+    value: str
+    stored_at: float
+
+
+class SearchCacheInterface(ABC):
+    """
+    검색 결과 캐시 저장소 인터페이스.
+    메모리, SQLite 등 다양한 저장소를 지원하기 위한 공통 인터페이스입니다.
+    만료 판단은 저장 시각을 기준으로 CachedSearchComponent가 수행합니다.
+    """
+
+    # 백그라운드 정리 작업 (start_sweeper로 시작)
+    _sweeper: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedSearchResult]:
+        """
+        캐시된 검색 결과를 반환합니다.
+
+        Args:
+            key: 정규화된 검색 키
+
+        Returns:
+            캐시된 결과 (없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, stored_at: float):
+        """
+        검색 결과를 저장합니다.
+
+        Args:
+            key: 정규화된 검색 키
+            value: 검색 결과
+            stored_at: 저장 시각 (time.time())
+        """
+        pass
+
+    @abstractmethod
+    def purge(self, older_than: float) -> int:
+        """
+        저장 시각이 older_than보다 오래된 결과를 삭제합니다.
+
+        Returns:
+            삭제된 결과 수
+        """
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 정보(항목 수, 백엔드)를 반환합니다."""
+        pass
+
+    def start_sweeper(self, interval: float, max_age: float) -> None:
+        """
+        백그라운드에서 주기적으로 purge를 실행합니다.
+
+        Args:
+            interval: 실행 간격 (초)
+            max_age: 이 시간(초)보다 오래전에 저장된 결과를 삭제
+        """
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever(interval, max_age))
+
+    async def stop_sweeper(self) -> None:
+        """백그라운드 정리 작업을 중지합니다."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_forever(self, interval: float, max_age: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await asyncio.to_thread(self.purge, time.time() - max_age)
+            except Exception as e:
+                print(f"Search cache sweeper failed: {str(e)}")
+                continue
+            if removed:
+                print(f"Search cache sweeper purged {removed} entries")
+
+    def close(self) -> None:
+        """저장소를 닫습니다. 닫을 자원이 없는 저장소는 아무것도 하지 않습니다."""
+        pass
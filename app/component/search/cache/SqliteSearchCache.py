@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+from app.component.search.cache.SearchCacheInterface import CachedSearchResult, SearchCacheInterface
+
+
+class SqliteSearchCache(SearchCacheInterface):
+    """
+    SQLite(WAL) 기반의 영속 검색 결과 캐시.
+
+    재시작 후에도 캐시가 유지되고, 같은 호스트의 여러 워커 프로세스가 하나의 파일을
+    공유하므로 한 워커가 가져온 결과를 다른 워커도 사용합니다.
+    """
+
+    # 이 횟수만큼 저장할 때마다 최대 항목 수를 넘는 오래된 결과를 정리
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int = 10000, busy_timeout_ms: int = 5000):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+            max_entries: 최대 저장 결과 수
+            busy_timeout_ms: 다른 워커가 쓰기 잠금을 가진 경우 대기 시간
+        """
+        self.path = path
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_search_cache_stored_at ON search_cache (stored_at);
+            """
+        )
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, key: str) -> Optional[CachedSearchResult]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedSearchResult(value=row[0], stored_at=row[1])
+
+    def set(self, key: str, value: str, stored_at: float):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, value, stored_at),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM search_cache WHERE key IN "
+                    "(SELECT key FROM search_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM search_cache WHERE stored_at < ?", (older_than,)
+            ).rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        return {"backend": "sqlite", "path": self.path, "entries": entries, "max_entries": self.max_entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
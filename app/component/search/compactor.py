@@ -0,0 +1,170 @@
+"""
+검색 결과 압축
+
+검색 API 결과를 LLM에 전달하기 전에 강조 태그와 HTML 엔티티를 제거하고,
+제목/날짜/링크를 짧은 구조로 유지하면서 겹치는 문장을 없애고 토큰 예산에 맞춥니다.
+"""
+
+import html
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from app.component.search.metrics import search_metrics
+from app.domain.graph.context import TokenCounter
+
+EMPTY_RESULT = "No good Naver Search Result was found"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+|\s*(?:\.\.\.|…)\s*")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+# 이 글자 수 이상인 문장은 앞선 문장에 포함되어 있어도 중복으로 간주 (잘린 스니펫 대응)
+MIN_OVERLAP_CHARS = 12
+
+
+def strip_markup(text: str) -> str:
+    """검색 결과의 강조 태그와 HTML 엔티티를 제거하고 공백을 정리합니다."""
+    return re.sub(r"\s+", " ", html.unescape(_TAG_RE.sub("", text or ""))).strip()
+
+
+def published_at(item: Dict[str, Any]) -> Optional[datetime]:
+    """뉴스(pubDate)와 블로그(postdate)의 작성일을 읽습니다. 나머지 검색 타입은 날짜가 없습니다."""
+    try:
+        if item.get("pubDate"):
+            return parsedate_to_datetime(item["pubDate"])
+        if item.get("postdate"):
+            return datetime.strptime(item["postdate"], "%Y%m%d").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class SearchResultCompactor:
+    """검색 결과 항목을 토큰 예산 안의 짧은 텍스트로 만듭니다."""
+
+    def __init__(self, token_counter: Optional[TokenCounter] = None, snippet_chars: int = 240):
+        """
+        Args:
+            token_counter: 토큰 계산기
+            snippet_chars: 항목별 설명의 최대 글자 수
+        """
+        self.counter = token_counter or TokenCounter()
+        self.snippet_chars = snippet_chars
+
+    def compact(
+        self,
+        items: Sequence[Dict[str, Any]],
+        token_budget: int,
+        source_items: Optional[Sequence[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        검색 결과 항목을 압축합니다.
+
+        각 항목은 "번호. [검색 타입] 제목 | 날짜 | 링크" 한 줄과 설명 한 줄로 표현하며,
+        앞선 항목에 이미 나온 문장은 뺍니다. 토큰 예산을 넘는 항목부터는 생략합니다.
+
+        Args:
+            items: 검색 API 결과 항목 (순위순)
+            token_budget: 반환 텍스트의 최대 토큰 수
+            source_items: 병합 전 원본 항목 (압축 전 토큰 수 측정용, 없으면 items)
+
+        Returns:
+            압축된 검색 결과 문자열
+        """
+        if not items:
+            return EMPTY_RESULT
+
+        snippets = self._dedupe([strip_markup(item.get("description", "")) for item in items])
+        seen_titles: Set[str] = set()
+        lines: List[str] = []
+        used = 0
+
+        for item, snippet in zip(items, snippets):
+            title = strip_markup(item.get("title", ""))
+            title_key = _NON_WORD_RE.sub("", title.lower())
+            if not snippet and (not title_key or title_key in seen_titles):
+                continue
+            seen_titles.add(title_key)
+
+            header = " | ".join(part for part in (
+                f"[{item['vertical']}] {title}" if item.get("vertical") else title,
+                item.get("published_at") or self._date(item),
+                item.get("link", ""),
+            ) if part)
+            entry = f"{len(lines) // 2 + 1}. {header}"
+            snippet = snippet[:self.snippet_chars]
+
+            tokens = self.counter.count_text(f"{entry}\n{snippet}\n")
+            if used + tokens > token_budget:
+                if lines:
+                    break
+                # 첫 항목도 예산을 넘으면 설명을 줄여서라도 포함
+                snippet = self._truncate(snippet, max(0, token_budget - self.counter.count_text(entry) - 2))
+                tokens = token_budget
+            lines.extend([entry, f"   {snippet}" if snippet else ""])
+            used += tokens
+
+        result = "\n".join(line for line in lines if line) or EMPTY_RESULT
+        raw = "\n".join(
+            f"{item.get('title', '')} {item.get('link', '')} {item.get('description', '')}"
+            for item in (source_items if source_items is not None else items)
+        )
+        search_metrics.record_compaction(self.counter.count_text(raw), self.counter.count_text(result))
+        return result
+
+    @staticmethod
+    def _date(item: Dict[str, Any]) -> str:
+        published = published_at(item)
+        return published.date().isoformat() if published else ""
+
+    @staticmethod
+    def _dedupe(snippets: Sequence[str]) -> List[str]:
+        """
+        항목별 설명에서 겹치는 문장을 제거합니다.
+
+        앞서 남긴 문장과 같거나 그 일부인 문장은 빼고, 앞서 남긴 문장을 포함하는 더 긴 문장은
+        버리지 않고 앞선 문장 자리에 대신 넣습니다. (더 긴 문장의 추가 정보 유지)
+
+        Args:
+            snippets: 항목별 설명 (순위순)
+
+        Returns:
+            중복 문장을 제거한 항목별 설명
+        """
+        # 항목별 [정규화된 문장, 원문] 목록 (대체되어 빠진 문장은 키가 None)
+        kept: List[List[List[Optional[str]]]] = []
+        for snippet in snippets:
+            entries: List[List[Optional[str]]] = []
+            kept.append(entries)
+            for sentence in _SENTENCE_RE.split(snippet):
+                key = _NON_WORD_RE.sub("", sentence.lower())
+                if not key:
+                    continue
+                previous = [entry for item_entries in kept for entry in item_entries if entry[0] is not None]
+                if any(
+                    key == seen or (len(key) >= MIN_OVERLAP_CHARS and key in seen)
+                    for seen, _ in previous
+                ):
+                    continue
+                superseded = [entry for entry in previous if len(entry[0]) >= MIN_OVERLAP_CHARS and entry[0] in key]
+                if superseded:
+                    superseded[0][:] = [key, sentence.strip()]
+                    for entry in superseded[1:]:
+                        entry[0] = None
+                    continue
+                entries.append([key, sentence.strip()])
+        return [
+            " ".join(sentence for key, sentence in entries if key is not None)
+            for entries in kept
+        ]
+
+    def _truncate(self, text: str, token_budget: int) -> str:
+        while text and self.counter.count_text(text) > token_budget:
+            text = text[:int(len(text) * 0.8)]
+        return text
+
+
+# 전역 검색 결과 압축기 인스턴스
+search_result_compactor = SearchResultCompactor()
@@ -0,0 +1,230 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.component.search.SearchInterface import SearchInterface
+from app.component.search.compactor import EMPTY_RESULT
+from app.component.search.metrics import search_metrics
+
+
+class LatencyTracker:
+    """최근 응답 시간을 보관하고 백분위수를 계산합니다."""
+
+    def __init__(self, window: int = 200):
+        """
+        Args:
+            window: 보관할 최근 응답 시간 수
+        """
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Args:
+            percentile: 0~1 사이의 백분위
+
+        Returns:
+            응답 시간 백분위수 (초), 기록이 없으면 None
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[max(0, math.ceil(percentile * len(samples)) - 1)]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class HedgedSearchComponent(SearchInterface):
+    """
+    여러 검색 컴포넌트를 순서대로 지연 실행(hedging)하는 SearchInterface.
+
+    첫 번째 컴포넌트를 먼저 호출하고, 그 응답 시간의 백분위수(hedge_percentile)가 지나도
+    응답이 없으면 다음 컴포넌트를 추가로 호출합니다. 앞선 호출이 실패하거나 빈 결과를
+    반환하면 다음 컴포넌트를 바로 호출합니다. 가장 먼저 도착한 비어 있지 않은 결과를
+    반환하고 나머지 호출은 취소합니다.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[SearchInterface],
+        hedge_percentile: float = 0.95,
+        min_delay: float = 0.3,
+        default_delay: float = 1.5,
+        min_samples: int = 20,
+        window: int = 200
+    ):
+        """
+        Args:
+            providers: 호출 순서대로의 검색 컴포넌트 (첫 번째가 기본)
+            hedge_percentile: 다음 컴포넌트를 호출하기 전 기다릴 응답 시간 백분위
+            min_delay: 다음 컴포넌트를 호출하기 전 최소 대기 시간 (초)
+            default_delay: 응답 시간 기록이 min_samples개 미만일 때의 대기 시간 (초)
+            min_samples: 백분위수를 사용하기 위한 최소 기록 수
+            window: 컴포넌트별로 보관할 최근 응답 시간 수
+        """
+        if not providers:
+            raise ValueError("HedgedSearchComponent requires at least one provider")
+        self.providers = list(providers)
+        self.hedge_percentile = hedge_percentile
+        self.min_delay = min_delay
+        self.default_delay = default_delay
+        self.min_samples = min_samples
+        self.latencies = [LatencyTracker(window) for _ in self.providers]
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.providers) * 4, thread_name_prefix="search-hedge"
+        )
+
+    def search(self, query: str, **kwargs: Any) -> str:
+        """
+        검색 컴포넌트를 지연 실행하고 가장 먼저 도착한 비어 있지 않은 결과를 반환합니다.
+        이미 실행 중인 스레드는 중단할 수 없으므로 결과를 기다리지 않고 버립니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        pending: Dict[Future, int] = {}
+        errors: List[Exception] = []
+        empty: Optional[str] = None
+        next_index = 0
+        hedge_at = 0.0
+
+        try:
+            while True:
+                if next_index < len(self.providers) and (not pending or time.monotonic() >= hedge_at):
+                    future = self._executor.submit(self._timed_search, next_index, query, kwargs)
+                    pending[future] = next_index
+                    hedge_at = time.monotonic() + self.hedge_delay(next_index)
+                    next_index += 1
+                if not pending:
+                    break
+
+                timeout = max(0.0, hedge_at - time.monotonic()) if next_index < len(self.providers) else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"Hedged search provider {index} failed: {str(e)}")
+                        errors.append(e)
+                        continue
+                    if self._is_good(result):
+                        search_metrics.record_hedge(launched=next_index, winner=index)
+                        return result
+                    empty = result
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return self._no_result(next_index, empty, errors)
+
+    async def asearch(self, query: str, **kwargs: Any) -> str:
+        """
+        search의 비동기 버전. 결과가 정해지면 나머지 검색 작업은 취소합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        pending: Dict[asyncio.Task, int] = {}
+        errors: List[Exception] = []
+        empty: Optional[str] = None
+        next_index = 0
+        hedge_at = 0.0
+
+        try:
+            while True:
+                if next_index < len(self.providers) and (not pending or time.monotonic() >= hedge_at):
+                    task = asyncio.create_task(self._atimed_search(next_index, query, kwargs))
+                    pending[task] = next_index
+                    hedge_at = time.monotonic() + self.hedge_delay(next_index)
+                    next_index += 1
+                if not pending:
+                    break
+
+                timeout = max(0.0, hedge_at - time.monotonic()) if next_index < len(self.providers) else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        print(f"Hedged search provider {index} failed: {str(e)}")
+                        errors.append(e)
+                        continue
+                    if self._is_good(result):
+                        search_metrics.record_hedge(launched=next_index, winner=index)
+                        return result
+                    empty = result
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return self._no_result(next_index, empty, errors)
+
+    def hedge_delay(self, index: int) -> float:
+        """index번째 컴포넌트를 호출한 뒤 다음 컴포넌트를 호출하기까지 기다릴 시간 (초)"""
+        tracker = self.latencies[index]
+        if len(tracker) < self.min_samples:
+            return self.default_delay
+        return max(self.min_delay, tracker.percentile(self.hedge_percentile))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "providers": [
+                {
+                    "provider": type(provider).__name__,
+                    "samples": len(tracker),
+                    "p50": tracker.percentile(0.5),
+                    "hedge_percentile": tracker.percentile(self.hedge_percentile),
+                    "hedge_delay": self.hedge_delay(index),
+                }
+                for index, (provider, tracker) in enumerate(zip(self.providers, self.latencies))
+            ]
+        }
+
+    def _timed_search(self, index: int, query: str, kwargs: Dict[str, Any]) -> str:
+        started = time.monotonic()
+        result = self.providers[index].search(query, **kwargs)
+        self.latencies[index].record(time.monotonic() - started)
+        return result
+
+    async def _atimed_search(self, index: int, query: str, kwargs: Dict[str, Any]) -> str:
+        started = time.monotonic()
+        try:
+            result = await self.providers[index].asearch(query, **kwargs)
+        except asyncio.CancelledError:
+            # 취소된 호출도 최소한 이만큼 걸렸으므로 기록 (느린 호출만 빠져 백분위수가 낮아지는 것 방지)
+            self.latencies[index].record(time.monotonic() - started)
+            raise
+        self.latencies[index].record(time.monotonic() - started)
+        return result
+
+    @staticmethod
+    def _is_good(result: Optional[str]) -> bool:
+        return bool(result) and EMPTY_RESULT not in result
+
+    @staticmethod
+    def _no_result(launched: int, empty: Optional[str], errors: List[Exception]) -> str:
+        """모든 컴포넌트가 빈 결과이거나 실패한 경우, 빈 결과가 있으면 반환하고 없으면 첫 오류를 발생시킵니다."""
+        search_metrics.record_hedge(launched=launched, winner=None)
+        if empty is not None:
+            return empty
+        raise errors[0]
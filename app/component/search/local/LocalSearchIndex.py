@@ -0,0 +1,261 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.component.search.cache.CachedSearchComponent import normalize_query
+from app.component.search.compactor import strip_markup
+from app.config.settings import settings
+
+# BM25 열 가중치 (제목, 설명, 결과를 가져온 검색어)
+TITLE_WEIGHT = 5.0
+DESCRIPTION_WEIGHT = 1.0
+QUERY_WEIGHT = 2.0
+
+
+class LocalSearchIndex:
+    """
+    SQLite FTS5 기반의 로컬 검색 인덱스.
+
+    검색 API가 반환한 결과 항목을 가져온 시각과 함께 저장하고, BM25 순위로 다시 검색합니다.
+    같은 링크의 결과는 최신 내용으로 덮어씁니다. WAL 모드를 사용하므로 같은 호스트의
+    여러 워커 프로세스가 하나의 파일을 공유할 수 있습니다.
+    """
+
+    # 이 횟수만큼 저장할 때마다 최대 문서 수를 넘는 오래된 결과를 정리
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, max_documents: int = 100000, busy_timeout_ms: int = 5000):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+            max_documents: 최대 저장 결과 수
+            busy_timeout_ms: 다른 워커가 쓰기 잠금을 가진 경우 대기 시간
+        """
+        self.path = path
+        self.max_documents = max_documents
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._create_schema()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _create_schema(self):
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS search_documents (
+                id INTEGER PRIMARY KEY,
+                link TEXT NOT NULL UNIQUE,
+                vertical TEXT NOT NULL,
+                query TEXT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                item TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_search_documents_fetched_at ON search_documents (fetched_at);
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5(
+                title, description, query,
+                content='search_documents', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            );
+            CREATE TRIGGER IF NOT EXISTS search_documents_ai AFTER INSERT ON search_documents BEGIN
+                INSERT INTO search_documents_fts (rowid, title, description, query)
+                VALUES (new.id, new.title, new.description, new.query);
+            END;
+            CREATE TRIGGER IF NOT EXISTS search_documents_ad AFTER DELETE ON search_documents BEGIN
+                INSERT INTO search_documents_fts (search_documents_fts, rowid, title, description, query)
+                VALUES ('delete', old.id, old.title, old.description, old.query);
+            END;
+            CREATE TRIGGER IF NOT EXISTS search_documents_au AFTER UPDATE ON search_documents BEGIN
+                INSERT INTO search_documents_fts (search_documents_fts, rowid, title, description, query)
+                VALUES ('delete', old.id, old.title, old.description, old.query);
+                INSERT INTO search_documents_fts (rowid, title, description, query)
+                VALUES (new.id, new.title, new.description, new.query);
+            END;
+            """
+        )
+
+    def add(
+        self,
+        query: str,
+        vertical: str,
+        items: Sequence[Dict[str, Any]],
+        fetched_at: Optional[float] = None
+    ) -> int:
+        """
+        검색 결과 항목을 인덱스에 저장합니다.
+
+        Args:
+            query: 결과를 가져온 검색어
+            vertical: 검색 타입
+            items: 검색 API 결과 항목
+            fetched_at: 가져온 시각 (None이면 현재 시각)
+
+        Returns:
+            저장한 항목 수
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = [
+            (
+                item["link"],
+                vertical,
+                normalize_query(query),
+                strip_markup(item.get("title", "")),
+                strip_markup(item.get("description", "")),
+                json.dumps({key: value for key, value in item.items() if key != "vertical"}, ensure_ascii=False),
+                fetched_at,
+            )
+            for item in items
+            if item.get("link")
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    """
+                    INSERT INTO search_documents (link, vertical, query, title, description, item, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (link) DO UPDATE SET
+                        vertical = excluded.vertical,
+                        query = excluded.query,
+                        title = excluded.title,
+                        description = excluded.description,
+                        item = excluded.item,
+                        fetched_at = excluded.fetched_at
+                    """,
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM search_documents WHERE id IN "
+                    "(SELECT id FROM search_documents ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_documents,),
+                )
+        return len(rows)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        max_age: Optional[float] = None,
+        verticals: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        검색어의 모든 단어(접두어 일치)를 포함하는 결과를 BM25 순위로 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            limit: 최대 결과 수
+            max_age: 이 시간(초)보다 오래전에 가져온 결과는 제외 (None이면 제한 없음)
+            verticals: 검색 타입 제한 (None이면 전체)
+
+        Returns:
+            검색 결과 항목 (vertical, fetched_at, score 포함)
+        """
+        terms = re.findall(r"\w+", normalize_query(query))
+        if not terms:
+            return []
+
+        sql = (
+            "SELECT d.item, d.vertical, d.fetched_at, "
+            "bm25(search_documents_fts, ?, ?, ?) AS rank "
+            "FROM search_documents_fts JOIN search_documents d ON d.id = search_documents_fts.rowid "
+            "WHERE search_documents_fts MATCH ? AND d.fetched_at >= ?"
+        )
+        params: List[Any] = [
+            TITLE_WEIGHT, DESCRIPTION_WEIGHT, QUERY_WEIGHT,
+            " ".join(f'"{term}"*' for term in terms),
+            time.time() - max_age if max_age is not None else 0.0,
+        ]
+        if verticals:
+            sql += f" AND d.vertical IN ({', '.join('?' for _ in verticals)})"
+            params.extend(verticals)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {**json.loads(item), "vertical": vertical, "fetched_at": fetched_at, "score": round(-rank, 4)}
+            for item, vertical, fetched_at, rank in rows
+        ]
+
+    def purge(self, older_than: float) -> int:
+        """older_than 이전에 가져온 결과를 삭제하고 삭제한 수를 반환합니다."""
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM search_documents WHERE fetched_at < ?", (older_than,)
+            ).rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            documents, oldest = self._conn.execute(
+                "SELECT COUNT(*), MIN(fetched_at) FROM search_documents"
+            ).fetchone()
+        return {
+            "backend": "sqlite-fts5",
+            "path": self.path,
+            "documents": documents,
+            "max_documents": self.max_documents,
+            "oldest_age_seconds": round(time.time() - oldest, 1) if oldest is not None else None,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# 전역 로컬 검색 인덱스 인스턴스 (처음 사용할 때 생성)
+_local_search_index: Optional[LocalSearchIndex] = None
+_local_search_index_lock = threading.Lock()
+
+
+def get_local_search_index(create: bool = True) -> Optional[LocalSearchIndex]:
+    """
+    전역 로컬 검색 인덱스를 반환합니다.
+    모듈을 import하는 것만으로 데이터베이스 파일이 생기지 않도록 처음 사용할 때 엽니다.
+
+    Args:
+        create: 아직 열리지 않았으면 여는지 여부
+
+    Returns:
+        로컬 검색 인덱스 (사용하지 않도록 설정되었거나, create가 False이고 아직 열리지 않았으면 None)
+    """
+    global _local_search_index
+    if not settings.SEARCH_LOCAL_INDEX_ENABLED:
+        return None
+    with _local_search_index_lock:
+        if _local_search_index is None and create:
+            _local_search_index = LocalSearchIndex(
+                path=settings.SEARCH_LOCAL_INDEX_PATH,
+                max_documents=settings.SEARCH_LOCAL_MAX_DOCUMENTS
+            )
+        return _local_search_index
+
+
+def close_local_search_index() -> None:
+    """열려 있는 전역 로컬 검색 인덱스를 닫습니다."""
+    global _local_search_index
+    with _local_search_index_lock:
+        if _local_search_index is not None:
+            _local_search_index.close()
+            _local_search_index = None
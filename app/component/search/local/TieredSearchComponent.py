@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.component.search.SearchInterface import SearchInterface
+from app.component.search.compactor import search_result_compactor
+from app.component.search.local.LocalSearchIndex import LocalSearchIndex
+from app.component.search.metrics import search_metrics
+
+
+class TieredSearchComponent(SearchInterface):
+    """
+    로컬 검색 인덱스를 먼저 확인하는 SearchInterface 래퍼.
+
+    - max_age 이내에 가져온 결과 중 검색어의 모든 단어를 포함하는 결과가 min_hits개 이상이면
+      검색 API를 호출하지 않고 로컬 결과로 응답합니다.
+    - 그렇지 않으면 실제 검색 컴포넌트를 호출합니다. (검색 컴포넌트가 결과를 인덱스에 저장)
+    - 검색 API가 실패하면 outage_max_age 이내의 로컬 결과가 있는 경우 그 결과로 응답합니다.
+    """
+
+    def __init__(
+        self,
+        search_component: SearchInterface,
+        index: LocalSearchIndex,
+        max_age: float = 21600.0,
+        outage_max_age: float = 604800.0,
+        min_hits: int = 3,
+        max_results: int = 10,
+        token_budget: int = 600,
+        verticals: Optional[Sequence[str]] = None
+    ):
+        """
+        Args:
+            search_component: 실제 검색을 수행할 컴포넌트
+            index: 로컬 검색 인덱스
+            max_age: 로컬 결과를 최신으로 볼 시간 (초)
+            outage_max_age: 검색 API 장애 시 사용할 로컬 결과의 최대 나이 (초)
+            min_hits: 로컬에서 응답하기 위한 최소 결과 수
+            max_results: 로컬 응답의 최대 결과 수
+            token_budget: 로컬 응답의 최대 토큰 수
+            verticals: 로컬에서 찾을 검색 타입 (호출 시 search_type이 있으면 그 타입만)
+        """
+        self.search_component = search_component
+        self.index = index
+        self.max_age = max_age
+        self.outage_max_age = outage_max_age
+        self.min_hits = min_hits
+        self.max_results = max_results
+        self.token_budget = token_budget
+        self.verticals = list(verticals) if verticals else None
+
+    def search(self, query: str, **kwargs: Any) -> str:
+        """
+        최신 로컬 결과가 충분하면 반환하고, 아니면 검색 API를 호출합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        hits = self._local_hits(query, kwargs, self.max_age)
+        if len(hits) >= self.min_hits:
+            search_metrics.record_local_lookup("local")
+            return self._compact(hits)
+
+        search_metrics.record_local_lookup("remote")
+        try:
+            return self.search_component.search(query, **kwargs)
+        except Exception as e:
+            return self._fallback(query, kwargs, e)
+
+    async def asearch(self, query: str, **kwargs: Any) -> str:
+        """
+        search의 비동기 버전. 로컬 인덱스 조회는 스레드 풀에서 실행합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        hits = await asyncio.to_thread(self._local_hits, query, kwargs, self.max_age)
+        if len(hits) >= self.min_hits:
+            search_metrics.record_local_lookup("local")
+            return self._compact(hits)
+
+        search_metrics.record_local_lookup("remote")
+        try:
+            return await self.search_component.asearch(query, **kwargs)
+        except Exception as e:
+            return await asyncio.to_thread(self._fallback, query, kwargs, e)
+
+    def _local_hits(self, query: str, kwargs: Dict[str, Any], max_age: float) -> List[Dict[str, Any]]:
+        search_type = kwargs.get("search_type")
+        verticals = [search_type] if search_type else self.verticals
+        try:
+            return self.index.search(query, limit=self.max_results, max_age=max_age, verticals=verticals)
+        except Exception as e:
+            print(f"Local search index lookup failed: {str(e)}")
+            return []
+
+    def _fallback(self, query: str, kwargs: Dict[str, Any], error: Exception) -> str:
+        """검색 API 오류 시 오래된 로컬 결과라도 있으면 반환하고, 없으면 오류를 다시 발생시킵니다."""
+        hits = self._local_hits(query, kwargs, self.outage_max_age)
+        if not hits:
+            raise error
+        print(f"Search API failed, answering from local index: {str(error)}")
+        search_metrics.record_local_lookup("fallback")
+        return self._compact(hits)
+
+    def _compact(self, hits: List[Dict[str, Any]]) -> str:
+        return search_result_compactor.compact(hits, self.token_budget)
@@ -0,0 +1,145 @@
+"""
+검색 메트릭
+
+검색 요청 수, 결과 캐시 적중/미스, 로컬 검색 인덱스 응답 수, 실제 검색 API 호출 수,
+지연 실행(hedging)한 추가 검색 수와 검색 결과 압축 전후의 토큰 수를 집계합니다.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+
+class SearchMetrics:
+    """검색 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.cache_hits = 0
+        self.stale_hits = 0
+        self.cache_misses = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.local_hits = 0
+        self.local_misses = 0
+        self.local_fallbacks = 0
+        self.hedged_requests = 0
+        self.hedges_fired = 0
+        self.backup_wins = 0
+        self.hedge_failures = 0
+        self.compactions = 0
+        self.compaction_input_tokens = 0
+        self.compaction_output_tokens = 0
+
+    def record_cache_lookup(self, state: str):
+        """
+        결과 캐시 조회 결과를 기록합니다.
+
+        Args:
+            state: fresh(적중), stale(만료된 결과 반환 후 갱신), miss(미스), coalesced(진행 중인 같은 검색 대기)
+        """
+        with self._lock:
+            self.requests += 1
+            if state == "fresh":
+                self.cache_hits += 1
+            elif state == "stale":
+                self.stale_hits += 1
+            elif state == "coalesced":
+                self.coalesced += 1
+            else:
+                self.cache_misses += 1
+
+    def record_upstream_call(self, refresh: bool = False, error: bool = False):
+        """
+        검색 API 호출을 기록합니다.
+
+        Args:
+            refresh: 백그라운드 갱신 호출인지 여부
+            error: 호출이 실패했는지 여부
+        """
+        with self._lock:
+            self.upstream_calls += 1
+            self.upstream_errors += error
+            if refresh:
+                self.refreshes += 1
+                self.refresh_errors += error
+
+    def record_local_lookup(self, state: str):
+        """
+        로컬 검색 인덱스 조회 결과를 기록합니다.
+
+        Args:
+            state: local(로컬 응답), remote(검색 API 호출), fallback(검색 API 오류로 로컬 응답)
+        """
+        with self._lock:
+            if state == "local":
+                self.local_hits += 1
+            elif state == "fallback":
+                self.local_fallbacks += 1
+            else:
+                self.local_misses += 1
+
+    def record_hedge(self, launched: int, winner: Optional[int]):
+        """
+        지연 실행 검색 결과를 기록합니다.
+
+        Args:
+            launched: 호출한 검색 컴포넌트 수
+            winner: 결과를 반환한 컴포넌트 순번 (모두 실패하거나 빈 결과면 None)
+        """
+        with self._lock:
+            self.hedged_requests += 1
+            self.hedges_fired += max(0, launched - 1)
+            if winner is None:
+                self.hedge_failures += 1
+            elif winner > 0:
+                self.backup_wins += 1
+
+    def record_compaction(self, input_tokens: int, output_tokens: int):
+        """
+        검색 결과 압축을 기록합니다.
+
+        Args:
+            input_tokens: 원본 결과 항목(제목, 링크, 설명)의 토큰 수
+            output_tokens: LLM에 전달하는 압축 결과의 토큰 수
+        """
+        with self._lock:
+            self.compactions += 1
+            self.compaction_input_tokens += input_tokens
+            self.compaction_output_tokens += output_tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            served = self.cache_hits + self.stale_hits + self.coalesced
+            return {
+                "requests": self.requests,
+                "cache_hits": self.cache_hits,
+                "stale_hits": self.stale_hits,
+                "cache_misses": self.cache_misses,
+                "coalesced": self.coalesced,
+                "hit_rate": round(served / self.requests, 3) if self.requests else 0.0,
+                "upstream_calls": self.upstream_calls,
+                "upstream_errors": self.upstream_errors,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                # 캐시가 없었다면 요청마다 한 번씩 API를 호출했을 것
+                "upstream_calls_saved": max(0, self.requests - self.upstream_calls),
+                "local_hits": self.local_hits,
+                "local_misses": self.local_misses,
+                "local_fallbacks": self.local_fallbacks,
+                "hedged_requests": self.hedged_requests,
+                "hedges_fired": self.hedges_fired,
+                "backup_wins": self.backup_wins,
+                "hedge_failures": self.hedge_failures,
+                "compactions": self.compactions,
+                "avg_tokens_before_compaction": round(self.compaction_input_tokens / self.compactions, 1) if self.compactions else 0.0,
+                "avg_tokens_after_compaction": round(self.compaction_output_tokens / self.compactions, 1) if self.compactions else 0.0,
+                "compaction_token_reduction": round(1 - self.compaction_output_tokens / self.compaction_input_tokens, 3) if self.compaction_input_tokens else 0.0,
+            }
+
+
+# 전역 검색 메트릭 인스턴스
+search_metrics = SearchMetrics()
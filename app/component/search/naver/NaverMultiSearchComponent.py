@@ -0,0 +1,164 @@
+import asyncio
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence, Set
+
+from app.component.search.compactor import published_at, search_result_compactor, strip_markup
+from app.component.search.naver.NaverSearchComponent import NaverSearchComponent
+
+ALL_VERTICALS = ["news", "blog", "webkr", "kin", "doc"]
+
+# 순위 점수 가중치 (검색어 일치, 최신성, 각 검색 타입 내 순위)
+RELEVANCE_WEIGHT = 0.6
+RECENCY_WEIGHT = 0.25
+POSITION_WEIGHT = 0.15
+
+# 최신성 점수가 절반이 되는 기간 (일)
+RECENCY_HALF_LIFE_DAYS = 14.0
+
+# 설명의 문자 3-gram 자카드 유사도가 이 값 이상이면 중복으로 간주
+NEAR_DUPLICATE_THRESHOLD = 0.6
+
+
+def _shingles(text: str) -> Set[str]:
+    compact = re.sub(r"\s+", "", text.lower())
+    return {compact[i:i + 3] for i in range(max(1, len(compact) - 2))}
+
+
+def _normalize_link(link: str) -> str:
+    link = re.sub(r"^https?://(www\.|m\.)?", "", (link or "").strip().lower())
+    return link.rstrip("/")
+
+
+class NaverMultiSearchComponent(NaverSearchComponent):
+    """
+    여러 네이버 검색 타입(news, blog, webkr, kin, doc)을 동시에 검색하여
+    하나의 결과로 합치는 검색 컴포넌트.
+
+    링크와 거의 같은 설명을 가진 결과는 하나만 남기고, 검색어 일치도와 최신성,
+    각 검색 타입 내 순위로 정렬한 뒤 max_results개, token_budget 토큰 이내로 반환합니다.
+    한 번의 도구 호출로 충분한 문맥을 얻도록 하여 재검색 턴을 줄입니다.
+    """
+    verticals: List[str] = ALL_VERTICALS
+    max_results: int = 10
+
+    def search(self, query: str, **kwargs: Any) -> str:
+        """
+        모든 검색 타입을 동시에 검색하고 합친 결과를 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        with ThreadPoolExecutor(max_workers=len(self.verticals)) as executor:
+            futures = [
+                executor.submit(self.search_items, query, **{**kwargs, "search_type": vertical})
+                for vertical in self.verticals
+            ]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+        return self._compact(query, self._collect(results))
+
+    async def asearch(self, query: str, **kwargs: Any) -> str:
+        """
+        모든 검색 타입을 비동기로 동시에 검색하고 합친 결과를 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        results = await asyncio.gather(
+            *(self.asearch_items(query, **{**kwargs, "search_type": vertical}) for vertical in self.verticals),
+            return_exceptions=True
+        )
+        return self._compact(query, self._collect(results))
+
+    def merge_items(self, query: str, items_by_vertical: Sequence[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        검색 타입별 결과를 중복 제거 후 점수순으로 합칩니다.
+
+        Args:
+            query: 검색 쿼리 (일치도 계산용)
+            items_by_vertical: 검색 타입별 결과 항목 목록
+
+        Returns:
+            점수순으로 정렬된 결과 항목 (최대 max_results개)
+        """
+        terms = [term for term in re.split(r"\s+", query.lower()) if term]
+        now = datetime.now(timezone.utc)
+
+        scored = []
+        for items in items_by_vertical:
+            for position, item in enumerate(items):
+                title = strip_markup(item.get("title", ""))
+                description = strip_markup(item.get("description", ""))
+                text = f"{title} {description}".lower()
+
+                relevance = sum(term in text for term in terms) / len(terms) if terms else 0.0
+                published = published_at(item)
+                if published is not None:
+                    age_days = max(0.0, (now - published).total_seconds() / 86400)
+                    recency = math.pow(0.5, age_days / RECENCY_HALF_LIFE_DAYS)
+                else:
+                    recency = 0.0
+                rank = 1.0 - position / max(len(items), 1)
+
+                score = RELEVANCE_WEIGHT * relevance + RECENCY_WEIGHT * recency + POSITION_WEIGHT * rank
+                scored.append((score, {
+                    **item,
+                    "title": title,
+                    "description": description,
+                    "published_at": published.date().isoformat() if published else None,
+                    "score": round(score, 4),
+                }))
+
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+
+        merged: List[Dict[str, Any]] = []
+        seen_links: Set[str] = set()
+        seen_shingles: List[Set[str]] = []
+        for _, item in scored:
+            link = _normalize_link(item.get("link", ""))
+            if link and link in seen_links:
+                continue
+            shingles = _shingles(item["description"] or item["title"])
+            if any(len(shingles & other) / len(shingles | other) >= NEAR_DUPLICATE_THRESHOLD for other in seen_shingles):
+                continue
+            seen_links.add(link)
+            seen_shingles.append(shingles)
+            merged.append(item)
+            if len(merged) >= self.max_results:
+                break
+        return merged
+
+    def _compact(self, query: str, items_by_vertical: List[List[Dict[str, Any]]]) -> str:
+        source_items = [item for items in items_by_vertical for item in items]
+        return search_result_compactor.compact(
+            self.merge_items(query, items_by_vertical), self.token_budget, source_items=source_items
+        )
+
+    def _collect(self, results: Sequence[Any]) -> List[List[Dict[str, Any]]]:
+        """실패한 검색 타입은 건너뛰고, 모두 실패했으면 첫 오류를 다시 발생시킵니다."""
+        collected = []
+        errors = []
+        for vertical, result in zip(self.verticals, results):
+            if isinstance(result, Exception):
+                print(f"Naver {vertical} search failed: {str(result)}")
+                errors.append(result)
+            else:
+                collected.append(result)
+        if errors and not collected:
+            raise errors[0]
+        return collected
@@ -1,12 +1,21 @@
-from typing import Any, List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
-import requests
 from pydantic.main import BaseModel
 from typing_extensions import Literal
 
+from app.component.http.HttpClientPool import http_client_pool
 from app.component.search.SearchInterface import SearchInterface
+from app.component.search.compactor import search_result_compactor, strip_markup
+from app.component.search.local.LocalSearchIndex import get_local_search_index
 from app.config.settings import settings
 
+# 네이버 검색 API의 최대 start 값과 한 번에 받을 수 있는 최대 결과 수
+MAX_START = 1000
+MAX_DISPLAY = 100
+
 
 class NaverSearchComponent(BaseModel, SearchInterface):
     """
@@ -16,6 +25,11 @@ class NaverSearchComponent(BaseModel, SearchInterface):
     start: int = 1
     sort: str = "date"
     type: Literal["news", "blog", "webkr", "kin", "doc"] = "kin"
+    # LLM에 전달하는 검색 결과의 최대 토큰 수
+    token_budget: int = settings.SEARCH_TOKEN_BUDGET
+    # 여러 페이지를 읽는 검색(deep search)의 최대 결과 수와 토큰 수
+    deep_max_items: int = settings.SEARCH_DEEP_MAX_ITEMS
+    deep_token_budget: int = settings.SEARCH_DEEP_TOKEN_BUDGET
 
     X_Naver_Client_Id: str = settings.NAVER_CLIENT_ID
     X_Naver_Client_Secret: str = settings.NAVER_CLIENT_SECRET
@@ -34,31 +48,184 @@ class NaverSearchComponent(BaseModel, SearchInterface):
         Returns:
             검색 결과 문자열
         """
-        results = self._naver_search_api_results(
-            search_term=query,
-            display=self.display,
-            start=self.start,
-            sort=self.sort,
-            search_type=self.type,
-            **kwargs,
-        )
+        results = self._naver_search_api_results(search_term=query, **self._search_options(kwargs))
         return self._parse_results(results)
 
-    def _parse_descriptions(self, results: dict) -> List[str]:
-        """검색 결과에서 description을 추출합니다."""
-        descriptions = []
-        for result in results["items"]:
-            if "description" in result:
-                descriptions.append(result["description"])
+    async def asearch(self, query: str, **kwargs: Any) -> str:
+        """
+        공유 비동기 HTTP 클라이언트로 검색을 수행합니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        return self._parse_results(await self._anaver_search_api_results(query, **self._search_options(kwargs)))
+
+    def search_items(self, query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        검색 결과 항목(title, link, description, 날짜 등)을 그대로 반환합니다.
+        각 항목에는 검색 타입이 vertical로 기록됩니다.
+
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 검색 옵션들 (search_type으로 검색 타입 지정)
+
+        Returns:
+            검색 결과 항목 목록
+        """
+        options = self._search_options(kwargs)
+        results = self._naver_search_api_results(search_term=query, **options)
+        return [{**item, "vertical": options["search_type"]} for item in results.get("items", [])]
+
+    async def asearch_items(self, query: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """search_items의 비동기 버전"""
+        options = self._search_options(kwargs)
+        results = await self._anaver_search_api_results(query, **options)
+        return [{**item, "vertical": options["search_type"]} for item in results.get("items", [])]
+
+    def iter_items(
+        self,
+        query: str,
+        max_items: int = 50,
+        page_size: Optional[int] = None,
+        until: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        **kwargs: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        검색 결과 항목을 start 오프셋을 넘겨 가며 필요한 만큼만 읽습니다.
+        현재 페이지를 소비하는 동안 다음 페이지를 미리 요청합니다.
+
+        Args:
+            query: 검색 쿼리
+            max_items: 최대 결과 수
+            page_size: 페이지당 결과 수 (None이면 display, 최대 100)
+            until: 이 함수가 True를 반환한 항목까지 읽고 멈춤
+            **kwargs: 추가 검색 옵션들 (search_type, sort, start 등)
+
+        Yields:
+            검색 결과 항목
+        """
+        options, start, page_size = self._page_options(page_size, kwargs)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="naver-prefetch")
+        try:
+            future = executor.submit(self._page, query, start, options)
+            yielded = 0
+            while future is not None:
+                items, total = future.result()
+                start += page_size
+                future = None
+                if self._has_next_page(items, page_size, start, total, yielded + len(items), max_items):
+                    future = executor.submit(self._page, query, start, options)
+
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if yielded >= max_items or (until is not None and until(item)):
+                        return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def aiter_items(
+        self,
+        query: str,
+        max_items: int = 50,
+        page_size: Optional[int] = None,
+        until: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        iter_items의 비동기 버전. 다음 페이지는 별도 작업으로 미리 요청하며,
+        중간에 멈추면 진행 중인 요청을 취소합니다.
+        """
+        options, start, page_size = self._page_options(page_size, kwargs)
+        task = asyncio.create_task(self._apage(query, start, options))
+        try:
+            yielded = 0
+            while task is not None:
+                items, total = await task
+                start += page_size
+                task = None
+                if self._has_next_page(items, page_size, start, total, yielded + len(items), max_items):
+                    task = asyncio.create_task(self._apage(query, start, options))
+
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if yielded >= max_items or (until is not None and until(item)):
+                        return
+        finally:
+            if task is not None:
+                task.cancel()
+                # 취소 전에 실패한 미리 읽기 요청의 오류는 버림
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    async def adeep_search(
+        self,
+        query: str,
+        max_items: Optional[int] = None,
+        until: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        **kwargs: Any
+    ) -> str:
+        """
+        여러 페이지의 결과를 한 번에 모아 압축된 문자열로 반환합니다.
+        모은 결과가 deep_token_budget을 채우면 더 이상 페이지를 요청하지 않습니다.
+
+        Args:
+            query: 검색 쿼리
+            max_items: 최대 결과 수 (None이면 deep_max_items)
+            until: 이 함수가 True를 반환한 항목까지 읽고 멈춤
+            **kwargs: 추가 검색 옵션들
+
+        Returns:
+            검색 결과 문자열
+        """
+        items = []
+        tokens = 0
+        stream = self.aiter_items(query, max_items=max_items or self.deep_max_items, until=until, **kwargs)
+        async with aclosing(stream):
+            async for item in stream:
+                items.append(item)
+                tokens += search_result_compactor.counter.count_text(strip_markup(item.get("description", "")))
+                if tokens >= self.deep_token_budget:
+                    break
+        return search_result_compactor.compact(items, self.deep_token_budget)
+
+    def _page_options(self, page_size: Optional[int], kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], int, int]:
+        options = self._search_options(kwargs)
+        page_size = min(page_size or options["display"], MAX_DISPLAY)
+        options["display"] = page_size
+        return options, options.pop("start"), page_size
 
-        if len(descriptions) == 0:
-            return ["No good Naver Search Result was found"]
-        return descriptions
+    @staticmethod
+    def _has_next_page(items: List[Any], page_size: int, start: int, total: int, collected: int, max_items: int) -> bool:
+        return len(items) >= page_size and start <= min(total, MAX_START) and collected < max_items
+
+    def _page(self, query: str, start: int, options: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        results = self._naver_search_api_results(search_term=query, start=start, **options)
+        items = [{**item, "vertical": options["search_type"]} for item in results.get("items", [])]
+        return items, int(results.get("total", 0))
+
+    async def _apage(self, query: str, start: int, options: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        results = await self._anaver_search_api_results(query, start=start, **options)
+        items = [{**item, "vertical": options["search_type"]} for item in results.get("items", [])]
+        return items, int(results.get("total", 0))
+
+    def _search_options(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """컴포넌트 기본 검색 옵션에 호출별 옵션을 덮어씁니다."""
+        return {
+            "display": self.display,
+            "start": self.start,
+            "sort": self.sort,
+            "search_type": self.type,
+            **kwargs,
+        }
 
     def _parse_results(self, results: dict) -> str:
-        """검색 결과를 파싱하여 문자열로 반환합니다."""
-        result = " ".join(self._parse_descriptions(results))
-        return result
+        """검색 결과를 태그를 제거한 제목/날짜/링크/설명으로 압축하여 반환합니다."""
+        return search_result_compactor.compact(results.get("items", []), self.token_budget)
 
     def _naver_search_api_results(
         self, search_term: str, search_type: str = "kin", **kwargs: Any
@@ -74,6 +241,42 @@ class NaverSearchComponent(BaseModel, SearchInterface):
         Returns:
             API 응답 결과
         """
+        url, request_args = self._request_args(search_term, search_type, **kwargs)
+        response = http_client_pool.request("GET", url, **request_args)
+        response.raise_for_status()
+        search_results = response.json()
+        self._index_results(search_term, search_type, search_results)
+        return search_results
+
+    async def _anaver_search_api_results(
+        self, search_term: str, search_type: str = "kin", **kwargs: Any
+    ) -> dict:
+        """네이버 검색 API를 공유 비동기 클라이언트로 호출합니다."""
+        url, request_args = self._request_args(search_term, search_type, **kwargs)
+        response = await http_client_pool.arequest("GET", url, **request_args)
+        response.raise_for_status()
+        search_results = response.json()
+        await asyncio.to_thread(self._index_results, search_term, search_type, search_results)
+        return search_results
+
+    @staticmethod
+    def _index_results(search_term: str, search_type: str, results: dict):
+        """
+        로컬 검색 인덱스를 사용하도록 설정되어 있으면 검색 결과를 저장합니다.
+        동기/비동기 검색 모두 이 메서드에서만 저장 여부를 판단합니다. 저장 실패는 검색 결과에 영향을 주지 않습니다.
+        """
+        if not settings.SEARCH_LOCAL_INDEX_ENABLED:
+            return
+        try:
+            index = get_local_search_index()
+            index.add(search_term, search_type, results.get("items", []))
+        except Exception as e:
+            print(f"Local search index write failed: {str(e)}")
+
+    def _request_args(
+        self, search_term: str, search_type: str = "kin", **kwargs: Any
+    ) -> Tuple[str, Dict[str, Any]]:
+        """네이버 검색 API 요청 URL과 요청 옵션(헤더, 파라미터)을 구성합니다."""
         headers = {
             "X-Naver-Client-Id": self.X_Naver_Client_Id,
             "X-Naver-Client-Secret": self.X_Naver_Client_Secret
@@ -82,11 +285,4 @@ class NaverSearchComponent(BaseModel, SearchInterface):
             "query": search_term,
             **{key: value for key, value in kwargs.items() if value is not None},
         }
-        response = requests.get(
-            f"https://openapi.naver.com/v1/search/{search_type}.json", 
-            headers=headers, 
-            params=params
-        )
-        response.raise_for_status()
-        search_results = response.json()
-        return search_results 
\ No newline at end of file
+        return f"https://openapi.naver.com/v1/search/{search_type}.json", {"headers": headers, "params": params}
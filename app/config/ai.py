@@ -1,10 +1,14 @@
 from langchain_openai import ChatOpenAI
 
+from app.component.http.HttpClientPool import http_client_pool
 from app.config.settings import settings
 
 EMBEDDING_MODEL_NAME = "gpt-4o-2024-08-06"
 
 openai_chat = ChatOpenAI(
     api_key = settings.OPENAI_KEY,
-    model=EMBEDDING_MODEL_NAME
+    model=EMBEDDING_MODEL_NAME,
+    # 외부 API와 같은 연결 풀 사용 (요청 타임아웃은 ChatOpenAI 설정을 따름)
+    http_client=http_client_pool.client,
+    http_async_client=http_client_pool.async_client
 ) 
\ No newline at end of file
@@ -132,6 +132,23 @@ GUARDRAIL_CONFIG = {
     # 경고 패턴 임계값 (이 개수 이상이면 경고)
     "warning_threshold": 1,
     
+    # 스트리밍 검사 시 단어 목록이 아닌 패턴을 위해 다시 검사할 이전 텍스트 길이 (글자 수)
+    "stream_lookback": 256,
+    
+    # 검사 결과 캐시에 저장할 최대 텍스트 수
+    "cache_size": 4096,
+    
+    # 일괄 검사(저장된 대화 재검사) 시 프로세스 풀 크기 (None이면 CPU 수)와 작업 단위 텍스트 수
+    "batch_processes": None,
+    "batch_chunk_size": 1000,
+    
+    # 일괄 검사에서 프로세스 풀 없이 현재 프로세스에서 검사할 텍스트 수
+    # (워커 시작 비용이 수 초이므로 이보다 큰 입력의 나머지만 프로세스 풀로 검사)
+    "batch_pool_threshold": 50000,
+    
+    # 재검사 작업이 보관할 최대 차단/경고 항목 수
+    "audit_max_findings": 1000,
+    
     # 응답 메시지 템플릿
     "response_templates": {
         "forbidden": "죄송합니다. {reason} 안전상의 이유로 해당 요청을 처리할 수 없습니다.",
@@ -0,0 +1,82 @@
+"""
+라우팅 규칙 설정
+
+Supervisor LLM 호출 전에 적용되는 규칙 기반 라우터의 규칙을 중앙에서 관리합니다.
+각 규칙은 키워드(부분 문자열) 또는 정규식으로 매칭되며, 매칭된 규칙의 가중치 합이
+해당 멤버의 신뢰도가 됩니다.
+
+두 명 이상의 멤버 규칙이 매칭되거나 순서/연결 표현(그리고, ~해서 등)이 있는 요청은
+여러 작업이 필요할 수 있으므로 바로 라우팅하지 않고 LLM이 계획하도록 합니다.
+"""
+
+# 멤버별 라우팅 규칙
+ROUTING_RULES = {
+    "Researcher": [
+        {
+            "id": "search_request",
+            "pattern": r'(검색|찾아\s*(줘|봐|주세요)|알아\s*(봐|줘|봐줘)|조사해)',
+            "weight": 0.9,
+        },
+        {
+            "id": "search_topic",
+            "keywords": ["날씨", "뉴스", "최신", "요즘", "트렌드", "환율", "주가"],
+            "weight": 0.5,
+        },
+    ],
+    "Calender": [
+        {
+            "id": "schedule_action",
+            "pattern": r'(일정|스케줄|캘린더|약속|회의|미팅).{0,15}(등록|추가|잡아|만들|생성|수정|변경|삭제|취소|조회|알려|찾아|알아봐|검색|뭐\s*있)',
+            "weight": 0.9,
+        },
+        {
+            "id": "schedule_keyword",
+            "keywords": ["일정", "스케줄", "캘린더"],
+            "weight": 0.5,
+        },
+    ],
+    "Mail": [
+        {
+            "id": "mail_send",
+            "pattern": r'(메일|이메일|e-?mail).{0,15}(보내|발송|전송|써\s*줘|공유)',
+            "weight": 0.9,
+        },
+        {
+            "id": "mail_lookup",
+            "pattern": r'(메일|이메일|e-?mail).{0,15}(찾아|알아봐|검색|조회|뭐\s*있)',
+            "weight": 0.9,
+        },
+        {
+            "id": "mail_keyword",
+            "keywords": ["메일", "이메일"],
+            "weight": 0.5,
+        },
+        {
+            "id": "email_address",
+            "pattern": r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+            "weight": 0.3,
+        },
+    ],
+    "Chat": [
+        {
+            "id": "greeting",
+            "pattern": r'^\s*(안녕|안녕하세요|하이|반가워|반갑습니다|고마워|감사합니다|hello|hi|hey|thanks)[\s!~.?ㅎㅋ^]*$',
+            "weight": 0.95,
+        },
+    ],
+}
+
+# 라우터 설정
+ROUTER_CONFIG = {
+    # 규칙 라우터 사용 여부
+    "enabled": True,
+
+    # 이 신뢰도 이상이면 LLM 없이 바로 라우팅
+    "confidence_threshold": 0.8,
+
+    # 이 표현이 있으면 (복합 요청) LLM에 맡김 ("~하고 싶어"는 제외)
+    "multi_step_pattern": (
+        r'(그리고|그러고|그\s*다음|다음에|한\s*(뒤|후|다음)|하고\s+(?!싶)|해서\s|보고\s+(?!싶)'
+        r'|\bthen\b|\band\b)'
+    ),
+}
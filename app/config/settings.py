@@ -1,4 +1,6 @@
 from os import strerror
+from typing import Dict, List, Optional
+
 from pydantic_settings import BaseSettings
 
 class LocalSettings(BaseSettings):
@@ -9,6 +11,108 @@ class LocalSettings(BaseSettings):
     GOOGLE_CREDENTIAL_PATH: str
     GMAIL_TOKEN_PATH: str
 
+    # 그래프 시작 시 워밍업 설정
+    GRAPH_WARMUP_ENABLED: bool = True
+    GRAPH_WARMUP_TIMEOUT: float = 10.0
+    # 그래프 초기화에 실패한 경우 요청이 들어오면 이 간격(초)마다 다시 시도
+    GRAPH_STARTUP_RETRY_INTERVAL: float = 30.0
+
+    # 한 턴에서 실행할 수 있는 최대 에이전트 hop 수
+    GRAPH_MAX_HOPS: int = 6
+
+    # 입력 가드레일과 첫 supervisor 라우팅을 동시에 실행 (차단 시 라우팅 취소)
+    GRAPH_OPTIMISTIC_ROUTING: bool = True
+
+    # 대화 메모리 설정 (backend: memory, sqlite)
+    CHAT_MEMORY_BACKEND: str = "memory"
+    CHAT_MEMORY_SQLITE_PATH: str = "./resources/chat_memory.db"
+    CHAT_MEMORY_MAX_MESSAGES: int = 50
+    CHAT_MEMORY_MAX_SESSIONS: int = 10000
+    CHAT_MEMORY_IDLE_TTL: float = 3600.0
+    CHAT_MEMORY_MAX_BYTES: int = 256 * 1024 * 1024
+    CHAT_MEMORY_SWEEP_INTERVAL: float = 60.0
+
+    # 가드레일 패턴 파일 설정 (경로가 없으면 guardrail_patterns.py의 기본 패턴 사용)
+    GUARDRAIL_PATTERNS_PATH: Optional[str] = None
+    GUARDRAIL_PATTERNS_WATCH_INTERVAL: float = 5.0
+
+    # 관리자 API 키 (/api/v1/admin 요청에 X-Admin-Key 헤더로 전달, 설정하지 않으면 관리자 API 비활성화)
+    ADMIN_API_KEY: Optional[str] = None
+
+    # 대화 재검사에서 ?path=로 지정할 수 있는 SQLite 덤프 디렉터리 (없으면 덤프 검사 불가)
+    GUARDRAIL_RESCAN_DUMP_DIR: Optional[str] = None
+
+    # 외부 API HTTP 클라이언트 설정 (연결 풀, 타임아웃, 호스트별 동시 요청 제한)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_READ_TIMEOUT: float = 30.0
+    HTTP_PER_HOST_LIMIT: int = 50
+    HTTP_HOST_LIMITS: Dict[str, int] = {}
+    HTTP2_ENABLED: bool = True
+
+    # 네이버 다중 검색 설정 (여러 검색 타입을 동시에 검색해 한 번의 도구 호출로 결과 제공)
+    # 검색 타입 수만큼 API 호출 한도를 사용
+    SEARCH_MULTI_VERTICAL: bool = True
+    SEARCH_VERTICALS: List[str] = ["news", "blog", "webkr", "kin", "doc"]
+    SEARCH_MAX_RESULTS: int = 10
+
+    # LLM에 전달하는 검색 결과의 최대 토큰 수 (검색 호출당)
+    SEARCH_TOKEN_BUDGET: int = 600
+
+    # 여러 페이지를 읽는 검색(deep_search_tool)의 최대 결과 수와 토큰 수
+    SEARCH_DEEP_MAX_ITEMS: int = 50
+    SEARCH_DEEP_TOKEN_BUDGET: int = 1500
+
+    # 검색 결과 캐시 설정 (backend: memory, sqlite)
+    # TTL이 지난 결과는 SEARCH_CACHE_STALE_TTL 동안 그대로 반환하면서 백그라운드에서 갱신
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_BACKEND: str = "memory"
+    SEARCH_CACHE_SQLITE_PATH: str = "./resources/search_cache.db"
+    SEARCH_CACHE_TTL: float = 600.0
+    SEARCH_CACHE_STALE_TTL: float = 3600.0
+    SEARCH_CACHE_MAX_ENTRIES: int = 10000
+    # TTL과 SEARCH_CACHE_STALE_TTL이 모두 지난 결과를 삭제하는 주기 (초)
+    SEARCH_CACHE_SWEEP_INTERVAL: float = 300.0
+
+    # 로컬 검색 인덱스 설정 (SQLite FTS5)
+    # 검색 API 결과를 저장해 두고, SEARCH_LOCAL_MAX_AGE 이내에 가져온 관련 결과가
+    # SEARCH_LOCAL_MIN_HITS개 이상이면 API를 호출하지 않음
+    # 검색 API 오류 시에는 SEARCH_LOCAL_OUTAGE_MAX_AGE 이내의 결과로 응답
+    SEARCH_LOCAL_INDEX_ENABLED: bool = True
+    SEARCH_LOCAL_INDEX_PATH: str = "./resources/search_index.db"
+    SEARCH_LOCAL_MAX_AGE: float = 21600.0
+    SEARCH_LOCAL_OUTAGE_MAX_AGE: float = 604800.0
+    SEARCH_LOCAL_MIN_HITS: int = 3
+    SEARCH_LOCAL_MAX_DOCUMENTS: int = 100000
+
+    # 지연 실행(hedged) 검색 설정
+    # 기본 검색의 응답 시간이 SEARCH_HEDGE_PERCENTILE 백분위수를 넘으면
+    # SEARCH_HEDGE_VERTICALS의 단일 타입 검색을 순서대로 추가 호출하고 먼저 온 결과를 사용
+    # 응답 시간 기록이 부족할 때는 SEARCH_HEDGE_DEFAULT_DELAY(초)를 사용
+    SEARCH_HEDGE_ENABLED: bool = True
+    SEARCH_HEDGE_VERTICALS: List[str] = ["news", "webkr"]
+    SEARCH_HEDGE_PERCENTILE: float = 0.95
+    SEARCH_HEDGE_MIN_DELAY: float = 0.3
+    SEARCH_HEDGE_DEFAULT_DELAY: float = 1.5
+
+    # 캘린더 일정 캐시 설정
+    # 생성/수정/조회한 일정과 주기적으로 동기화한 기간(오늘 - CALENDAR_SYNC_PAST_DAYS ~ 오늘 + CALENDAR_SYNC_FUTURE_DAYS)의
+    # 일정을 보관하며, CALENDAR_CACHE_MAX_AGE(초)보다 오래된 캐시는 API로 다시 조회
+    # 기본 동기화 기간(31일)은 일정 목록 API 한 번으로 조회 가능한 최대 기간
+    CALENDAR_CACHE_ENABLED: bool = True
+    CALENDAR_CACHE_MAX_AGE: float = 600.0
+    CALENDAR_SYNC_INTERVAL: float = 300.0
+    CALENDAR_SYNC_PAST_DAYS: int = 1
+    CALENDAR_SYNC_FUTURE_DAYS: int = 29
+
+    # 컨텍스트 토큰 예산 설정
+    CONTEXT_TOKEN_BUDGET: int = 6000
+    CONTEXT_SUPERVISOR_TOKEN_BUDGET: int = 2000
+    CONTEXT_AGENT_TOKEN_BUDGET: int = 4000
+    CONTEXT_RECENT_TURNS: int = 6
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
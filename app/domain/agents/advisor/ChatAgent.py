@@ -1,8 +1,14 @@
+from contextlib import aclosing
+
 from langchain_openai import ChatOpenAI
+from langchain_core.messages import message_chunk_to_message
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from app.config.ai import openai_chat
 from app.config.settings import get_settings
 from app.config.prompts import get_prompt
+from app.domain.graph.context import context_builder
+from app.domain.gaurdrails.guardrailNode import output_guardrail_block_update
+from app.domain.gaurdrails.guardrails import guardrail_system
 
 settings = get_settings()
 
@@ -21,28 +27,54 @@ class ChatAgent:
         
         self.chain = self.prompt | self.llm
     
-    def invoke(self, state):
+    async def invoke(self, state):
         """그래프에서 호출되는 메서드"""
         try:
-            # 메시지 추출
-            messages = state.get("messages", [])
+            # 메시지 추출 (에이전트 토큰 예산에 맞춤)
+            messages = context_builder.fit(state.get("messages", []), settings.CONTEXT_AGENT_TOKEN_BUDGET)
             
             # agent_scratchpad가 없으면 빈 리스트로 설정
             agent_scratchpad = state.get("agent_scratchpad", [])
             
-            # 체인 실행
-            result = self.chain.invoke({
+            # 체인을 스트리밍으로 실행하며 토큰이 도착할 때마다 출력 가드레일 검사
+            checker = guardrail_system.stream_checker()
+            result = None
+            async with aclosing(self.chain.astream({
                 "messages": messages,
                 "agent_scratchpad": agent_scratchpad
-            })
+            })) as stream:
+                async for chunk in stream:
+                    result = chunk if result is None else result + chunk
+                    if isinstance(chunk.content, str) and chunk.content:
+                        blocked = checker.feed(chunk.content)
+                        if blocked:
+                            # 스트림을 닫아 진행 중인 LLM 호출을 중단
+                            return {
+                                **output_guardrail_block_update(blocked),
+                                "hops": state.get("hops", 0) + 1,
+                                "terminal": False
+                            }
+            
+            safety_result = checker.finish()
+            if not safety_result.is_safe:
+                return {
+                    **output_guardrail_block_update(safety_result),
+                    "hops": state.get("hops", 0) + 1,
+                    "terminal": False
+                }
+            result = message_chunk_to_message(result)
             
-            # 응답 반환
+            # 응답 반환 (일반 대화 응답은 그대로 최종 답변)
             return {
-                "messages": [result]
+                "messages": [result],
+                "hops": state.get("hops", 0) + 1,
+                "terminal": True
             }
         except Exception as e:
             error_msg = f"대화 처리 중 오류가 발생했습니다: {str(e)}"
             print(f"ChatAgent Error: {error_msg}")
             return {
-                "messages": [error_msg]
+                "messages": [error_msg],
+                "hops": state.get("hops", 0) + 1,
+                "terminal": False
             }
\ No newline at end of file
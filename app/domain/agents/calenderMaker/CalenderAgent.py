@@ -4,8 +4,9 @@ from typing import Optional
 from datetime import datetime
 
 from app.config.ai import openai_chat
-from app.component.calendar.kakaoCalendar.KaKaoCalendarComponent import KakaoCalendarComponent
+from app.component.calendar.KakaoCalendar.KaKaoCalendarComponent import kakao_calendar_component
 from app.component.calendar.CalendarInterface import CalendarInterface
+from app.component.calendar.cache.CalendarEventCache import parse_event_time
 from app.config.prompts import get_prompt
 
 
@@ -24,10 +25,10 @@ class CalenderAgent:
         if calendar_component:
             self.calendar = calendar_component
         else:
-            # Default to Kakao Calendar
-            self.calendar = KakaoCalendarComponent()
+            # Default to Kakao Calendar (shared instance whose event cache is synced in the background)
+            self.calendar = kakao_calendar_component
 
-        def create_calendar_event_tool(title: str, description: str, start_at: str, end_at: str) -> str:
+        async def create_calendar_event_tool(title: str, description: str, start_at: str, end_at: str) -> str:
             """
             Create a new calendar event.
             
@@ -44,7 +45,7 @@ class CalenderAgent:
             print(f"End: {end_at}")
             
             try:
-                result = self.calendar.create_event(
+                result = await self.calendar.acreate_event(
                     title=title,
                     description=description,
                     start_at=start_at,
@@ -75,7 +76,7 @@ class CalenderAgent:
                 print(f"Error: {error_msg}")
                 return error_msg
 
-        def get_details_event_tool(event_id: str) -> str:
+        async def get_details_event_tool(event_id: str) -> str:
             """
             Get details of a calendar event.
 
@@ -90,7 +91,7 @@ class CalenderAgent:
                 return "❌ 오류: 이벤트 ID가 제공되지 않았습니다. 유효한 이벤트 ID를 입력해주세요."
 
             try:
-                result = self.calendar.get_events(event_id=event_id)
+                result = await self.calendar.aget_events(event_id=event_id)
 
                 print(f"Calendar API Response: {result}")
 
@@ -109,9 +110,9 @@ class CalenderAgent:
                 print(f"Error: {error_msg}")
                 return f"❌ 오류: {error_msg}"
 
-        def update_calendar_event_tool(event_id: str, title: Optional[str] = None, 
-                                     description: Optional[str] = None, start_at: Optional[str] = None,
-                                     end_at: Optional[str] = None) -> str:
+        async def update_calendar_event_tool(event_id: str, title: Optional[str] = None, 
+                                           description: Optional[str] = None, start_at: Optional[str] = None,
+                                           end_at: Optional[str] = None) -> str:
             """
             Update an existing calendar event.
             
@@ -130,7 +131,7 @@ class CalenderAgent:
             print(f"New End: {end_at}")
             
             try:
-                result = self.calendar.update_event(
+                result = await self.calendar.aupdate_event(
                     event_id=event_id,
                     title=title,
                     description=description,
@@ -150,7 +151,7 @@ class CalenderAgent:
                 print(f"Error: {error_msg}")
                 return error_msg
 
-        def delete_calendar_event_tool(event_id: str) -> str:
+        async def delete_calendar_event_tool(event_id: str) -> str:
             """
             Delete a calendar event.
             
@@ -161,7 +162,7 @@ class CalenderAgent:
             print(f"Event ID: {event_id}")
             
             try:
-                result = self.calendar.delete_event(event_id=event_id)
+                result = await self.calendar.adelete_event(event_id=event_id)
                 
                 print(f"Calendar API Response: {result}")
                 
@@ -175,11 +176,49 @@ class CalenderAgent:
                 print(f"Error: {error_msg}")
                 return error_msg
 
+        async def list_calendar_events_tool(start_at: str, end_at: str) -> str:
+            """
+            List calendar events in a time range (e.g. tomorrow, this week).
+
+            Args:
+                start_at: 조회 시작 시간 (ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)
+                end_at: 조회 종료 시간 (ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ)
+            """
+            print("============ List Calendar Events ===============")
+            print(f"Range: {start_at} ~ {end_at}")
+
+            try:
+                events = await self.calendar.alist_events(start_at=start_at, end_at=end_at)
+
+                print(f"Calendar Events: {len(events)}")
+
+                if not events:
+                    return f"📅 {start_at} ~ {end_at} 기간에 등록된 일정이 없습니다."
+
+                lines = [f"✅ {len(events)}개의 일정을 찾았습니다. ({start_at} ~ {end_at})"]
+                for index, event in enumerate(events, 1):
+                    event_time = event.get("time") or {}
+                    if event_time.get("all_day"):
+                        when = f"{parse_event_time(event_time['start_at']).astimezone().date().isoformat()} 종일"
+                    else:
+                        when = " ~ ".join(
+                            parse_event_time(event_time[key]).astimezone().isoformat(timespec="minutes")
+                            for key in ("start_at", "end_at") if event_time.get(key)
+                        )
+                    lines.append(f"{index}. {event.get('title', '(제목 없음)')} | {when} | 🆔 {event.get('id')}")
+                return "\n".join(lines)
+
+            except Exception as e:
+                error_msg = f"일정 목록을 가져오는 데 실패했습니다: {str(e)}"
+                print(f"Error: {error_msg}")
+                return f"❌ 오류: {error_msg}"
+
         # 도구들 생성
         self.create_event_tool = tool(create_calendar_event_tool)
         self.get_details_event_tool = tool(get_details_event_tool)
         self.update_event_tool = tool(update_calendar_event_tool)
         self.delete_event_tool = tool(delete_calendar_event_tool)
+        self.list_events_tool = tool(list_calendar_events_tool)
 
         # 프롬프트 가져오기
         prompt = get_prompt('calendar')
@@ -192,6 +231,7 @@ class CalenderAgent:
                 self.get_details_event_tool,
                 self.update_event_tool,
                 self.delete_event_tool,
+                self.list_events_tool,
             ],
             prompt=prompt
         )
@@ -26,7 +26,7 @@ class MailAgent:
             # Default to Gmail
             self.mail = GmailComponent()
 
-        def send_email_tool(to: str, subject: str, body: str) -> str:
+        async def send_email_tool(to: str, subject: str, body: str) -> str:
             """
             Send an email using the mail component.
             
@@ -44,7 +44,7 @@ class MailAgent:
                 # 쉼표로 구분된 이메일 주소를 리스트로 변환
                 to_list = [email.strip() for email in to.split(',')]
                 
-                result = self.mail.send_email(to=to_list, subject=subject, body=body)
+                result = await self.mail.asend_email(to=to_list, subject=subject, body=body)
                 
                 print(f"Mail API Response: {result}")
                 
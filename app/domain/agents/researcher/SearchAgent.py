@@ -4,9 +4,22 @@ from langchain.tools import tool
 from langgraph.prebuilt import create_react_agent
 
 from app.component.search.SearchInterface import SearchInterface
+from app.component.search.cache.CachedSearchComponent import CachedSearchComponent
+from app.component.search.cache.MemorySearchCache import search_cache
+from app.component.search.compactor import EMPTY_RESULT
+from app.component.search.hedged.HedgedSearchComponent import HedgedSearchComponent
+from app.component.search.local.LocalSearchIndex import get_local_search_index
+from app.component.search.local.TieredSearchComponent import TieredSearchComponent
+from app.component.search.naver.NaverMultiSearchComponent import NaverMultiSearchComponent
 from app.component.search.naver.NaverSearchComponent import NaverSearchComponent
 from app.config.ai import openai_chat
-from app.config.prompts import get_prompt
+from app.config.prompts import (
+    DEEP_SEARCH_FALLBACK_PROMPT,
+    DEEP_SEARCH_TOOL_PROMPT,
+    SEARCH_FALLBACK_PROMPT,
+    get_prompt,
+)
+from app.config.settings import settings
 
 
 class SearchAgent:
@@ -33,15 +46,60 @@ class SearchAgent:
         # Search component initialization
         if search_component:
             self.search_component = search_component
+            self.naver_component = search_component if isinstance(search_component, NaverSearchComponent) else None
         else:
             # Default to Naver Search
-            self.search_component = NaverSearchComponent(
-                display=display,
-                start=start,
-                sort=sort
-            )
+            if settings.SEARCH_MULTI_VERTICAL:
+                # 여러 검색 타입을 한 번에 검색하여 재검색 턴을 줄임
+                self.search_component = NaverMultiSearchComponent(
+                    display=display,
+                    start=start,
+                    sort=sort,
+                    verticals=settings.SEARCH_VERTICALS,
+                    max_results=settings.SEARCH_MAX_RESULTS
+                )
+            else:
+                self.search_component = NaverSearchComponent(
+                    display=display,
+                    start=start,
+                    sort=sort
+                )
+            # 여러 페이지 검색은 캐시를 거치지 않고 네이버 컴포넌트에서 직접 수행
+            self.naver_component = self.search_component
+            if settings.SEARCH_HEDGE_ENABLED and settings.SEARCH_HEDGE_VERTICALS:
+                # 기본 검색이 느리면 단일 타입 검색을 추가로 호출하여 먼저 온 결과를 사용
+                self.search_component = HedgedSearchComponent(
+                    [self.search_component] + [
+                        NaverSearchComponent(display=display, start=start, sort=sort, type=vertical)
+                        for vertical in settings.SEARCH_HEDGE_VERTICALS
+                    ],
+                    hedge_percentile=settings.SEARCH_HEDGE_PERCENTILE,
+                    min_delay=settings.SEARCH_HEDGE_MIN_DELAY,
+                    default_delay=settings.SEARCH_HEDGE_DEFAULT_DELAY
+                )
+            local_search_index = get_local_search_index()
+            if local_search_index is not None:
+                # 최근에 가져온 관련 결과가 충분하면 로컬 인덱스에서 응답
+                self.search_component = TieredSearchComponent(
+                    self.search_component,
+                    local_search_index,
+                    max_age=settings.SEARCH_LOCAL_MAX_AGE,
+                    outage_max_age=settings.SEARCH_LOCAL_OUTAGE_MAX_AGE,
+                    min_hits=settings.SEARCH_LOCAL_MIN_HITS,
+                    max_results=settings.SEARCH_MAX_RESULTS,
+                    token_budget=settings.SEARCH_TOKEN_BUDGET,
+                    verticals=settings.SEARCH_VERTICALS if settings.SEARCH_MULTI_VERTICAL else [self.naver_component.type]
+                )
+            if settings.SEARCH_CACHE_ENABLED:
+                # 같은 검색의 반복 호출은 캐시에서 응답
+                self.search_component = CachedSearchComponent(
+                    self.search_component,
+                    search_cache,
+                    ttl=settings.SEARCH_CACHE_TTL,
+                    stale_ttl=settings.SEARCH_CACHE_STALE_TTL
+                )
 
-        def search_tool(query: str) -> str:
+        async def search_tool(query: str) -> str:
             """
             Search for information using the search component.
             
@@ -52,30 +110,71 @@ class SearchAgent:
             print(f"Query: {query}")
             
             try:
-                result = self.search_component.search(query)
+                result = await self.search_component.asearch(query)
                 
                 print(f"Search API Response: {result}")
                 
-                if result and "No good" not in result:
-                    return f"✅ 검색이 완료되었습니다!\n\n🔍 검색 결과:\n{result}"
+                # 압축된 결과를 그대로 전달 (장식 문구는 토큰만 사용)
+                if result and EMPTY_RESULT not in result:
+                    return result
                 else:
-                    return "❌ 검색 결과를 찾을 수 없습니다. 다른 검색어를 시도해보세요."
+                    return "검색 결과 없음. 다른 검색어를 시도해보세요."
                     
             except Exception as e:
                 error_msg = f"검색에 실패했습니다: {str(e)}"
                 print(f"Error: {error_msg}")
-                return f"❌ 오류: {error_msg}"
+                return f"오류: {error_msg}"
+
+        async def deep_search_tool(query: str, search_type: str = "news", max_results: int = 30) -> str:
+            """
+            Search deeper by reading several result pages of one search type in a single call.
+            Use when search_tool did not return enough results.
+
+            Args:
+                query: 검색 쿼리
+                search_type: 검색 타입 (news, blog, webkr, kin, doc)
+                max_results: 최대 결과 수 (최대 100)
+            """
+            print("============ Deep Search Information ===============")
+            print(f"Query: {query}, type: {search_type}, max_results: {max_results}")
+
+            try:
+                result = await self.naver_component.adeep_search(
+                    query,
+                    max_items=max(1, min(max_results, 100)),
+                    search_type=search_type
+                )
+
+                print(f"Search API Response: {result}")
+
+                if result and EMPTY_RESULT not in result:
+                    return result
+                else:
+                    return "검색 결과 없음. 다른 검색어를 시도해보세요."
+
+            except Exception as e:
+                error_msg = f"검색에 실패했습니다: {str(e)}"
+                print(f"Error: {error_msg}")
+                return f"오류: {error_msg}"
 
         # 도구 생성
         self.search_tool = tool(search_tool)
+        tools = [self.search_tool]
+        if self.naver_component is not None:
+            self.deep_search_tool = tool(deep_search_tool)
+            tools.append(self.deep_search_tool)
 
-        # 프롬프트 가져오기
-        prompt = get_prompt('search')
+        # 프롬프트 가져오기 (deep_search_tool은 등록된 경우에만 안내)
+        deep_search = self.naver_component is not None
+        prompt = get_prompt('search').format(
+            deep_search_tool=DEEP_SEARCH_TOOL_PROMPT if deep_search else "",
+            search_fallback=DEEP_SEARCH_FALLBACK_PROMPT if deep_search else SEARCH_FALLBACK_PROMPT
+        )
         
         # React Agent 생성
         self.agent = create_react_agent(
             self.llm,
-            tools=[self.search_tool],
+            tools=tools,
             prompt=prompt
         )
     
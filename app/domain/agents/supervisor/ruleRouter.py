@@ -0,0 +1,141 @@
+"""
+규칙 기반 사전 라우터
+
+명확한 요청(인사, 일정 등록, 메일 발송 등)은 Supervisor LLM 호출 없이 바로 라우팅합니다.
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.config.routing_rules import ROUTING_RULES, ROUTER_CONFIG
+
+
+@dataclass
+class RouteDecision:
+    """사전 라우팅 결과"""
+    member: str
+    confidence: float
+    rule_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _CompiledRule:
+    id: str
+    member: str
+    weight: float
+    pattern: Optional[re.Pattern] = None
+    keywords: List[str] = field(default_factory=list)
+
+    def matches(self, text: str) -> bool:
+        if self.pattern is not None and self.pattern.search(text):
+            return True
+        return any(keyword in text for keyword in self.keywords)
+
+
+class RuleRouter:
+    """키워드/정규식 규칙으로 멤버별 신뢰도를 계산하는 라우터"""
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        confidence_threshold: Optional[float] = None,
+        multi_step_pattern: Optional[str] = None,
+        enabled: Optional[bool] = None
+    ):
+        rules = ROUTING_RULES if rules is None else rules
+        self.confidence_threshold = (
+            ROUTER_CONFIG["confidence_threshold"] if confidence_threshold is None else confidence_threshold
+        )
+        self.multi_step_pattern = re.compile(
+            ROUTER_CONFIG["multi_step_pattern"] if multi_step_pattern is None else multi_step_pattern,
+            re.IGNORECASE
+        )
+        self.enabled = ROUTER_CONFIG["enabled"] if enabled is None else enabled
+
+        self.rules: List[_CompiledRule] = []
+        for member, member_rules in rules.items():
+            for rule in member_rules:
+                pattern = rule.get("pattern")
+                self.rules.append(_CompiledRule(
+                    id=rule["id"],
+                    member=member,
+                    weight=rule["weight"],
+                    pattern=re.compile(pattern, re.IGNORECASE) if pattern else None,
+                    keywords=[keyword.lower() for keyword in rule.get("keywords", [])],
+                ))
+
+        # 통계
+        self._lock = threading.Lock()
+        self.evaluations = 0
+        self.routed = 0
+        self.rule_matches: Dict[str, int] = {rule.id: 0 for rule in self.rules}
+        self.rule_routed: Dict[str, int] = {rule.id: 0 for rule in self.rules}
+
+    def route(self, text: str) -> Optional[RouteDecision]:
+        """
+        텍스트를 규칙으로 분류합니다.
+
+        Args:
+            text: 사용자 메시지
+
+        Returns:
+            한 멤버의 규칙만 매칭되고 신뢰도가 임계값 이상이면 RouteDecision, 아니면 None (LLM 사용)
+        """
+        if not self.enabled:
+            return None
+
+        text_lower = text.lower()
+        scores: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = {}
+
+        for rule in self.rules:
+            if rule.matches(text_lower):
+                scores[rule.member] = scores.get(rule.member, 0.0) + rule.weight
+                matched.setdefault(rule.member, []).append(rule.id)
+
+        decision = None
+        # 여러 멤버가 매칭되었거나 순서/연결 표현이 있으면 복합 요청일 수 있으므로 LLM이 multi_step을 판단
+        if len(scores) == 1 and not self.multi_step_pattern.search(text_lower):
+            member, score = next(iter(scores.items()))
+            confidence = min(score, 1.0)
+            if confidence >= self.confidence_threshold:
+                decision = RouteDecision(member=member, confidence=confidence, rule_ids=matched[member])
+
+        with self._lock:
+            self.evaluations += 1
+            for rule_ids in matched.values():
+                for rule_id in rule_ids:
+                    self.rule_matches[rule_id] += 1
+            if decision:
+                self.routed += 1
+                for rule_id in decision.rule_ids:
+                    self.rule_routed[rule_id] += 1
+
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        """규칙별 적중률을 반환합니다."""
+        with self._lock:
+            evaluations = self.evaluations
+            return {
+                "enabled": self.enabled,
+                "evaluations": evaluations,
+                "routed": self.routed,
+                "llm_fallbacks": evaluations - self.routed,
+                "hit_rate": round(self.routed / evaluations, 4) if evaluations else 0.0,
+                "rules": {
+                    rule.id: {
+                        "member": rule.member,
+                        "matches": self.rule_matches[rule.id],
+                        "routed": self.rule_routed[rule.id],
+                        "match_rate": round(self.rule_matches[rule.id] / evaluations, 4) if evaluations else 0.0,
+                    }
+                    for rule in self.rules
+                },
+            }
+
+
+# 전역 규칙 라우터 인스턴스
+rule_router = RuleRouter()
@@ -1,19 +1,42 @@
-from typing import Literal
+from typing import List, Literal
 
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.config.ai import openai_chat
 from app.config.prompts import get_prompt
+from app.config.settings import settings
+from app.domain.agents.supervisor.ruleRouter import RuleRouter, rule_router
+from app.domain.graph.context import context_builder
+from app.domain.graph.metrics import graph_metrics
+
+
+class PlanStep(BaseModel):
+    id: int = Field(description="Step number, unique within the plan")
+    member: Literal["Researcher", "Calender", "Chat", "Mail"]
+    task: str = Field(description="Self-contained instruction for the worker")
+    depends_on: List[int] = Field(
+        default_factory=list,
+        description="Ids of steps whose results this step needs (empty if independent)"
+    )
 
 
 class routeResponse(BaseModel):
     next: Literal["FINISH", "Researcher", "Calender", "Chat", "Mail"]
+    multi_step: bool = Field(
+        default=False,
+        description="True if the user's request needs more than one worker to complete"
+    )
+    plan: List[PlanStep] = Field(
+        default_factory=list,
+        description="For multi_step requests, one step per worker task; independent steps run in parallel"
+    )
 
 
 class Supervisor:
-    def __init__(self, llm=None):
+    def __init__(self, llm=None, router: RuleRouter = None):
         self.llm = llm or openai_chat
+        self.router = router or rule_router
 
         self.members = ["Researcher", "Calender", "Chat", "Mail"]
         
@@ -35,5 +58,15 @@ class Supervisor:
                 | self.llm.with_structured_output(routeResponse)
         )
 
-    def invoke(self, state):
-        return self.chain.invoke(state)
+    async def invoke(self, state):
+        # 사용자 요청에 대한 첫 라우팅은 규칙 라우터로 먼저 시도
+        latest = state["messages"][-1] if state["messages"] else None
+        if latest is not None and latest.type == "human" and not getattr(latest, "name", None):
+            decision = self.router.route(latest.content)
+            if decision:
+                return routeResponse(next=decision.member)
+
+        # 라우팅에는 최근 대화만 필요하므로 supervisor 전용 토큰 예산으로 자름
+        messages = context_builder.fit(state["messages"], settings.CONTEXT_SUPERVISOR_TOKEN_BUDGET)
+        graph_metrics.record_supervisor_llm_call()
+        return await self.chain.ainvoke({**state, "messages": messages})
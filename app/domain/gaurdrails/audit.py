@@ -0,0 +1,186 @@
+"""
+저장된 대화 재검사 작업
+
+패턴이 바뀌었을 때 대화 저장소의 모든 메시지를 현재 패턴으로 다시 검사합니다.
+검사는 워커 스레드(와 큰 저장소의 경우 프로세스 풀)에서 수행하고,
+진행 상황과 차단/경고 항목은 작업 객체에서 조회합니다.
+"""
+
+import asyncio
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config.guardrail_patterns import GUARDRAIL_CONFIG
+from app.domain.gaurdrails.guardrails import GuardrailSystem, guardrail_system
+
+
+@dataclass
+class RescanJob:
+    """재검사 작업 상태"""
+    id: str
+    source: str
+    pattern_version: str
+    total: int
+    status: str = "pending"  # pending, running, completed, cancelled, failed
+    scanned: int = 0
+    blocked: int = 0
+    warnings: int = 0
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    findings_truncated: bool = False
+    error: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def running(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def get_info(self, include_findings: bool = True) -> Dict[str, Any]:
+        """진행 상황을 반환합니다."""
+        info = {
+            "id": self.id,
+            "source": self.source,
+            "status": self.status,
+            "pattern_version": self.pattern_version,
+            "total": self.total,
+            "scanned": self.scanned,
+            "progress": round(self.scanned / self.total, 4) if self.total else 1.0,
+            "blocked": self.blocked,
+            "warnings": self.warnings,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_findings:
+            info["findings"] = list(self.findings)
+            info["findings_truncated"] = self.findings_truncated
+        return info
+
+
+class GuardrailAudit:
+    """재검사 작업 관리자 (한 번에 하나의 작업만 실행)"""
+
+    def __init__(self, guardrail_system: GuardrailSystem, max_findings: int = 1000, max_jobs: int = 10):
+        """
+        Args:
+            guardrail_system: 검사에 사용할 가드레일 시스템
+            max_findings: 작업마다 보관할 최대 차단/경고 항목 수
+            max_jobs: 보관할 최근 작업 수
+        """
+        self.guardrail_system = guardrail_system
+        self.max_findings = max_findings
+        self.max_jobs = max_jobs
+        self.jobs: Dict[str, RescanJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def current(self) -> Optional[RescanJob]:
+        """실행 중인 작업을 반환합니다."""
+        return next((job for job in self.jobs.values() if job.running), None)
+
+    def start(self, memory, source: str = "chat_memory", close_memory: bool = False) -> RescanJob:
+        """
+        대화 저장소 재검사 작업을 시작합니다.
+
+        Args:
+            memory: iter_all_messages를 지원하는 대화 저장소
+            source: 작업 정보에 표시할 저장소 이름
+            close_memory: 작업이 끝나면 저장소를 닫을지 여부 (덤프 파일을 열어 검사하는 경우)
+
+        Returns:
+            시작된 작업
+
+        Raises:
+            RuntimeError: 이미 실행 중인 작업이 있는 경우
+        """
+        if self.current() is not None:
+            raise RuntimeError(f"재검사 작업 {self.current().id}이(가) 이미 실행 중입니다.")
+
+        job = RescanJob(
+            id=uuid.uuid4().hex[:12],
+            source=source,
+            pattern_version=self.guardrail_system.patterns.version,
+            total=memory.get_total_messages(),
+        )
+        self.jobs[job.id] = job
+        self._prune()
+        self._tasks[job.id] = asyncio.create_task(self._run(job, memory, close_memory))
+        return job
+
+    def get(self, job_id: str) -> Optional[RescanJob]:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[RescanJob]:
+        """작업 취소를 요청합니다. 진행 중인 작업 단위가 끝나면 멈춥니다."""
+        job = self.jobs.get(job_id)
+        if job is not None and job.running:
+            job.cancel_event.set()
+        return job
+
+    async def stop(self) -> None:
+        """실행 중인 작업을 취소하고 끝날 때까지 기다립니다."""
+        for job in self.jobs.values():
+            job.cancel_event.set()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _run(self, job: RescanJob, memory, close_memory: bool) -> None:
+        job.status = "running"
+        job.started_at = datetime.now().isoformat()
+        try:
+            await asyncio.to_thread(self._scan, job, memory)
+            job.status = "cancelled" if job.cancel_event.is_set() else "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            print(f"Guardrail rescan {job.id} failed: {str(e)}")
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            self._tasks.pop(job.id, None)
+            if close_memory:
+                memory.close()
+            print(
+                f"Guardrail rescan {job.id} {job.status}: "
+                f"{job.scanned}/{job.total} scanned, {job.blocked} blocked, {job.warnings} warnings"
+            )
+
+    def _scan(self, job: RescanJob, memory) -> None:
+        verdicts = self.guardrail_system.scan_memory(memory)
+        try:
+            for key, result in verdicts:
+                if job.cancel_event.is_set():
+                    break
+                job.scanned += 1
+                if result.is_safe and not result.blocked_keywords:
+                    continue
+                if result.is_safe:
+                    job.warnings += 1
+                else:
+                    job.blocked += 1
+                if len(job.findings) >= self.max_findings:
+                    job.findings_truncated = True
+                    continue
+                session_id, _, position = key.rpartition(":")
+                job.findings.append({
+                    "session_id": session_id,
+                    "position": int(position),
+                    "is_safe": result.is_safe,
+                    "reason": result.reason,
+                    "keywords": result.blocked_keywords,
+                })
+        finally:
+            verdicts.close()
+        # 순회 중 추가된 메시지까지 검사했으면 전체 수를 맞춤
+        job.total = max(job.total, job.scanned)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if not job.running]
+        for job_id in finished[:max(0, len(self.jobs) - self.max_jobs)]:
+            del self.jobs[job_id]
+
+
+# 전역 재검사 작업 관리자
+guardrail_audit = GuardrailAudit(guardrail_system, max_findings=GUARDRAIL_CONFIG.get("audit_max_findings", 1000))
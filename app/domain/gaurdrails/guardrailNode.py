@@ -5,9 +5,16 @@
 """
 
 from typing import Dict, Any
+from langchain_core.messages import AIMessage
 from app.domain.gaurdrails.guardrails import guardrail_system
 
 
+def _is_agent_output(message) -> bool:
+    """에이전트가 생성한 응답 메시지인지 확인합니다. (AI 메시지 또는 에이전트 이름이 붙은 메시지)"""
+    message_type = getattr(message, "type", None)
+    return message_type == "ai" or (message_type == "human" and bool(getattr(message, "name", None)))
+
+
 def input_guardrail_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     사용자 입력을 검사하는 가드레일 노드
@@ -16,19 +23,23 @@ def input_guardrail_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
         
     Returns:
-        검사 결과를 포함한 상태
+        검사 결과 상태 업데이트
     """
     messages = state.get("messages", [])
     
-    # 사용자의 마지막 메시지 찾기
-    user_messages = [msg for msg in messages if hasattr(msg, 'type') and msg.type == "human"]
+    # 이번 턴의 입력 메시지는 출력 가드레일 검사 대상에서 제외
+    update: Dict[str, Any] = {"output_guardrail_checked": len(messages)}
     
-    if not user_messages:
-        # 사용자 메시지가 없으면 그대로 통과
-        return state
+    # 사용자의 마지막 메시지 찾기 (뒤에서부터)
+    latest_user_message = None
+    for msg in reversed(messages):
+        if getattr(msg, "type", None) == "human":
+            latest_user_message = msg.content
+            break
     
-    # 가장 최근 사용자 메시지 검사
-    latest_user_message = user_messages[-1].content
+    if latest_user_message is None:
+        # 사용자 메시지가 없으면 그대로 통과
+        return update
     
     # 가드레일 검사
     safety_result = guardrail_system.check_input_safety(latest_user_message)
@@ -42,54 +53,67 @@ def input_guardrail_node(state: Dict[str, Any]) -> Dict[str, Any]:
             response += f"\n\n💡 제안: {', '.join(safety_result.suggestions)}"
         
         # 가드레일 차단 정보를 상태에 추가
-        state["guardrail_blocked"] = True
-        state["guardrail_response"] = response
-        state["guardrail_reason"] = safety_result.reason
+        update["guardrail_blocked"] = True
+        update["guardrail_message"] = response
+        update["guardrail_reason"] = safety_result.reason
         
         print(f"🛡️ Input Guardrail blocked: {safety_result.reason}")
         print(f"Blocked keywords: {safety_result.blocked_keywords}")
     
-    return state
+    return update
+
+
+def output_guardrail_block_update(safety_result) -> Dict[str, Any]:
+    """
+    출력 가드레일 차단 시의 상태 업데이트를 생성합니다.
+    
+    Args:
+        safety_result: 차단된 검사 결과
+        
+    Returns:
+        차단 정보 상태 업데이트
+    """
+    print(f"🛡️ Output Guardrail blocked: {safety_result.reason}")
+    print(f"Blocked keywords: {safety_result.blocked_keywords}")
+    
+    return {
+        "output_guardrail_blocked": True,
+        "output_guardrail_message": "죄송합니다. 안전하지 않은 내용이 포함된 응답이 생성되었습니다. 다시 시도해주세요.",
+        "output_guardrail_reason": safety_result.reason,
+    }
 
 
 def output_guardrail_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     AI 응답을 검사하는 가드레일 노드
     
+    턴 내에서 이미 검사한 위치(watermark) 이후에 추가된 에이전트 응답만 검사합니다.
+    
     Args:
         state: 현재 상태
         
     Returns:
-        검사 결과를 포함한 상태
+        검사 결과 상태 업데이트
     """
     messages = state.get("messages", [])
+    checked = state.get("output_guardrail_checked", 0)
+    update: Dict[str, Any] = {"output_guardrail_checked": len(messages)}
     
-    # AI의 마지막 응답 찾기
-    ai_messages = [msg for msg in messages if hasattr(msg, 'type') and msg.type == "ai"]
-    
-    if not ai_messages:
-        # AI 응답이 없으면 그대로 통과
-        return state
-    
-    # 가장 최근 AI 응답 검사
-    latest_ai_message = ai_messages[-1].content
-    
-    # 가드레일 검사
-    safety_result = guardrail_system.check_input_safety(latest_ai_message)
-    
-    if not safety_result.is_safe:
-        # 안전하지 않은 응답에 대한 대체 메시지 생성
-        response = "죄송합니다. 안전하지 않은 내용이 포함된 응답이 생성되었습니다. 다시 시도해주세요."
+    for index in range(checked, len(messages)):
+        message = messages[index]
+        if not _is_agent_output(message):
+            continue
         
-        # 가드레일 차단 정보를 상태에 추가
-        state["output_guardrail_blocked"] = True
-        state["output_guardrail_response"] = response
-        state["output_guardrail_reason"] = safety_result.reason
+        # 가드레일 검사
+        safety_result = guardrail_system.check_input_safety(message.content)
+        if safety_result.is_safe:
+            continue
         
-        print(f"🛡️ Output Guardrail blocked: {safety_result.reason}")
-        print(f"Blocked keywords: {safety_result.blocked_keywords}")
+        # 안전하지 않은 응답에 대한 대체 메시지와 차단 정보를 상태에 추가
+        update.update(output_guardrail_block_update(safety_result))
+        break
     
-    return state
+    return update
 
 
 def check_guardrail_blocked(state: Dict[str, Any]) -> str:
@@ -122,21 +146,15 @@ def guardrail_response_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
         
     Returns:
-        가드레일 응답을 포함한 상태
+        가드레일 응답 상태 업데이트
     """
-    from langchain_core.messages import AIMessage
-    
-    response = state.get("guardrail_response", "죄송합니다. 안전상의 이유로 해당 요청을 처리할 수 없습니다.")
+    response = state.get("guardrail_message", "죄송합니다. 안전상의 이유로 해당 요청을 처리할 수 없습니다.")
     
-    # AI 메시지로 응답 생성
+    # AI 메시지로 응답 생성 (reducer가 기존 메시지 뒤에 추가)
     ai_message = AIMessage(content=response)
     
-    # 메시지 리스트에 추가
-    messages = state.get("messages", [])
-    messages.append(ai_message)
-    
     return {
-        "messages": messages,
+        "messages": [ai_message],
         "next": "FINISH"  # 가드레일 차단 시 바로 종료
     }
 
@@ -149,20 +167,14 @@ def output_guardrail_response_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: 현재 상태
         
     Returns:
-        가드레일 응답을 포함한 상태
+        가드레일 응답 상태 업데이트
     """
-    from langchain_core.messages import AIMessage
+    response = state.get("output_guardrail_message", "죄송합니다. 안전하지 않은 응답이 생성되었습니다.")
     
-    response = state.get("output_guardrail_response", "죄송합니다. 안전하지 않은 응답이 생성되었습니다.")
-    
-    # AI 메시지로 응답 생성
+    # AI 메시지로 응답 생성 (reducer가 기존 메시지 뒤에 추가)
     ai_message = AIMessage(content=response)
     
-    # 메시지 리스트에 추가
-    messages = state.get("messages", [])
-    messages.append(ai_message)
-    
     return {
-        "messages": messages,
+        "messages": [ai_message],
         "next": "FINISH"  # 가드레일 차단 시 바로 종료
     } 
\ No newline at end of file
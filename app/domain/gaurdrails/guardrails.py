@@ -4,19 +4,26 @@ LLM 가드레일 시스템
 입력 검증과 안전성을 위한 가드레일을 제공합니다.
 """
 
+import asyncio
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Tuple, Optional, Union
+from dataclasses import dataclass, replace
 
 from app.config.guardrail_patterns import (
-    FORBIDDEN_PATTERNS,
-    WARNING_PATTERNS,
-    SPAM_PATTERNS,
     EMAIL_SPECIFIC_PATTERNS,
-    CALENDAR_SPECIFIC_PATTERNS,
-    SEARCH_SPECIFIC_PATTERNS,
     GUARDRAIL_CONFIG
 )
+from app.config.settings import settings
+from app.domain.gaurdrails.matcher import PatternMatcher
+from app.domain.gaurdrails.patternSet import GuardrailPatternSet, load_pattern_set
 
 
 @dataclass
@@ -34,31 +41,153 @@ class GuardrailResult:
             self.suggestions = []
 
 
+class GuardrailCache:
+    """
+    가드레일 검사 결과 LRU 캐시
+    
+    정규화된 텍스트의 해시를 키로 GuardrailResult를 저장합니다.
+    패턴 집합 버전이 바뀌면 저장된 결과를 모두 버립니다.
+    """
+    
+    def __init__(self, max_size: int = 4096):
+        """
+        Args:
+            max_size: 최대 저장 결과 수
+        """
+        self.max_size = max_size
+        self.version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[bytes, GuardrailResult]" = OrderedDict()
+        # 동기 그래프 노드는 워커 스레드에서 실행되므로 잠금으로 보호
+        self._lock = threading.Lock()
+    
+    def get(self, version: str, key: bytes) -> Optional[GuardrailResult]:
+        with self._lock:
+            if version != self.version:
+                # 패턴이 바뀌었으면 이전 결과는 사용할 수 없음
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.version = version
+            
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy_result(result)
+    
+    def put(self, version: str, key: bytes, result: GuardrailResult):
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = _copy_result(result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "pattern_version": self.version,
+            }
+
+
+def _copy_result(result: GuardrailResult) -> GuardrailResult:
+    """호출한 쪽에서 키워드 목록을 바꿔도 캐시가 영향받지 않도록 복사합니다."""
+    return replace(
+        result,
+        blocked_keywords=list(result.blocked_keywords),
+        suggestions=list(result.suggestions)
+    )
+
+
 class GuardrailSystem:
     """LLM 가드레일 시스템"""
     
-    def __init__(self):
-        # Config에서 패턴 가져오기
-        self.forbidden_patterns = FORBIDDEN_PATTERNS
-        self.warning_patterns = WARNING_PATTERNS
-        self.spam_patterns = SPAM_PATTERNS
-        
+    def __init__(self, patterns_path: Optional[str] = None, patterns: Optional[GuardrailPatternSet] = None):
+        """
+        Args:
+            patterns_path: 버전이 붙은 패턴 파일 경로 (None이면 guardrail_patterns.py의 기본 패턴)
+            patterns: 사용할 패턴 세트 (지정하면 파일을 읽지 않음, 일괄 검사 워커 프로세스용)
+        """
         # 설정값 가져오기
-        self.spam_threshold = GUARDRAIL_CONFIG["spam_threshold"]
-        self.warning_threshold = GUARDRAIL_CONFIG["warning_threshold"]
         self.response_templates = GUARDRAIL_CONFIG["response_templates"]
         self.suggestions = GUARDRAIL_CONFIG["suggestions"]
         
         # 이메일 특화 설정
         self.email_pattern = EMAIL_SPECIFIC_PATTERNS["email_pattern"]
         self.max_recipients = EMAIL_SPECIFIC_PATTERNS["max_recipients"]
-        self.email_forbidden = EMAIL_SPECIFIC_PATTERNS["email_forbidden"]
         
-        # 캘린더 특화 설정
-        self.calendar_forbidden = CALENDAR_SPECIFIC_PATTERNS["calendar_forbidden"]
-        
-        # 검색 특화 설정
-        self.search_forbidden = SEARCH_SPECIFIC_PATTERNS["search_forbidden"]
+        # 패턴과 컴파일된 매처는 하나의 스냅샷으로 교체됨
+        # 검사는 시작 시점의 스냅샷을 끝까지 사용하므로 교체 중에도 일관된 결과를 반환
+        self.patterns_path = patterns_path
+        self.patterns: GuardrailPatternSet = patterns or load_pattern_set(patterns_path)
+        self.reloads = 0
+        self.reload_errors = 0
+        self.last_reload_error: Optional[str] = None
+        self._watched_mtime = self._patterns_mtime()
+        self._reload_lock = asyncio.Lock()
+        self._watcher: Optional[asyncio.Task] = None
+        
+        # 같은 텍스트의 반복 검사를 피하기 위한 결과 캐시
+        self.cache = GuardrailCache(GUARDRAIL_CONFIG.get("cache_size", 4096))
+    
+    @property
+    def matcher(self) -> PatternMatcher:
+        return self.patterns.matcher
+    
+    @property
+    def forbidden_patterns(self) -> List[str]:
+        return self.patterns.patterns["forbidden"]
+    
+    @property
+    def warning_patterns(self) -> List[str]:
+        return self.patterns.patterns["warning"]
+    
+    @property
+    def spam_patterns(self) -> List[str]:
+        return self.patterns.patterns["spam"]
+    
+    @property
+    def email_forbidden(self) -> List[str]:
+        return self.patterns.patterns["email_forbidden"]
+    
+    @property
+    def calendar_forbidden(self) -> List[str]:
+        return self.patterns.patterns["calendar_forbidden"]
+    
+    @property
+    def search_forbidden(self) -> List[str]:
+        return self.patterns.patterns["search_forbidden"]
+    
+    @property
+    def spam_threshold(self) -> int:
+        return self.patterns.spam_threshold
+    
+    @property
+    def warning_threshold(self) -> int:
+        return self.patterns.warning_threshold
+    
+    @property
+    def pattern_version(self) -> str:
+        """판정에 영향을 주는 패턴과 임계값의 버전"""
+        return self.patterns.fingerprint
     
     def check_input_safety(self, text: str) -> GuardrailResult:
         """
@@ -70,30 +199,224 @@ class GuardrailSystem:
         Returns:
             GuardrailResult: 검사 결과
         """
-        text_lower = text.lower()
-        blocked_keywords = []
-        
-        # 금지 패턴 검사
-        for pattern in self.forbidden_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                blocked_keywords.extend(matches)
-        
-        # 스팸 패턴 검사
-        spam_matches = []
-        for pattern in self.spam_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                spam_matches.extend(matches)
-        
-        # 경고 패턴 검사
-        warning_matches = []
-        for pattern in self.warning_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                warning_matches.extend(matches)
-        
-        # 결과 판정
+        patterns = self.patterns
+        key = hashlib.blake2b(patterns.matcher.normalize(text).encode("utf-8"), digest_size=16).digest()
+        cached = self.cache.get(patterns.fingerprint, key)
+        if cached is not None:
+            return cached
+        
+        result = self._scan(text, patterns)
+        self.cache.put(patterns.fingerprint, key, result)
+        return result
+    
+    def _scan(self, text: str, patterns: GuardrailPatternSet) -> GuardrailResult:
+        """캐시 없이 금지/스팸/경고 패턴을 한 번에 검사합니다."""
+        hits = patterns.matcher.scan(text)
+        return self._evaluate(hits["forbidden"], hits["spam"], hits["warning"], patterns)
+    
+    def scan_batch(
+        self,
+        items: Iterable[Union[str, Tuple[Any, str]]],
+        processes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        pool_threshold: Optional[int] = None
+    ) -> Iterator[Tuple[Any, GuardrailResult]]:
+        """
+        여러 텍스트를 일괄 검사하고 결과를 입력 순서대로 하나씩 반환합니다.
+        
+        입력은 작업 단위(chunk_size)로 나누어 처리합니다. 처음 pool_threshold개의 텍스트는
+        현재 프로세스에서 검사하고, 그보다 큰 입력의 나머지는 프로세스 풀에 나누어 검사합니다.
+        진행 중인 작업 수를 제한하므로 입력 전체를 메모리에 올리지 않습니다.
+        결과 캐시는 사용하지도 채우지도 않으며, 검사 시작 시점의 패턴 세트로 끝까지 검사합니다.
+        
+        Args:
+            items: 텍스트 또는 (키, 텍스트) 쌍 (텍스트만 주면 키는 입력 순번)
+            processes: 프로세스 수 (None이면 설정값, 1이면 현재 프로세스에서 검사)
+            chunk_size: 작업 단위 텍스트 수 (None이면 설정값)
+            pool_threshold: 프로세스 풀 없이 검사할 텍스트 수 (None이면 설정값)
+            
+        Yields:
+            (키, GuardrailResult)
+        """
+        patterns = self.patterns
+        chunk_size = chunk_size or GUARDRAIL_CONFIG.get("batch_chunk_size", 1000)
+        if processes is None:
+            processes = GUARDRAIL_CONFIG.get("batch_processes") or os.cpu_count() or 1
+        if pool_threshold is None:
+            pool_threshold = GUARDRAIL_CONFIG.get("batch_pool_threshold", 50000)
+        
+        chunks = _chunked(_keyed(items), chunk_size)
+        scanned = 0
+        # 작은 입력은 프로세스 시작 비용 없이 현재 프로세스에서 검사
+        for chunk in chunks:
+            for key, text in chunk:
+                yield key, self._scan(text, patterns)
+            scanned += len(chunk)
+            if processes > 1 and scanned >= pool_threshold:
+                break
+        else:
+            return
+        
+        next_chunk = next(chunks, None)
+        if next_chunk is None:
+            return
+        
+        # 스레드가 실행 중인 서버 프로세스를 fork하지 않도록 spawn으로 워커 생성
+        pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=(patterns.to_build_args(),)
+        )
+        try:
+            pending = deque()
+            for chunk in itertools.chain([next_chunk], chunks):
+                pending.append(pool.submit(_scan_batch_chunk, chunk))
+                if len(pending) >= processes * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # 소비자가 중간에 멈추면 남은 작업은 취소
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def scan_memory(self, memory, **kwargs) -> Iterator[Tuple[str, GuardrailResult]]:
+        """
+        대화 저장소(ChatMemory, SqliteChatMemory)에 저장된 모든 메시지를 일괄 검사합니다.
+        
+        Args:
+            memory: iter_all_messages를 지원하는 대화 저장소
+            **kwargs: scan_batch 옵션
+            
+        Yields:
+            ("세션 ID:메시지 위치", GuardrailResult)
+        """
+        items = (
+            (f"{session_id}:{position}", _message_text(message))
+            for session_id, position, message in memory.iter_all_messages()
+        )
+        return self.scan_batch(items, **kwargs)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """검사 결과 캐시 통계를 반환합니다."""
+        return self.cache.get_stats()
+    
+    def get_pattern_stats(self) -> Dict[str, Any]:
+        """활성 패턴 세트 버전과 리로드 통계를 반환합니다."""
+        return {
+            **self.patterns.get_info(),
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "last_reload_error": self.last_reload_error,
+            "watching": self._watcher is not None and not self._watcher.done(),
+        }
+    
+    async def reload_patterns(self, path: Optional[str] = None) -> GuardrailPatternSet:
+        """
+        패턴 파일을 다시 읽어 활성 패턴 세트를 교체합니다.
+        
+        컴파일은 워커 스레드에서 수행하고 완료된 세트를 한 번에 교체하므로,
+        요청 처리를 막지 않고 진행 중인 검사는 이전 버전으로 끝납니다.
+        
+        Args:
+            path: 패턴 파일 경로 (None이면 설정된 경로)
+            
+        Returns:
+            새로 활성화된 패턴 세트
+            
+        Raises:
+            ValueError: 경로가 없거나 파일이 잘못된 경우 (기존 패턴 유지)
+        """
+        path = path or self.patterns_path
+        if not path:
+            raise ValueError("GUARDRAIL_PATTERNS_PATH가 설정되지 않았습니다.")
+        
+        async with self._reload_lock:
+            try:
+                mtime = self._patterns_mtime(path)
+                patterns = await asyncio.to_thread(GuardrailPatternSet.from_file, path)
+            except (OSError, ValueError) as e:
+                self.reload_errors += 1
+                self.last_reload_error = str(e)
+                raise ValueError(f"패턴 파일을 불러오지 못했습니다: {e}")
+            
+            # 원자적 교체 (이후 시작되는 검사부터 새 버전 사용, 결과 캐시는 fingerprint로 자동 무효화)
+            previous = self.patterns
+            self.patterns = patterns
+            self.patterns_path = path
+            self._watched_mtime = mtime
+            self.reloads += 1
+            self.last_reload_error = None
+            print(f"Guardrail patterns reloaded: {previous.version} -> {patterns.version}")
+            return patterns
+    
+    def start_watcher(self, interval: float) -> None:
+        """패턴 파일이 바뀌면 자동으로 다시 읽도록 주기적으로 확인합니다."""
+        if not self.patterns_path or interval <= 0:
+            return
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch_forever(interval))
+    
+    async def stop_watcher(self) -> None:
+        """패턴 파일 감시를 중지합니다."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+    
+    async def _watch_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            mtime = self._patterns_mtime()
+            if mtime is None or mtime == self._watched_mtime:
+                continue
+            try:
+                await self.reload_patterns()
+            except ValueError as e:
+                # 잘못된 파일은 같은 내용으로 반복해서 시도하지 않음
+                self._watched_mtime = mtime
+                print(f"Guardrail pattern watcher: {str(e)}")
+    
+    def _patterns_mtime(self, path: Optional[str] = None) -> Optional[int]:
+        path = path or self.patterns_path
+        if not path:
+            return None
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def stream_checker(self) -> "StreamingGuardrail":
+        """
+        스트리밍 응답을 청크 단위로 검사하는 검사기를 생성합니다.
+        
+        Returns:
+            StreamingGuardrail: 스트리밍 검사기
+        """
+        return StreamingGuardrail(self, self.patterns)
+    
+    def _evaluate(
+        self,
+        blocked_keywords: List[str],
+        spam_matches: List[str],
+        warning_matches: List[str],
+        patterns: GuardrailPatternSet
+    ) -> GuardrailResult:
+        """
+        매칭된 키워드로 안전성을 판정합니다.
+        
+        Args:
+            blocked_keywords: 금지 패턴 매칭 키워드
+            spam_matches: 스팸 패턴 매칭 키워드
+            warning_matches: 경고 패턴 매칭 키워드
+            patterns: 판정 임계값을 가진 패턴 세트
+            
+        Returns:
+            GuardrailResult: 검사 결과
+        """
         if blocked_keywords:
             return GuardrailResult(
                 is_safe=False,
@@ -102,7 +425,7 @@ class GuardrailSystem:
                 suggestions=self.suggestions["forbidden"]
             )
         
-        if len(spam_matches) >= self.spam_threshold:
+        if len(spam_matches) >= patterns.spam_threshold:
             return GuardrailResult(
                 is_safe=False,
                 reason="스팸/피싱 의심 키워드가 다수 포함되어 있습니다.",
@@ -110,7 +433,7 @@ class GuardrailSystem:
                 suggestions=self.suggestions["spam"]
             )
         
-        if len(warning_matches) >= self.warning_threshold:
+        if len(warning_matches) >= patterns.warning_threshold:
             return GuardrailResult(
                 is_safe=True,
                 reason="전문가 조언이 필요한 내용이 포함되어 있습니다.",
@@ -154,16 +477,14 @@ class GuardrailSystem:
             return body_result
         
         # 이메일 특화 금지 키워드 검사
-        email_text = f"{subject} {body}".lower()
-        for pattern in self.email_forbidden:
-            matches = re.findall(pattern, email_text, re.IGNORECASE)
-            if matches:
-                return GuardrailResult(
-                    is_safe=False,
-                    reason="이메일 특화 금지 키워드가 포함되어 있습니다.",
-                    blocked_keywords=matches,
-                    suggestions=self.suggestions["forbidden"]
-                )
+        matches = self.matcher.scan_first(f"{subject} {body}", "email")
+        if matches:
+            return GuardrailResult(
+                is_safe=False,
+                reason="이메일 특화 금지 키워드가 포함되어 있습니다.",
+                blocked_keywords=matches,
+                suggestions=self.suggestions["forbidden"]
+            )
         
         # 대량 발송 방지
         recipient_count = len([email.strip() for email in to.split(',')])
@@ -203,16 +524,14 @@ class GuardrailSystem:
             return description_result
         
         # 캘린더 특화 금지 키워드 검사
-        calendar_text = f"{title} {description}".lower()
-        for pattern in self.calendar_forbidden:
-            matches = re.findall(pattern, calendar_text, re.IGNORECASE)
-            if matches:
-                return GuardrailResult(
-                    is_safe=False,
-                    reason="캘린더 특화 금지 키워드가 포함되어 있습니다.",
-                    blocked_keywords=matches,
-                    suggestions=self.suggestions["forbidden"]
-                )
+        matches = self.matcher.scan_first(f"{title} {description}", "calendar")
+        if matches:
+            return GuardrailResult(
+                is_safe=False,
+                reason="캘린더 특화 금지 키워드가 포함되어 있습니다.",
+                blocked_keywords=matches,
+                suggestions=self.suggestions["forbidden"]
+            )
         
         return GuardrailResult(
             is_safe=True,
@@ -236,16 +555,14 @@ class GuardrailSystem:
             return basic_result
         
         # 검색 특화 금지 키워드 검사
-        query_lower = query.lower()
-        for pattern in self.search_forbidden:
-            matches = re.findall(pattern, query_lower, re.IGNORECASE)
-            if matches:
-                return GuardrailResult(
-                    is_safe=False,
-                    reason="검색 특화 금지 키워드가 포함되어 있습니다.",
-                    blocked_keywords=matches,
-                    suggestions=self.suggestions["forbidden"]
-                )
+        matches = self.matcher.scan_first(query, "search")
+        if matches:
+            return GuardrailResult(
+                is_safe=False,
+                reason="검색 특화 금지 키워드가 포함되어 있습니다.",
+                blocked_keywords=matches,
+                suggestions=self.suggestions["forbidden"]
+            )
         
         return GuardrailResult(
             is_safe=True,
@@ -285,5 +602,106 @@ class GuardrailSystem:
         return template.format(reason=reason)
     
 
+class StreamingGuardrail:
+    """
+    스트리밍 응답 검사기
+    
+    토큰 청크가 도착할 때마다 검사하여, 응답이 끝나기 전에 차단 여부를 알려줍니다.
+    판정 기준은 check_input_safety와 같으며 스팸 키워드 수는 스트림 전체에서 누적됩니다.
+    """
+    
+    def __init__(self, system: GuardrailSystem, patterns: GuardrailPatternSet):
+        self.system = system
+        # 스트림 도중 패턴이 교체되어도 시작 시점의 패턴으로 끝까지 검사
+        self.patterns = patterns
+        self.scanner = patterns.matcher.stream(GUARDRAIL_CONFIG.get("stream_lookback", 256))
+        self.blocked_keywords: List[str] = []
+        self.spam_matches: List[str] = []
+        self.warning_matches: List[str] = []
+        self.result: Optional[GuardrailResult] = None
+    
+    def feed(self, chunk: str) -> Optional[GuardrailResult]:
+        """
+        청크를 검사합니다.
+        
+        Args:
+            chunk: 새로 도착한 응답 조각
+            
+        Returns:
+            차단해야 하면 GuardrailResult, 아니면 None
+        """
+        if self.result is not None:
+            return self.result
+        return self._update(self.scanner.feed(chunk))
+    
+    def finish(self) -> GuardrailResult:
+        """
+        스트림 종료 시 남은 텍스트를 검사하고 최종 결과를 반환합니다.
+        
+        Returns:
+            GuardrailResult: 검사 결과
+        """
+        if self.result is not None:
+            return self.result
+        self._update(self.scanner.finish())
+        return self.result or self.system._evaluate(
+            self.blocked_keywords, self.spam_matches, self.warning_matches, self.patterns
+        )
+    
+    def _update(self, hits: Dict[str, List[str]]) -> Optional[GuardrailResult]:
+        if not hits:
+            return None
+        self.blocked_keywords.extend(hits.get("forbidden", []))
+        self.spam_matches.extend(hits.get("spam", []))
+        self.warning_matches.extend(hits.get("warning", []))
+        
+        result = self.system._evaluate(
+            self.blocked_keywords, self.spam_matches, self.warning_matches, self.patterns
+        )
+        if not result.is_safe:
+            self.result = result
+            return result
+        return None
+
+
+def _keyed(items: Iterable[Union[str, Tuple[Any, str]]]) -> Iterator[Tuple[Any, str]]:
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            yield index, item
+        else:
+            key, text = item
+            yield key, text
+
+
+def _chunked(items: Iterator[Tuple[Any, str]], size: int) -> Iterator[List[Tuple[Any, str]]]:
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _message_text(message) -> str:
+    """메시지 내용을 검사할 텍스트로 변환합니다. (멀티모달 내용은 JSON 문자열)"""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, ensure_ascii=False)
+
+
+# 일괄 검사 워커 프로세스의 가드레일 시스템 (프로세스마다 한 번 컴파일)
+_batch_worker_system: Optional[GuardrailSystem] = None
+
+
+def _init_batch_worker(build_args: Dict[str, Any]) -> None:
+    global _batch_worker_system
+    _batch_worker_system = GuardrailSystem(patterns=GuardrailPatternSet.build(**build_args))
+
+
+def _scan_batch_chunk(chunk: List[Tuple[Any, str]]) -> List[Tuple[Any, GuardrailResult]]:
+    system = _batch_worker_system
+    return [(key, system._scan(text, system.patterns)) for key, text in chunk]
+
+
 # 전역 가드레일 시스템 인스턴스
-guardrail_system = GuardrailSystem() 
\ No newline at end of file
+guardrail_system = GuardrailSystem(settings.GUARDRAIL_PATTERNS_PATH) 
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+가드레일 패턴 매처
+
+가드레일 패턴 설정을 로드 시점에 하나의 매처로 컴파일합니다.
+텍스트를 한 번만 훑어 카테고리별(forbidden, spam, warning, email, calendar, search)
+매칭 결과를 반환하며, 스트리밍 응답을 청크 단위로 검사하는 StreamScanner를 제공합니다.
+"""
+
+import hashlib
+import json
+import re
+from typing import Dict, List, Sequence, Tuple
+
+# 설정의 패턴은 대부분 \b(단어|단어|...)\b 형태의 단어 목록
+_LITERAL_PATTERN = re.compile(r'^\\b\((\w+(?:\|\w+)*)\)\\b$')
+_WORD = re.compile(r'\w+')
+_TRAILING_WORD = re.compile(r'\w+$')
+_LEADING_WORD = re.compile(r'^\w+')
+
+
+class PatternMatcher:
+    """
+    여러 카테고리의 패턴을 한 번의 스캔으로 검사하는 매처.
+
+    \\b(단어|...)\\b 형태의 패턴은 단어 경계 사이의 토큰 전체와 일치할 때만 매칭되므로,
+    텍스트의 토큰(\\w+)을 한 번 훑으면서 토큰 → (카테고리, 패턴 순번) 테이블을 조회하는
+    것으로 각 패턴의 re.findall 결과를 그대로 재현할 수 있습니다.
+    그 외 형태의 패턴은 컴파일된 정규식으로 따로 검사합니다.
+    """
+
+    def __init__(self, categories: Dict[str, Sequence[str]]):
+        """
+        Args:
+            categories: 카테고리 이름별 정규식 패턴 목록
+        """
+        self.categories = list(categories)
+        # 패턴 집합 버전 (패턴이 바뀌면 달라짐)
+        self.version = hashlib.sha256(
+            json.dumps(categories, ensure_ascii=False, sort_keys=True, default=list).encode("utf-8")
+        ).hexdigest()[:16]
+        self.pattern_count = 0
+        # 단어 목록 중 가장 긴 단어의 길이 (스트리밍 검사에서 보관할 미완성 토큰의 상한)
+        self.max_word_length = 0
+        self._table: Dict[str, List[Tuple[str, int]]] = {}
+        self._fallback: List[Tuple[str, int, re.Pattern]] = []
+
+        for category, patterns in categories.items():
+            for index, pattern in enumerate(patterns):
+                self.pattern_count += 1
+                literal = _LITERAL_PATTERN.match(pattern)
+                if literal is None:
+                    self._fallback.append((category, index, re.compile(pattern, re.IGNORECASE)))
+                    continue
+
+                # 한 패턴 안의 중복 단어는 한 번만 매칭됨
+                for word in dict.fromkeys(literal.group(1).lower().split("|")):
+                    self._table.setdefault(word, []).append((category, index))
+                    self.max_word_length = max(self.max_word_length, len(word))
+
+    def normalize(self, text: str) -> str:
+        """
+        매칭 결과가 같은 텍스트들이 같은 값이 되도록 정규화합니다.
+
+        매칭은 소문자 텍스트의 토큰 단위로 이루어지므로 대소문자와 공백의 차이는
+        결과에 영향을 주지 않습니다. 단어 목록이 아닌 패턴이 있으면 공백은 유지합니다.
+        """
+        text_lower = text.lower()
+        if self._fallback:
+            return text_lower
+        return " ".join(text_lower.split())
+
+    def stream(self, lookback: int = 256) -> "StreamScanner":
+        """
+        청크 단위로 텍스트를 검사하는 스캐너를 생성합니다.
+
+        Args:
+            lookback: 단어 목록이 아닌 패턴을 위해 다시 검사할 이전 텍스트 길이
+
+        Returns:
+            StreamScanner
+        """
+        return StreamScanner(self, lookback)
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """
+        텍스트를 한 번 훑어 카테고리별 매칭 키워드를 반환합니다.
+
+        카테고리별 결과는 기존처럼 패턴마다 re.findall 한 결과를 패턴 순서대로
+        이어 붙인 것과 같습니다.
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            카테고리별 매칭된 키워드 목록
+        """
+        return {
+            category: [keyword for _, keyword in found]
+            for category, found in self._collect(text).items()
+        }
+
+    def scan_first(self, text: str, category: str) -> List[str]:
+        """
+        카테고리에서 처음으로 매칭된 패턴의 키워드만 반환합니다.
+        (패턴을 순서대로 검사하다 첫 매칭에서 멈추던 기존 특화 검사와 같은 결과)
+
+        Args:
+            text: 검사할 텍스트
+            category: 카테고리 이름
+
+        Returns:
+            첫 번째로 매칭된 패턴의 키워드 목록 (없으면 빈 목록)
+        """
+        found = self._collect(text)[category]
+        if not found:
+            return []
+        first = found[0][0]
+        return [keyword for index, keyword in found if index == first]
+
+    def _token_hits(self, text_lower: str) -> List[Tuple[str, int, str]]:
+        """소문자 텍스트의 토큰 중 단어 목록에 있는 것을 (카테고리, 패턴 순번, 토큰)으로 반환합니다."""
+        hits = []
+        table = self._table
+        for match in _WORD.finditer(text_lower):
+            entries = table.get(match.group())
+            if entries is not None:
+                hits.extend((category, index, match.group()) for category, index in entries)
+        return hits
+
+    def _collect(self, text: str) -> Dict[str, List[Tuple[int, str]]]:
+        """카테고리별 (패턴 순번, 키워드) 목록을 패턴 순서, 텍스트 순서로 반환합니다."""
+        text_lower = text.lower()
+        hits: Dict[str, List[Tuple[int, int, str]]] = {category: [] for category in self.categories}
+
+        order = 0
+        table = self._table
+        for match in _WORD.finditer(text_lower):
+            entries = table.get(match.group())
+            if entries is None:
+                continue
+            for category, index in entries:
+                hits[category].append((index, order, match.group()))
+            order += 1
+
+        for category, index, pattern in self._fallback:
+            for found in pattern.findall(text_lower):
+                hits[category].append((index, order, found))
+                order += 1
+
+        result: Dict[str, List[Tuple[int, str]]] = {}
+        for category, found in hits.items():
+            if len(found) > 1:
+                found.sort(key=lambda hit: (hit[0], hit[1]))
+            result[category] = [(hit[0], hit[2]) for hit in found]
+        return result
+
+
+class StreamScanner:
+    """
+    스트리밍되는 텍스트를 청크 단위로 검사하는 스캐너.
+
+    청크 경계에 걸친 토큰은 다음 청크가 올 때까지 보관했다가 완성되면 검사합니다.
+    보관하는 미완성 토큰은 가장 긴 금지 단어 길이로 제한되며, 그보다 긴 토큰은
+    어떤 단어와도 같을 수 없으므로 끝날 때까지 건너뜁니다.
+    단어 목록이 아닌 패턴은 직전 lookback 글자를 함께 다시 검사합니다.
+    """
+
+    def __init__(self, matcher: PatternMatcher, lookback: int = 256):
+        self._matcher = matcher
+        self._lookback = lookback
+        self._pending = ""
+        self._skipping = False
+        self._window = ""
+
+    def feed(self, chunk: str) -> Dict[str, List[str]]:
+        """
+        청크를 검사하고 이번 청크에서 새로 완성된 매칭 키워드를 반환합니다.
+
+        Args:
+            chunk: 새로 도착한 텍스트 조각
+
+        Returns:
+            카테고리별 새 매칭 키워드
+        """
+        text = chunk.lower()
+        if self._skipping:
+            # 너무 긴 토큰의 나머지 부분은 건너뜀
+            leading = _LEADING_WORD.match(text)
+            if leading is not None:
+                if leading.end() == len(text):
+                    return {}
+                text = text[leading.end():]
+            self._skipping = False
+
+        text = self._pending + text
+        trailing = _TRAILING_WORD.search(text)
+        if trailing is None:
+            complete, self._pending = text, ""
+        else:
+            complete, self._pending = text[:trailing.start()], trailing.group()
+            if len(self._pending) > self._matcher.max_word_length:
+                self._pending = ""
+                self._skipping = True
+
+        return self._scan(complete)
+
+    def finish(self) -> Dict[str, List[str]]:
+        """스트림이 끝났을 때 남아 있는 토큰을 검사합니다."""
+        complete, self._pending = self._pending, ""
+        self._skipping = False
+        return self._scan(complete)
+
+    def _scan(self, complete: str) -> Dict[str, List[str]]:
+        if not complete:
+            return {}
+
+        hits: Dict[str, List[str]] = {}
+        for category, _, keyword in self._matcher._token_hits(complete):
+            hits.setdefault(category, []).append(keyword)
+
+        if self._matcher._fallback:
+            # 이전 텍스트에 걸친 매칭을 찾되, 이미 검사한 부분에서 끝나는 매칭은 제외
+            text = self._window + complete
+            offset = len(self._window)
+            for category, _, pattern in self._matcher._fallback:
+                for match in pattern.finditer(text):
+                    if match.end() > offset:
+                        hits.setdefault(category, []).append(match.group())
+            self._window = text[-self._lookback:]
+
+        return hits
@@ -0,0 +1,199 @@
+"""
+가드레일 패턴 세트
+
+판정에 사용하는 패턴, 임계값과 컴파일된 매처를 하나의 불변 스냅샷으로 묶습니다.
+기본값은 app/config/guardrail_patterns.py의 설정이며, 버전이 붙은 JSON 파일에서
+불러와 실행 중에 교체할 수 있습니다.
+
+패턴 파일 형식 (없는 항목은 기본 설정을 사용):
+    {
+        "version": "2025-01-01.1",
+        "forbidden": ["\\b(단어|단어)\\b", ...],
+        "warning": [...],
+        "spam": [...],
+        "email_forbidden": [...],
+        "calendar_forbidden": [...],
+        "search_forbidden": [...],
+        "spam_threshold": 2,
+        "warning_threshold": 1
+    }
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config.guardrail_patterns import (
+    FORBIDDEN_PATTERNS,
+    WARNING_PATTERNS,
+    SPAM_PATTERNS,
+    EMAIL_SPECIFIC_PATTERNS,
+    CALENDAR_SPECIFIC_PATTERNS,
+    SEARCH_SPECIFIC_PATTERNS,
+    GUARDRAIL_CONFIG
+)
+from app.domain.gaurdrails.matcher import PatternMatcher
+
+# 패턴 파일의 키와 기본 패턴
+DEFAULT_PATTERNS: Dict[str, List[str]] = {
+    "forbidden": FORBIDDEN_PATTERNS,
+    "warning": WARNING_PATTERNS,
+    "spam": SPAM_PATTERNS,
+    "email_forbidden": EMAIL_SPECIFIC_PATTERNS["email_forbidden"],
+    "calendar_forbidden": CALENDAR_SPECIFIC_PATTERNS["calendar_forbidden"],
+    "search_forbidden": SEARCH_SPECIFIC_PATTERNS["search_forbidden"],
+}
+
+
+@dataclass(frozen=True)
+class GuardrailPatternSet:
+    """가드레일 패턴 스냅샷 (교체만 가능하고 수정하지 않음)"""
+    version: str
+    source: str
+    patterns: Dict[str, List[str]]
+    spam_threshold: int
+    warning_threshold: int
+    matcher: PatternMatcher = field(repr=False)
+    fingerprint: str = ""
+    loaded_at: str = ""
+
+    @classmethod
+    def build(
+        cls,
+        patterns: Dict[str, List[str]],
+        spam_threshold: int,
+        warning_threshold: int,
+        version: str,
+        source: str
+    ) -> "GuardrailPatternSet":
+        """
+        패턴을 검증하고 매처로 컴파일합니다.
+
+        Raises:
+            ValueError: 잘못된 정규식이나 형식이 포함된 경우
+        """
+        for key, items in patterns.items():
+            if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+                raise ValueError(f"'{key}'는 문자열 패턴 목록이어야 합니다.")
+            for pattern in items:
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"'{key}'의 잘못된 패턴 {pattern!r}: {e}")
+
+        matcher = PatternMatcher({
+            "forbidden": patterns["forbidden"],
+            "spam": patterns["spam"],
+            "warning": patterns["warning"],
+            "email": patterns["email_forbidden"],
+            "calendar": patterns["calendar_forbidden"],
+            "search": patterns["search_forbidden"],
+        })
+        return cls(
+            version=version,
+            source=source,
+            patterns=patterns,
+            spam_threshold=spam_threshold,
+            warning_threshold=warning_threshold,
+            matcher=matcher,
+            # 판정에 영향을 주는 내용 전체의 해시 (결과 캐시 무효화에 사용)
+            fingerprint=f"{matcher.version}:{spam_threshold}:{warning_threshold}",
+            loaded_at=datetime.now().isoformat()
+        )
+
+    @classmethod
+    def from_config(cls) -> "GuardrailPatternSet":
+        """app/config/guardrail_patterns.py의 기본 설정으로 생성합니다."""
+        patterns = {key: list(items) for key, items in DEFAULT_PATTERNS.items()}
+        digest = hashlib.sha256(json.dumps(patterns, ensure_ascii=False).encode("utf-8")).hexdigest()[:8]
+        return cls.build(
+            patterns,
+            GUARDRAIL_CONFIG["spam_threshold"],
+            GUARDRAIL_CONFIG["warning_threshold"],
+            version=f"builtin-{digest}",
+            source="app/config/guardrail_patterns.py"
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> "GuardrailPatternSet":
+        """
+        버전이 붙은 JSON 패턴 파일에서 생성합니다.
+
+        Args:
+            path: 패턴 파일 경로
+
+        Raises:
+            ValueError: 파일 형식이 잘못된 경우
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data: Dict[str, Any] = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"패턴 파일을 읽을 수 없습니다: {e}")
+
+        if not isinstance(data, dict) or not data.get("version"):
+            raise ValueError("패턴 파일에는 version이 필요합니다.")
+
+        unknown = set(data) - set(DEFAULT_PATTERNS) - {"version", "spam_threshold", "warning_threshold"}
+        if unknown:
+            raise ValueError(f"알 수 없는 항목: {sorted(unknown)}")
+
+        patterns = {key: data.get(key, list(default)) for key, default in DEFAULT_PATTERNS.items()}
+        return cls.build(
+            patterns,
+            _threshold(data, "spam_threshold"),
+            _threshold(data, "warning_threshold"),
+            version=str(data["version"]),
+            source=path
+        )
+
+    def to_build_args(self) -> Dict[str, Any]:
+        """다른 프로세스에서 같은 세트를 다시 만들 수 있도록 build 인자를 반환합니다. (매처는 피클하지 않음)"""
+        return {
+            "patterns": self.patterns,
+            "spam_threshold": self.spam_threshold,
+            "warning_threshold": self.warning_threshold,
+            "version": self.version,
+            "source": self.source,
+        }
+
+    def get_info(self) -> Dict[str, Any]:
+        """메트릭에 노출할 패턴 세트 정보를 반환합니다."""
+        return {
+            "version": self.version,
+            "source": self.source,
+            "fingerprint": self.fingerprint,
+            "loaded_at": self.loaded_at,
+            "pattern_count": self.matcher.pattern_count,
+            "spam_threshold": self.spam_threshold,
+            "warning_threshold": self.warning_threshold,
+        }
+
+
+def load_pattern_set(path: Optional[str]) -> GuardrailPatternSet:
+    """
+    패턴 파일이 지정되어 있으면 파일에서, 없거나 읽을 수 없으면 기본 설정으로 패턴 세트를 만듭니다.
+
+    Args:
+        path: 패턴 파일 경로 (None이면 기본 설정)
+    """
+    if path:
+        try:
+            return GuardrailPatternSet.from_file(path)
+        except (OSError, ValueError) as e:
+            print(f"Guardrail patterns: failed to load {path}, using built-in patterns ({e})")
+    return GuardrailPatternSet.from_config()
+
+
+def _threshold(data: Dict[str, Any], key: str) -> int:
+    """패턴 파일의 임계값을 정수로 읽습니다. (null, 목록, 객체 등은 ValueError)"""
+    value = data.get(key, GUARDRAIL_CONFIG[key])
+    if isinstance(value, bool):
+        raise ValueError(f"'{key}'는 정수여야 합니다: {value!r}")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}'는 정수여야 합니다: {value!r}")
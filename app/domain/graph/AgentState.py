@@ -7,4 +7,24 @@ class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
     next: str
     session_id: Optional[str]
-    agent_scratchpad: Annotated[Sequence[BaseMessage], operator.add]
\ No newline at end of file
+    agent_scratchpad: Annotated[Sequence[BaseMessage], operator.add]
+    # 턴 내 에이전트 실행 횟수
+    hops: int
+    # 마지막 에이전트 응답이 최종 답변인지 여부
+    terminal: bool
+    # 여러 에이전트를 거쳐야 하는 복합 요청인지 여부 (supervisor가 분류)
+    multi_step: bool
+    # supervisor가 세운 복합 요청 실행 계획 (PlanStep 목록)
+    plan: list
+    # 계획 단계별 실행 결과 (병렬 실행된 워커의 결과가 누적됨)
+    step_results: Annotated[list, operator.add]
+    # 입력 가드레일 차단 정보
+    guardrail_blocked: bool
+    guardrail_message: str
+    guardrail_reason: str
+    # 출력 가드레일 차단 정보
+    output_guardrail_blocked: bool
+    output_guardrail_message: str
+    output_guardrail_reason: str
+    # 출력 가드레일이 검사를 마친 메시지 수 (이후 추가된 메시지만 검사)
+    output_guardrail_checked: int
\ No newline at end of file
@@ -0,0 +1,113 @@
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage
+
+
+def ensure_message_id(message: BaseMessage) -> BaseMessage:
+    """
+    메시지에 ID가 없으면 새 ID를 붙입니다.
+    저장된 메시지를 내용이 아닌 ID로 식별할 수 있도록 저장소가 메시지를 추가할 때 호출합니다.
+    """
+    if not message.id:
+        message.id = uuid.uuid4().hex
+    return message
+
+
+class ChatMemoryInterface(ABC):
+    """
+    대화 히스토리 저장소 인터페이스.
+    인메모리, SQLite 등 다양한 저장소 구현체를 지원하기 위한 공통 인터페이스입니다.
+    """
+
+    @abstractmethod
+    def add_message(self, session_id: str, message: BaseMessage):
+        """
+        세션에 메시지를 추가합니다. ID가 없는 메시지에는 ensure_message_id로 ID를 붙입니다.
+
+        Args:
+            session_id: 세션 ID
+            message: 추가할 메시지
+        """
+        pass
+
+    def add_messages(self, session_id: str, messages: Iterable[BaseMessage]):
+        """
+        세션에 여러 메시지를 추가합니다.
+
+        Args:
+            session_id: 세션 ID
+            messages: 추가할 메시지들
+        """
+        for message in messages:
+            self.add_message(session_id, message)
+
+    @abstractmethod
+    def get_messages(self, session_id: str) -> Sequence[BaseMessage]:
+        """
+        세션의 최근 메시지 히스토리를 반환합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            오래된 순으로 정렬된 메시지 시퀀스
+        """
+        pass
+
+    @abstractmethod
+    def clear_session(self, session_id: str):
+        """
+        세션의 메시지를 모두 삭제합니다.
+
+        Args:
+            session_id: 세션 ID
+        """
+        pass
+
+    @abstractmethod
+    def get_session_count(self) -> int:
+        """활성 세션 수를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def get_total_messages(self) -> int:
+        """전체 메시지 수를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def iter_all_messages(self) -> Iterator[Tuple[str, int, BaseMessage]]:
+        """
+        저장된 모든 세션의 메시지를 순회합니다. (감사/재검사용)
+
+        Yields:
+            (세션 ID, 세션 내 메시지 위치, 메시지)
+        """
+        pass
+
+    def get_eviction_stats(self) -> Dict[str, Any]:
+        """저장소의 세션 제거 통계를 반환합니다. 제거가 없는 저장소는 빈 통계를 반환합니다."""
+        return {"total": 0}
+
+    def commit_turn(self, session_id: str):
+        """
+        한 턴 동안 쌓인 쓰기를 반영합니다.
+        쓰기를 즉시 반영하는 저장소에서는 아무 작업도 하지 않습니다.
+
+        Args:
+            session_id: 세션 ID
+        """
+        pass
+
+    def start_sweeper(self, interval: float) -> None:
+        """백그라운드 정리 작업을 시작합니다. 필요 없는 저장소에서는 아무 작업도 하지 않습니다."""
+        pass
+
+    async def stop_sweeper(self) -> None:
+        """백그라운드 정리 작업을 중지합니다."""
+        pass
+
+    def close(self) -> None:
+        """저장소 리소스를 해제합니다."""
+        pass
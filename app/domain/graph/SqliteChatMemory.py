@@ -0,0 +1,200 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+from app.domain.graph.ChatMemoryInterface import ChatMemoryInterface, ensure_message_id
+
+
+class SqliteChatMemory(ChatMemoryInterface):
+    """
+    SQLite(WAL) 기반의 영속 대화 저장소.
+
+    메시지는 추가만 되는(append-only) 테이블에 저장되며, 한 턴 동안의 쓰기는 모아서
+    commit_turn 시점에 하나의 트랜잭션으로 반영합니다. WAL 모드를 사용하므로 같은 호스트의
+    여러 워커 프로세스가 하나의 파일을 공유할 수 있습니다.
+    """
+
+    # 커밋되지 않은 메시지가 이 개수를 넘으면 턴 종료 전이라도 반영
+    MAX_PENDING_MESSAGES = 100
+
+    def __init__(self, path: str, max_messages: int = 50, busy_timeout_ms: int = 5000, read_only: bool = False):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로
+            max_messages: get_messages가 반환하는 최근 메시지 수
+            busy_timeout_ms: 다른 워커가 쓰기 잠금을 가진 경우 대기 시간
+            read_only: 읽기 전용으로 열기 (덤프 검사용, 파일을 변경하지 않음)
+
+        Raises:
+            sqlite3.DatabaseError: read_only인데 대화 저장소 파일이 아닌 경우
+        """
+        self.path = path
+        self.max_messages = max_messages
+        self.read_only = read_only
+
+        if read_only:
+            self._conn = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            try:
+                self._conn.execute("SELECT seq, session_id, message FROM messages LIMIT 1").fetchall()
+            except sqlite3.DatabaseError:
+                self._conn.close()
+                raise
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            self._create_schema()
+
+        # 세션별로 아직 커밋되지 않은 메시지
+        self._pending: Dict[str, List[BaseMessage]] = {}
+        self._lock = threading.RLock()
+
+    def _create_schema(self):
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                message TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_messages_session_seq ON messages (session_id, seq);
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                message_count INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+
+    def add_message(self, session_id: str, message: BaseMessage):
+        """세션에 메시지를 추가합니다. 실제 쓰기는 commit_turn에서 반영됩니다."""
+        with self._lock:
+            pending = self._pending.setdefault(session_id, [])
+            pending.append(ensure_message_id(message))
+            if len(pending) >= self.MAX_PENDING_MESSAGES:
+                self.commit_turn(session_id)
+
+    def get_messages(self, session_id: str) -> Sequence[BaseMessage]:
+        """최근 메시지를 (session_id, seq) 인덱스에 대한 범위 쿼리 한 번으로 읽어옵니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, message FROM messages WHERE session_id = ? ORDER BY seq DESC LIMIT ?",
+                (session_id, self.max_messages),
+            ).fetchall()
+            pending = list(self._pending.get(session_id, []))
+
+        stored = messages_from_dict([json.loads(raw) for _, raw in reversed(rows)])
+        for (seq, _), message in zip(reversed(rows), stored):
+            # ID 없이 저장된 이전 메시지는 저장 순번으로 식별
+            if not message.id:
+                message.id = f"seq-{seq}"
+        messages = stored + pending
+        return messages[-self.max_messages:]
+
+    def commit_turn(self, session_id: str):
+        """세션에 쌓인 메시지를 하나의 트랜잭션으로 저장합니다."""
+        with self._lock:
+            pending = self._pending.pop(session_id, None)
+            if not pending:
+                return
+
+            now = time.time()
+            rows = [(session_id, json.dumps(message_to_dict(message), ensure_ascii=False), now)
+                    for message in pending]
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany(
+                    "INSERT INTO messages (session_id, message, created_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO sessions (session_id, message_count, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(session_id) DO UPDATE SET
+                        message_count = message_count + excluded.message_count,
+                        updated_at = excluded.updated_at
+                    """,
+                    (session_id, len(rows), now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                # 실패한 메시지는 다음 커밋에서 다시 시도
+                self._pending[session_id] = pending + self._pending.get(session_id, [])
+                raise
+
+    def clear_session(self, session_id: str):
+        """세션의 메시지를 모두 삭제합니다."""
+        with self._lock:
+            self._pending.pop(session_id, None)
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.execute("COMMIT")
+
+    def get_session_count(self) -> int:
+        """저장된 세션 수를 반환합니다."""
+        with self._lock:
+            stored = self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            return stored + len([s for s in self._pending if not self._session_exists(s)])
+
+    def get_total_messages(self) -> int:
+        """전체 메시지 수를 반환합니다."""
+        with self._lock:
+            stored = self._conn.execute("SELECT COALESCE(SUM(message_count), 0) FROM sessions").fetchone()[0]
+            return stored + sum(len(messages) for messages in self._pending.values())
+
+    def iter_all_messages(self, page_size: int = 500) -> Iterator[Tuple[str, int, BaseMessage]]:
+        """
+        저장된 모든 메시지를 seq 순서로 순회합니다.
+        seq 기준 페이지 단위로 읽으므로 전체를 메모리에 올리지 않으며,
+        페이지를 읽는 동안만 잠금을 잡습니다. 위치는 메시지의 seq입니다.
+        """
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, session_id, message FROM messages WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last_seq, page_size),
+                ).fetchall()
+            if not rows:
+                break
+            for seq, session_id, raw in rows:
+                yield session_id, seq, messages_from_dict([json.loads(raw)])[0]
+            last_seq = rows[-1][0]
+
+        # 아직 커밋되지 않은 메시지 (위치는 음수로 구분)
+        with self._lock:
+            pending = {session_id: list(messages) for session_id, messages in self._pending.items()}
+        for session_id, messages in pending.items():
+            for index, message in enumerate(messages):
+                yield session_id, -(index + 1), message
+
+    def get_eviction_stats(self) -> Dict[str, Any]:
+        """영속 저장소는 세션을 제거하지 않으므로 저장소 정보만 반환합니다."""
+        return {"total": 0, "backend": "sqlite", "path": self.path}
+
+    def close(self) -> None:
+        """남은 쓰기를 반영하고 연결을 닫습니다."""
+        with self._lock:
+            for session_id in list(self._pending):
+                self.commit_turn(session_id)
+            self._conn.close()
+
+    def _session_exists(self, session_id: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone() is not None
@@ -4,8 +4,11 @@ from app.domain.graph.setup import GraphSetup
 class TravelChatGraph:
     def __init__(self):
         self.graph = GraphSetup()
+        self.compiled_graph = None
 
     def start(self):
         """Start the travel chat graph."""
-        # Initialize the graph setup
-        return self.graph.setup_graph()
\ No newline at end of file
+        # 워크플로우는 한 번만 컴파일하고 이후 요청에서는 재사용
+        if self.compiled_graph is None:
+            self.compiled_graph = self.graph.setup_graph()
+        return self.compiled_graph
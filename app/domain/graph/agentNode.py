@@ -1,8 +1,49 @@
-from langchain_core.messages import HumanMessage, AIMessage, FunctionMessage
+from contextlib import aclosing
+
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, FunctionMessage
 from langchain_core.agents import AgentFinish, AgentActionMessageLog
+from langgraph.pregel import Pregel
+from app.config.settings import settings
+from app.domain.gaurdrails.guardrailNode import output_guardrail_block_update
+from app.domain.gaurdrails.guardrails import guardrail_system
+from app.domain.graph.context import context_builder
 from app.domain.graph.memory import chat_memory
 
-def agent_node(state, agent, name):
+
+async def _astream_with_guardrail(agent, agent_input):
+    """
+    LangGraph 에이전트를 스트리밍으로 실행하며 LLM 토큰이 도착할 때마다 출력 가드레일을 검사합니다.
+    차단되면 스트림을 닫아 진행 중인 LLM 호출을 중단합니다.
+
+    Returns:
+        (에이전트 최종 상태, 차단 시 GuardrailResult 또는 None)
+    """
+    checker = guardrail_system.stream_checker()
+    result = None
+    message_id = None
+
+    async with aclosing(agent.astream(agent_input, stream_mode=["messages", "values"])) as stream:
+        async for mode, data in stream:
+            if mode == "values":
+                result = data
+                continue
+
+            chunk = data[0]
+            if not isinstance(chunk, AIMessageChunk) or not isinstance(chunk.content, str) or not chunk.content:
+                continue
+            if chunk.id != message_id:
+                # 다른 LLM 호출의 응답과 토큰이 이어 붙지 않도록 구분
+                message_id = chunk.id
+                checker.feed("\n")
+
+            blocked = checker.feed(chunk.content)
+            if blocked:
+                return None, blocked
+
+    safety_result = checker.finish()
+    return result, (None if safety_result.is_safe else safety_result)
+
+async def agent_node(state, agent, name):
     # 필수 상태 변수들 추가
     if "intermediate_steps" not in state:
         state["intermediate_steps"] = []
@@ -11,7 +52,21 @@ def agent_node(state, agent, name):
     if "session_id" not in state:
         state["session_id"] = None
 
-    result = agent.invoke(state)
+    # 에이전트에는 토큰 예산에 맞춘 메시지만 전달
+    messages = context_builder.fit(state.get("messages", []), settings.CONTEXT_AGENT_TOKEN_BUDGET)
+    # 턴 내 hop 수 증가
+    hops = state.get("hops", 0) + 1
+
+    if isinstance(agent, Pregel):
+        result, blocked = await _astream_with_guardrail(agent, {**state, "messages": messages})
+        if blocked:
+            return {
+                **output_guardrail_block_update(blocked),
+                "hops": hops,
+                "terminal": False
+            }
+    else:
+        result = await agent.ainvoke({**state, "messages": messages})
     
     # AgentFinish 처리
     if isinstance(result, AgentFinish):
@@ -23,7 +78,9 @@ def agent_node(state, agent, name):
             chat_memory.add_message(state["session_id"], response_message)
         
         return {
-            "messages": [response_message]
+            "messages": [response_message],
+            "hops": hops,
+            "terminal": True
         }
     
     # AgentActionMessageLog 처리 (도구 호출)
@@ -32,20 +89,17 @@ def agent_node(state, agent, name):
         tool_name = result.tool
         tool_input = result.tool_input
         
-        # 도구 함수 찾기 및 실행
-        tool_func = None
+        # 도구 찾기 및 실행
+        tool_obj = None
         for tool in agent.tools:
             if tool.name == tool_name:
-                tool_func = tool.func
+                tool_obj = tool
                 break
         
-        if tool_func:
+        if tool_obj:
             try:
-                # 도구 실행 - tool_input이 딕셔너리가 아닐 경우 처리
-                if isinstance(tool_input, dict):
-                    tool_result = tool_func(**tool_input)
-                else:
-                    tool_result = tool_func(tool_input)
+                # 도구 실행 - 비동기 도구는 이벤트 루프에서, 동기 도구는 스레드 풀에서 실행
+                tool_result = await tool_obj.ainvoke(tool_input)
                 
                 # FunctionMessage 생성
                 function_message = FunctionMessage(
@@ -60,7 +114,9 @@ def agent_node(state, agent, name):
                 
                 return {
                     "messages": [function_message],
-                    "intermediate_steps": new_intermediate_steps
+                    "intermediate_steps": new_intermediate_steps,
+                    "hops": hops,
+                    "terminal": False
                 }
             except Exception as e:
                 error_msg = f"도구 실행 중 오류 발생: {str(e)}"
@@ -71,7 +127,9 @@ def agent_node(state, agent, name):
                     chat_memory.add_message(state["session_id"], error_message)
                 
                 return {
-                    "messages": [error_message]
+                    "messages": [error_message],
+                    "hops": hops,
+                    "terminal": False
                 }
         else:
             error_msg = f"도구를 찾을 수 없습니다: {tool_name}"
@@ -82,7 +140,9 @@ def agent_node(state, agent, name):
                 chat_memory.add_message(state["session_id"], error_message)
             
             return {
-                "messages": [error_message]
+                "messages": [error_message],
+                "hops": hops,
+                "terminal": False
             }
     
     # 기타(기존 방식)
@@ -95,5 +155,7 @@ def agent_node(state, agent, name):
             chat_memory.add_message(state["session_id"], response_message)
         
         return {
-            "messages": [response_message]
+            "messages": [response_message],
+            "hops": hops,
+            "terminal": True
         }
\ No newline at end of file
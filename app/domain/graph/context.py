@@ -0,0 +1,269 @@
+"""
+대화 컨텍스트 빌더
+
+세션 히스토리를 토큰 예산에 맞게 잘라 각 노드에 전달합니다.
+최근 N턴은 그대로 유지하고, 그보다 오래된 턴은 점진적으로 갱신되는 요약으로 대체합니다.
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Set, Tuple
+
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.config.ai import openai_chat
+from app.config.prompts import get_prompt
+from app.config.settings import settings
+
+# 메시지마다 붙는 역할/구분자 토큰 수
+MESSAGE_TOKEN_OVERHEAD = 4
+
+SUMMARY_PREFIX = "이전 대화 요약:\n"
+
+
+def _content_text(message: BaseMessage) -> str:
+    content = message.content
+    return content if isinstance(content, str) else json.dumps(content, ensure_ascii=False, default=str)
+
+
+def _fingerprint(message: BaseMessage) -> int:
+    """메시지 내용 기반 식별자 (내용이 같으면 토큰 수도 같으므로 토큰 수 캐시 키로 사용)"""
+    return hash((message.type, getattr(message, "name", None), _content_text(message)))
+
+
+def _is_user_message(message: BaseMessage) -> bool:
+    """에이전트가 아닌 실제 사용자가 보낸 메시지인지 확인합니다."""
+    return message.type == "human" and not getattr(message, "name", None)
+
+
+def _is_summary(message: BaseMessage) -> bool:
+    return message.type == "system" and _content_text(message).startswith(SUMMARY_PREFIX)
+
+
+class TokenCounter:
+    """메시지 토큰 수를 계산하고 결과를 LRU 캐시에 저장합니다."""
+
+    def __init__(self, model: str = "gpt-4o", cache_size: int = 10000):
+        self.model = model
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, int]" = OrderedDict()
+        self._encoding = None
+        self._encoding_loaded = False
+
+    def _get_encoding(self):
+        # tiktoken 인코딩 파일을 받을 수 없는 환경에서는 근사치를 사용
+        if not self._encoding_loaded:
+            self._encoding_loaded = True
+            try:
+                import tiktoken
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except Exception as e:
+                print(f"TokenCounter: tiktoken unavailable, using estimate ({type(e).__name__})")
+        return self._encoding
+
+    def count_text(self, text: str) -> int:
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text))
+        # 한글은 글자당 약 1토큰(3바이트), 영문은 약 4글자당 1토큰
+        return max(1, len(text.encode("utf-8")) // 3)
+
+    def count(self, message: BaseMessage) -> int:
+        key = _fingerprint(message)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        tokens = self.count_text(_content_text(message)) + MESSAGE_TOKEN_OVERHEAD
+        self._cache[key] = tokens
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def count_all(self, messages: Sequence[BaseMessage]) -> int:
+        return sum(self.count(message) for message in messages)
+
+
+class ContextBuilder:
+    """토큰 예산에 맞춰 그래프와 각 노드에 전달할 메시지를 구성합니다."""
+
+    def __init__(
+        self,
+        token_budget: int = 6000,
+        recent_turns: int = 6,
+        summarizer=None,
+        token_counter: Optional[TokenCounter] = None,
+        max_sessions: int = 10000
+    ):
+        """
+        Args:
+            token_budget: 그래프 입력 메시지의 최대 토큰 수
+            recent_turns: 요약하지 않고 그대로 유지할 최근 턴 수
+            summarizer: 요약에 사용할 LLM
+            token_counter: 토큰 계산기
+            max_sessions: 요약을 보관할 최대 세션 수
+        """
+        self.token_budget = token_budget
+        self.recent_turns = recent_turns
+        self.max_sessions = max_sessions
+        self.counter = token_counter or TokenCounter()
+
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", get_prompt('summary')),
+            ("human", "{previous_summary}\n\n---\n{conversation}"),
+        ])
+        self.summary_chain = prompt | (summarizer or openai_chat)
+
+        # 세션별 (요약 내용, 마지막으로 요약에 포함된 메시지의 ID)
+        self._summaries: "OrderedDict[str, Tuple[str, Optional[str]]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def build(self, session_id: str, messages: Sequence[BaseMessage]) -> Sequence[BaseMessage]:
+        """
+        세션 히스토리로 그래프 입력 메시지를 구성합니다.
+
+        오래된 턴의 요약이 있으면 요약 + 최근 턴을 사용하고, 요약 갱신이 필요하면
+        백그라운드에서 갱신하여 다음 턴부터 반영합니다. 갱신이 끝나기 전까지는 아직 요약되지
+        않은 오래된 메시지를 요약과 최근 턴 사이에 그대로 넣습니다. (예산을 넘으면 오래된 것부터 제외)
+
+        Args:
+            session_id: 세션 ID
+            messages: 세션 히스토리 (오래된 순)
+
+        Returns:
+            토큰 예산에 맞춘 메시지 시퀀스
+        """
+        split = self._recent_start(messages)
+        older = messages[:split]
+
+        if older and self._needs_refresh(session_id, older):
+            self._schedule_refresh(session_id, older)
+
+        summary = self._summaries.get(session_id)
+        if summary is None:
+            # 요약이 아직 없으면 예산 안에서 가능한 만큼 그대로 전달
+            if self.counter.count_all(messages) <= self.token_budget:
+                return messages
+            return self.fit(messages, self.token_budget)
+
+        summary_message = SystemMessage(content=SUMMARY_PREFIX + summary[0])
+        unsummarized = list(self._unsummarized(session_id, older))
+        return self.fit([summary_message] + unsummarized + list(messages[split:]), self.token_budget)
+
+    def fit(self, messages: Sequence[BaseMessage], budget: int) -> Sequence[BaseMessage]:
+        """
+        메시지를 토큰 예산에 맞게 자릅니다.
+
+        가장 최근 메시지부터 거꾸로 채우며, 맨 앞의 요약 메시지와 마지막 메시지는
+        항상 유지합니다. 토큰 수는 캐시되므로 노드마다 호출해도 비용이 작습니다.
+
+        Args:
+            messages: 메시지 (오래된 순)
+            budget: 최대 토큰 수
+
+        Returns:
+            예산에 맞춘 메시지 시퀀스
+        """
+        if not messages:
+            return messages
+
+        head: List[BaseMessage] = []
+        body = messages
+        if _is_summary(messages[0]):
+            head, body = [messages[0]], messages[1:]
+        if not body:
+            return messages
+
+        remaining = budget - self.counter.count_all(head)
+        kept: List[BaseMessage] = []
+        for message in reversed(body):
+            tokens = self.counter.count(message)
+            if kept and tokens > remaining:
+                break
+            kept.append(message)
+            remaining -= tokens
+
+        if len(kept) == len(body):
+            return messages
+        kept.reverse()
+        return head + kept
+
+    def get_summary(self, session_id: str) -> Optional[str]:
+        """세션의 현재 요약을 반환합니다."""
+        summary = self._summaries.get(session_id)
+        return summary[0] if summary else None
+
+    def clear_session(self, session_id: str):
+        """세션의 요약을 삭제합니다."""
+        self._summaries.pop(session_id, None)
+
+    def _recent_start(self, messages: Sequence[BaseMessage]) -> int:
+        """최근 N턴이 시작되는 위치를 찾습니다. 턴은 사용자 메시지로 시작합니다."""
+        turns = 0
+        for index in range(len(messages) - 1, -1, -1):
+            if _is_user_message(messages[index]):
+                turns += 1
+                if turns == self.recent_turns:
+                    return index
+        return 0
+
+    def _unsummarized(self, session_id: str, older: Sequence[BaseMessage]) -> Sequence[BaseMessage]:
+        """아직 요약에 포함되지 않은 오래된 메시지를 반환합니다."""
+        summary = self._summaries.get(session_id)
+        if summary is None:
+            return older
+
+        # 마지막으로 요약한 메시지 이후만 새로 요약 (버퍼에서 밀려났거나 ID가 없으면 남은 메시지 전체)
+        last = summary[1]
+        if last is None:
+            return older
+        for index in range(len(older) - 1, -1, -1):
+            if older[index].id == last:
+                return older[index + 1:]
+        return older
+
+    def _needs_refresh(self, session_id: str, older: Sequence[BaseMessage]) -> bool:
+        return session_id not in self._refreshing and len(self._unsummarized(session_id, older)) > 0
+
+    def _schedule_refresh(self, session_id: str, older: Sequence[BaseMessage]):
+        self._refreshing.add(session_id)
+        task = asyncio.create_task(self._refresh_summary(session_id, list(older)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh_summary(self, session_id: str, older: List[BaseMessage]):
+        """기존 요약에 새로 밀려난 턴만 더해 요약을 갱신합니다."""
+        try:
+            new_messages = self._unsummarized(session_id, older)
+            if not new_messages:
+                return
+
+            previous = self.get_summary(session_id) or "(없음)"
+            conversation = "\n".join(
+                f"[{getattr(message, 'name', None) or message.type}] {_content_text(message)}"
+                for message in new_messages
+            )
+            result = await self.summary_chain.ainvoke({
+                "previous_summary": f"기존 요약:\n{previous}",
+                "conversation": conversation,
+            })
+            self._summaries[session_id] = (result.content, new_messages[-1].id)
+            self._summaries.move_to_end(session_id)
+            if len(self._summaries) > self.max_sessions:
+                self._summaries.popitem(last=False)
+        except Exception as e:
+            print(f"ContextBuilder summary error: {str(e)}")
+        finally:
+            self._refreshing.discard(session_id)
+
+
+# 전역 컨텍스트 빌더 인스턴스
+context_builder = ContextBuilder(
+    token_budget=settings.CONTEXT_TOKEN_BUDGET,
+    recent_turns=settings.CONTEXT_RECENT_TURNS,
+    max_sessions=settings.CHAT_MEMORY_MAX_SESSIONS
+)
@@ -0,0 +1,97 @@
+"""
+그래프 조건부 엣지
+
+노드 실행 후 다음 노드를 결정하는 라우팅 함수들입니다.
+"""
+
+from typing import Any, Dict, List, Union
+
+from langgraph.types import Send
+
+from app.config.settings import settings
+from app.domain.gaurdrails.guardrailNode import check_guardrail_blocked
+from app.domain.graph.metrics import graph_metrics
+from app.domain.graph.planNode import ready_steps
+
+
+def _dispatch_steps(state: Dict[str, Any], steps: List[Any]) -> List[Send]:
+    """실행할 단계마다 plan_worker로 보내는 Send를 만듭니다."""
+    return [
+        Send("plan_worker", {
+            "messages": state["messages"],
+            "session_id": state.get("session_id"),
+            "hops": state.get("hops", 0),
+            "step_results": state.get("step_results", []),
+            "step": step,
+        })
+        for step in steps
+    ]
+
+
+def route_from_supervisor(state: Dict[str, Any]) -> Union[str, List[Send]]:
+    """
+    supervisor의 결정에 따라 다음 노드를 반환합니다.
+    한 턴의 hop 수가 제한에 도달하면 종료합니다.
+
+    supervisor가 여러 단계의 계획을 세웠으면 의존성이 없는 단계들을
+    plan_worker로 동시에 보냅니다.
+    """
+    if state["next"] == "FINISH":
+        return "FINISH"
+
+    hops = state.get("hops", 0)
+    if hops >= settings.GRAPH_MAX_HOPS:
+        graph_metrics.record_hop_limit()
+        return "FINISH"
+
+    plan = state.get("plan") or []
+    if len(plan) > 1:
+        if hops + len(plan) > settings.GRAPH_MAX_HOPS:
+            # 계획 전체를 실행할 hop 여유가 없으면 기존처럼 한 단계씩 진행
+            graph_metrics.record_hop_limit()
+            return state["next"]
+        steps = ready_steps(plan, state.get("step_results", []))
+        if steps:
+            graph_metrics.record_plan(len(plan), len(steps))
+            return _dispatch_steps(state, steps)
+
+    return state["next"]
+
+
+def route_after_guarded_supervisor(state: Dict[str, Any]) -> Union[str, List[Send]]:
+    """
+    입력 가드레일과 supervisor를 함께 실행한 진입 노드 이후 다음 노드를 결정합니다.
+    차단되었으면 가드레일 응답으로, 아니면 supervisor의 결정을 따릅니다.
+    """
+    if state.get("guardrail_blocked", False):
+        return "guardrail_response"
+    return route_from_supervisor(state)
+
+
+def route_after_merge(state: Dict[str, Any]) -> Union[str, List[Send]]:
+    """
+    merge 이후 다음 단계를 결정합니다.
+    앞선 단계의 결과를 기다리던 단계가 실행 가능해졌으면 보내고, 없으면 종료합니다.
+    """
+    steps = ready_steps(state.get("plan") or [], state.get("step_results", []))
+    if steps:
+        return _dispatch_steps(state, steps)
+    return "FINISH"
+
+
+def route_after_output_guardrail(state: Dict[str, Any]) -> str:
+    """
+    출력 가드레일 이후 다음 노드를 결정합니다.
+
+    에이전트가 종료 응답을 반환했고 요청이 복합 요청(multi_step)이 아니면
+    supervisor를 다시 호출하지 않고 바로 종료합니다.
+    """
+    next_node = check_guardrail_blocked(state)
+    if next_node != "supervisor":
+        return next_node
+
+    if state.get("terminal", False) and not state.get("multi_step", False):
+        graph_metrics.record_supervisor_avoided()
+        return "FINISH"
+
+    return "supervisor"
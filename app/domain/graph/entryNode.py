@@ -0,0 +1,51 @@
+"""
+낙관적 진입 노드
+
+입력 가드레일 검사와 첫 supervisor 라우팅을 동시에 시작합니다.
+대부분의 입력은 가드레일을 통과하므로, 안전한 요청의 지연 시간이
+(가드레일 + 라우팅)에서 max(가드레일, 라우팅)으로 줄어듭니다.
+가드레일이 차단하면 진행 중인 라우팅 LLM 호출을 취소하고 결과를 버립니다.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from app.domain.gaurdrails.guardrailNode import input_guardrail_node
+from app.domain.graph.metrics import graph_metrics
+
+
+async def guarded_supervisor_node(state: Dict[str, Any], supervisor) -> Dict[str, Any]:
+    """
+    입력 가드레일과 supervisor를 동시에 실행합니다.
+
+    Args:
+        state: 현재 상태
+        supervisor: 라우팅을 수행할 Supervisor
+
+    Returns:
+        가드레일 검사 결과와 (통과 시) 라우팅 결과를 합친 상태 업데이트
+    """
+    routing = asyncio.create_task(supervisor.invoke(state))
+    try:
+        # 가드레일 검사는 워커 스레드에서 수행하여 라우팅 요청이 그동안 진행되도록 함
+        guardrail_update = await asyncio.to_thread(input_guardrail_node, state)
+    except BaseException:
+        routing.cancel()
+        raise
+
+    if guardrail_update.get("guardrail_blocked"):
+        # 차단된 요청의 라우팅 결과는 사용하지 않음
+        completed = routing.done()
+        routing.cancel()
+        try:
+            await routing
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Optimistic routing error after block: {str(e)}")
+        graph_metrics.record_optimistic_entry(wasted=True, cancelled=not completed)
+        return guardrail_update
+
+    route = await routing
+    graph_metrics.record_optimistic_entry(wasted=False, cancelled=False)
+    return {**guardrail_update, **dict(route)}
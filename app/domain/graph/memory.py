@@ -1,40 +1,328 @@
-from typing import Dict, List, Optional
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Tuple
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from datetime import datetime
 import json
 
-class ChatMemory:
-    def __init__(self, max_messages: int = 50):
+from app.config.settings import settings
+from app.domain.graph.ChatMemoryInterface import ChatMemoryInterface, ensure_message_id
+from app.domain.graph.SqliteChatMemory import SqliteChatMemory
+
+# 메시지 객체 자체의 대략적인 오버헤드 (바이트)
+MESSAGE_OVERHEAD_BYTES = 256
+
+
+def estimate_message_bytes(message: BaseMessage) -> int:
+    """메시지가 차지하는 메모리를 대략적으로 계산합니다."""
+    content = message.content if isinstance(message.content, str) else json.dumps(message.content, default=str)
+    return len(content.encode("utf-8")) + MESSAGE_OVERHEAD_BYTES
+
+
+class MessageRing:
+    """
+    세션별 메시지를 저장하는 고정 크기 원형 버퍼.
+
+    용량을 초과하면 가장 오래된 슬롯을 덮어쓰므로, 정상 상태에서 메시지 추가 시
+    리스트를 다시 만들지 않습니다.
+    """
+
+    __slots__ = ("capacity", "appended", "_items", "_sizes")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        # 지금까지 추가된 전체 메시지 수 (절대 위치 계산용)
+        self.appended = 0
+        self._items: List[Optional[BaseMessage]] = [None] * capacity
+        self._sizes: List[int] = [0] * capacity
+
+    def __len__(self) -> int:
+        return min(self.appended, self.capacity)
+
+    @property
+    def first(self) -> int:
+        """버퍼에 남아 있는 가장 오래된 메시지의 절대 위치"""
+        return self.appended - len(self)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._sizes)
+
+    def append(self, message: BaseMessage, size: int) -> Tuple[bool, int]:
+        """
+        메시지를 추가합니다.
+
+        Returns:
+            (기존 메시지를 덮어썼는지 여부, 덮어쓴 메시지의 크기)
+        """
+        slot = self.appended % self.capacity
+        overwritten = self.appended >= self.capacity
+        old_size = self._sizes[slot] if overwritten else 0
+
+        self._items[slot] = message
+        self._sizes[slot] = size
+        self.appended += 1
+        return overwritten, old_size
+
+    def get(self, position: int) -> BaseMessage:
+        """절대 위치의 메시지를 반환합니다."""
+        if position < self.first or position >= self.appended:
+            raise IndexError("메시지가 이미 버퍼에서 제거되었습니다.")
+        return self._items[position % self.capacity]
+
+    def view(self) -> "MessageView":
+        """현재 메시지들에 대한 읽기 전용 뷰를 반환합니다 (복사 없음)."""
+        return MessageView(self, self.first, len(self))
+
+
+class MessageView(Sequence):
+    """
+    MessageRing의 읽기 전용 스냅샷 뷰.
+
+    생성 시점의 메시지 범위를 가리키며 메시지를 복사하지 않습니다.
+    그래프 입력처럼 바로 소비되는 용도로 사용합니다.
+    """
+
+    __slots__ = ("_ring", "_start", "_size")
+
+    def __init__(self, ring: Optional[MessageRing] = None, start: int = 0, size: int = 0):
+        self._ring = ring
+        self._start = start
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("MessageView index out of range")
+        return self._ring.get(self._start + index)
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        for position in range(self._start, self._start + self._size):
+            yield self._ring.get(position)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"MessageView({list(self)!r})"
+
+
+EMPTY_VIEW = MessageView()
+
+
+class ChatMemory(ChatMemoryInterface):
+    def __init__(
+        self,
+        max_messages: int = 50,
+        max_sessions: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        세션별 대화 히스토리를 저장하는 메모리.
+
+        세션은 마지막 접근 순서로 정렬된 OrderedDict에 저장되어, 가장 오래 사용되지 않은
+        세션이 항상 맨 앞에 위치합니다. 따라서 LRU/유휴 세션 제거가 O(1)입니다.
+        세션별 메시지는 고정 크기 원형 버퍼에 저장되며, 전체 메시지 수와 메모리 사용량은
+        증분으로 유지됩니다.
+
+        Args:
+            max_messages: 세션당 최대 메시지 수
+            max_sessions: 최대 세션 수 (None이면 제한 없음)
+            idle_ttl: 유휴 세션 만료 시간(초) (None이면 만료 없음)
+            max_bytes: 전체 메시지의 대략적인 최대 메모리 (None이면 제한 없음)
+        """
         self.max_messages = max_messages
-        self.conversations: Dict[str, List[BaseMessage]] = {}
-    
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+
+        self.conversations: "OrderedDict[str, MessageRing]" = OrderedDict()
+        self.last_access: Dict[str, float] = {}
+        self.total_bytes = 0
+        self.total_messages = 0
+        self.evictions: Dict[str, int] = {"lru": 0, "idle": 0, "memory": 0}
+
+        # 그래프의 동기 노드는 워커 스레드에서 실행되므로 잠금으로 보호
+        self._lock = threading.RLock()
+        self._sweeper: Optional[asyncio.Task] = None
+
     def add_message(self, session_id: str, message: BaseMessage):
         """세션에 메시지를 추가합니다."""
-        if session_id not in self.conversations:
-            self.conversations[session_id] = []
-        
-        self.conversations[session_id].append(message)
-        
-        # 최대 메시지 수를 초과하면 오래된 메시지 제거
-        if len(self.conversations[session_id]) > self.max_messages:
-            self.conversations[session_id] = self.conversations[session_id][-self.max_messages:]
-    
-    def get_messages(self, session_id: str) -> List[BaseMessage]:
-        """세션의 메시지 히스토리를 반환합니다."""
-        return self.conversations.get(session_id, [])
-    
+        with self._lock:
+            ring = self.conversations.get(session_id)
+            if ring is None:
+                ring = self.conversations[session_id] = MessageRing(self.max_messages)
+
+            # 최대 메시지 수를 초과하면 가장 오래된 메시지를 덮어씀
+            ensure_message_id(message)
+            size = estimate_message_bytes(message)
+            overwritten, old_size = ring.append(message, size)
+            self.total_bytes += size - old_size
+            if not overwritten:
+                self.total_messages += 1
+
+            self._touch(session_id)
+            self._evict()
+
+    def get_messages(self, session_id: str) -> MessageView:
+        """세션의 메시지 히스토리를 읽기 전용 뷰로 반환합니다."""
+        with self._lock:
+            if session_id not in self.conversations:
+                return EMPTY_VIEW
+
+            # 접근 시점에 만료 여부를 확인 (lazy eviction)
+            if self._is_idle(session_id, time.monotonic()):
+                self._remove(session_id, "idle")
+                return EMPTY_VIEW
+
+            self._touch(session_id)
+            return self.conversations[session_id].view()
+
     def clear_session(self, session_id: str):
         """세션의 메시지를 모두 삭제합니다."""
-        if session_id in self.conversations:
-            del self.conversations[session_id]
-    
+        with self._lock:
+            if session_id in self.conversations:
+                self._remove(session_id)
+
     def get_session_count(self) -> int:
         """활성 세션 수를 반환합니다."""
         return len(self.conversations)
-    
+
     def get_total_messages(self) -> int:
         """전체 메시지 수를 반환합니다."""
-        return sum(len(messages) for messages in self.conversations.values())
+        return self.total_messages
+
+    def iter_all_messages(self) -> Iterator[Tuple[str, int, BaseMessage]]:
+        """
+        모든 세션의 메시지를 순회합니다.
+        세션 단위로 잠금을 잡고 복사하므로 순회 중에도 대화 처리를 막지 않습니다.
+        """
+        with self._lock:
+            session_ids = list(self.conversations)
+
+        for session_id in session_ids:
+            with self._lock:
+                ring = self.conversations.get(session_id)
+                if ring is None:
+                    continue
+                first = ring.first
+                messages = list(ring.view())
+            for offset, message in enumerate(messages):
+                yield session_id, first + offset, message
+
+    def get_eviction_stats(self) -> Dict[str, int]:
+        """사유별 세션 제거 횟수와 메모리 사용량을 반환합니다."""
+        with self._lock:
+            return {
+                **self.evictions,
+                "total": sum(self.evictions.values()),
+                "approx_bytes": self.total_bytes,
+            }
+
+    def sweep(self) -> int:
+        """
+        유휴 세션과 한도를 초과한 세션을 제거합니다.
+
+        Returns:
+            제거된 세션 수
+        """
+        with self._lock:
+            before = len(self.conversations)
+            self._evict()
+            return before - len(self.conversations)
+
+    def start_sweeper(self, interval: float) -> None:
+        """백그라운드에서 주기적으로 sweep을 실행합니다."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever(interval))
+
+    async def stop_sweeper(self) -> None:
+        """백그라운드 sweep 작업을 중지합니다."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            removed = self.sweep()
+            if removed:
+                print(f"ChatMemory sweeper evicted {removed} sessions")
+
+    def _touch(self, session_id: str):
+        """세션을 가장 최근에 사용한 것으로 표시합니다."""
+        self.conversations.move_to_end(session_id)
+        self.last_access[session_id] = time.monotonic()
+
+    def _is_idle(self, session_id: str, now: float) -> bool:
+        return self.idle_ttl is not None and now - self.last_access[session_id] > self.idle_ttl
+
+    def _remove(self, session_id: str, reason: Optional[str] = None):
+        """세션을 제거하고, 사유가 주어지면 제거 통계에 반영합니다."""
+        ring = self.conversations.pop(session_id)
+        del self.last_access[session_id]
+        self.total_bytes -= ring.total_bytes
+        self.total_messages -= len(ring)
+        if reason:
+            self.evictions[reason] += 1
+
+    def _evict(self):
+        """맨 앞(가장 오래 사용되지 않은 세션)부터 한도를 만족할 때까지 제거합니다."""
+        now = time.monotonic()
+
+        # 유휴 세션 만료
+        while self.conversations:
+            oldest = next(iter(self.conversations))
+            if not self._is_idle(oldest, now):
+                break
+            self._remove(oldest, "idle")
+
+        # 세션 수 제한
+        if self.max_sessions is not None:
+            while len(self.conversations) > self.max_sessions:
+                self._remove(next(iter(self.conversations)), "lru")
+
+        # 전체 메모리 제한 (가장 최근 세션은 유지)
+        if self.max_bytes is not None:
+            while self.total_bytes > self.max_bytes and len(self.conversations) > 1:
+                self._remove(next(iter(self.conversations)), "memory")
+
+
+def create_chat_memory() -> ChatMemoryInterface:
+    """설정된 백엔드(memory, sqlite)에 맞는 대화 저장소를 생성합니다."""
+    backend = settings.CHAT_MEMORY_BACKEND
+
+    if backend == "sqlite":
+        return SqliteChatMemory(
+            path=settings.CHAT_MEMORY_SQLITE_PATH,
+            max_messages=settings.CHAT_MEMORY_MAX_MESSAGES
+        )
+    if backend == "memory":
+        return ChatMemory(
+            max_messages=settings.CHAT_MEMORY_MAX_MESSAGES,
+            max_sessions=settings.CHAT_MEMORY_MAX_SESSIONS,
+            idle_ttl=settings.CHAT_MEMORY_IDLE_TTL,
+            max_bytes=settings.CHAT_MEMORY_MAX_BYTES
+        )
+    raise ValueError(f"Unknown chat memory backend: {backend}")
+
 
 # 전역 메모리 인스턴스
-chat_memory = ChatMemory() 
\ No newline at end of file
+chat_memory = create_chat_memory()
@@ -0,0 +1,97 @@
+"""
+그래프 실행 메트릭
+
+턴별 hop 수, supervisor 호출/생략 횟수와 계획 병렬 실행 횟수를 집계합니다.
+"""
+
+import threading
+from typing import Any, Dict
+
+
+class GraphMetrics:
+    """그래프 실행 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.turns = 0
+        self.total_hops = 0
+        self.max_hops = 0
+        self.supervisor_llm_calls = 0
+        self.supervisor_calls_avoided = 0
+        self.hop_limit_reached = 0
+        self.plans = 0
+        self.plan_steps = 0
+        self.parallel_steps = 0
+        self.optimistic_entries = 0
+        self.optimistic_wasted_routes = 0
+        self.optimistic_cancelled_routes = 0
+
+    def record_turn(self, hops: int):
+        """한 턴이 끝났을 때 hop 수를 기록합니다."""
+        with self._lock:
+            self.turns += 1
+            self.total_hops += hops
+            self.max_hops = max(self.max_hops, hops)
+
+    def record_supervisor_llm_call(self):
+        """Supervisor가 LLM으로 라우팅한 횟수를 기록합니다."""
+        with self._lock:
+            self.supervisor_llm_calls += 1
+
+    def record_supervisor_avoided(self):
+        """종료 응답으로 supervisor 호출을 생략한 횟수를 기록합니다."""
+        with self._lock:
+            self.supervisor_calls_avoided += 1
+
+    def record_hop_limit(self):
+        """hop 제한으로 턴을 종료한 횟수를 기록합니다."""
+        with self._lock:
+            self.hop_limit_reached += 1
+
+    def record_plan(self, steps: int, parallel: int):
+        """
+        supervisor의 계획 실행을 기록합니다.
+
+        Args:
+            steps: 계획의 전체 단계 수
+            parallel: 첫 번째로 동시에 실행된 단계 수
+        """
+        with self._lock:
+            self.plans += 1
+            self.plan_steps += steps
+            self.parallel_steps += parallel
+
+    def record_optimistic_entry(self, wasted: bool, cancelled: bool):
+        """
+        입력 가드레일과 동시에 시작한 라우팅 결과를 기록합니다.
+
+        Args:
+            wasted: 가드레일 차단으로 라우팅 결과를 버렸는지 여부
+            cancelled: 라우팅이 끝나기 전에 취소되었는지 여부
+        """
+        with self._lock:
+            self.optimistic_entries += 1
+            self.optimistic_wasted_routes += wasted
+            self.optimistic_cancelled_routes += cancelled
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "turns": self.turns,
+                "total_hops": self.total_hops,
+                "avg_hops_per_turn": round(self.total_hops / self.turns, 3) if self.turns else 0.0,
+                "max_hops_per_turn": self.max_hops,
+                "supervisor_llm_calls": self.supervisor_llm_calls,
+                "supervisor_calls_avoided": self.supervisor_calls_avoided,
+                "hop_limit_reached": self.hop_limit_reached,
+                "plans": self.plans,
+                "plan_steps": self.plan_steps,
+                "parallel_steps": self.parallel_steps,
+                "optimistic_entries": self.optimistic_entries,
+                "optimistic_wasted_routes": self.optimistic_wasted_routes,
+                "optimistic_cancelled_routes": self.optimistic_cancelled_routes,
+            }
+
+
+# 전역 그래프 메트릭 인스턴스
+graph_metrics = GraphMetrics()
@@ -0,0 +1,136 @@
+"""
+복합 요청 계획 실행 노드
+
+supervisor가 세운 계획(PlanStep 목록)의 단계들을 워커 노드에서 병렬로 실행하고,
+merge 노드에서 결과를 합칩니다. 다른 단계의 결과가 필요한 단계는 해당 단계가
+끝난 뒤에 실행됩니다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+from langchain_core.messages import HumanMessage
+
+from app.domain.gaurdrails.guardrails import guardrail_system
+
+# 계획 실행 결과를 합친 메시지의 이름
+PLAN_MESSAGE_NAME = "Planner"
+
+BLOCKED_STEP_RESPONSE = "죄송합니다. 안전하지 않은 내용이 포함된 응답이 생성되었습니다."
+
+
+def ready_steps(plan: Sequence[Any], step_results: Sequence[Dict[str, Any]]) -> List[Any]:
+    """
+    아직 실행되지 않았고 의존하는 단계가 모두 끝난 단계를 반환합니다.
+
+    Args:
+        plan: 실행 계획 (PlanStep 목록)
+        step_results: 지금까지의 단계별 실행 결과
+
+    Returns:
+        바로 실행할 수 있는 단계 목록
+    """
+    done = {result["id"] for result in step_results}
+    return [
+        step for step in plan
+        if step.id not in done and all(dep in done for dep in step.depends_on)
+    ]
+
+
+def _task_with_dependencies(step, step_results: Sequence[Dict[str, Any]]) -> str:
+    """단계 지시에 의존하는 단계의 결과를 덧붙입니다."""
+    results = {result["id"]: result for result in step_results}
+    dependencies = [results[dep] for dep in step.depends_on if dep in results]
+    if not dependencies:
+        return step.task
+
+    context = "\n".join(f"[{result['member']}] {result['content']}" for result in dependencies)
+    return f"{step.task}\n\n참고할 이전 단계 결과:\n{context}"
+
+
+async def plan_worker_node(
+    state: Dict[str, Any],
+    workers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]]
+) -> Dict[str, Any]:
+    """
+    계획의 한 단계를 담당 에이전트로 실행합니다.
+
+    Send로 전달된 상태에는 대화 메시지와 실행할 단계(step)가 들어 있습니다.
+    병렬로 실행되는 다른 워커와 충돌하지 않도록 결과는 step_results에만 기록하며,
+    출력 가드레일 검사도 여기서 바로 수행합니다.
+
+    Args:
+        state: Send로 전달된 워커 상태
+        workers: 멤버 이름별 에이전트 노드
+
+    Returns:
+        단계 실행 결과
+    """
+    step = state["step"]
+    task = _task_with_dependencies(step, state.get("step_results", []))
+    worker_state = {
+        **state,
+        "messages": list(state.get("messages", [])) + [HumanMessage(content=task)],
+        "agent_scratchpad": [],
+        "intermediate_steps": [],
+    }
+
+    blocked = False
+    try:
+        output = await workers[step.member](worker_state)
+        if output.get("output_guardrail_blocked"):
+            # 에이전트가 스트리밍 중에 응답을 차단한 경우
+            blocked = True
+            content = BLOCKED_STEP_RESPONSE
+        else:
+            content = output["messages"][-1].content
+    except Exception as e:
+        print(f"Plan step {step.id} ({step.member}) error: {str(e)}")
+        content = f"{step.member} 작업 중 오류가 발생했습니다: {str(e)}"
+
+    safety_result = guardrail_system.check_input_safety(content)
+    if not safety_result.is_safe:
+        blocked = True
+        print(f"🛡️ Output Guardrail blocked plan step {step.id}: {safety_result.reason}")
+        content = BLOCKED_STEP_RESPONSE
+
+    return {
+        "step_results": [{
+            "id": step.id,
+            "member": step.member,
+            "task": step.task,
+            "content": content,
+            "blocked": blocked,
+        }]
+    }
+
+
+def merge_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    병렬로 실행된 단계들의 결과를 합칩니다.
+
+    아직 실행할 단계가 남아 있으면 상태를 바꾸지 않고, 모든 단계가 끝나면
+    계획 순서대로 결과를 하나의 응답 메시지로 합칩니다.
+
+    Args:
+        state: 현재 상태
+
+    Returns:
+        합쳐진 응답을 포함한 상태 업데이트
+    """
+    plan = state.get("plan") or []
+    step_results = state.get("step_results", [])
+    if ready_steps(plan, step_results):
+        return {}
+
+    results = {result["id"]: result for result in step_results}
+    skipped = [step.id for step in plan if step.id not in results]
+    if skipped:
+        # 순환하거나 없는 단계에 의존하는 단계는 실행할 수 없음
+        print(f"Plan steps skipped (unresolved dependencies): {skipped}")
+
+    content = "\n\n".join(results[step.id]["content"] for step in plan if step.id in results)
+    return {
+        "messages": [HumanMessage(content=content, name=PLAN_MESSAGE_NAME)],
+        "hops": state.get("hops", 0) + len(results),
+        "terminal": True,
+    }
@@ -0,0 +1,151 @@
+"""
+그래프 레지스트리
+
+애플리케이션 시작 시 그래프를 한 번만 컴파일하고, 모든 요청이 컴파일된 그래프를 공유합니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.component.http.HttpClientPool import http_client_pool
+from app.config.ai import openai_chat
+from app.config.settings import settings
+from app.domain.graph.TravelChatGraph import TravelChatGraph
+
+
+class GraphNotReadyError(RuntimeError):
+    """그래프가 아직 준비되지 않았을 때 발생하는 예외"""
+
+
+async def _warm_up_llm() -> None:
+    """LLM 클라이언트의 연결 풀을 미리 채웁니다."""
+    await openai_chat.bind(max_tokens=1).ainvoke("ping")
+
+
+async def _warm_up_http() -> None:
+    """검색/캘린더 API 호스트에 미리 연결합니다."""
+    await http_client_pool.warm_up("https://openapi.naver.com", "https://kapi.kakao.com")
+
+
+class GraphRegistry:
+    """컴파일된 그래프와 준비 상태를 관리하는 레지스트리"""
+
+    def __init__(self):
+        self._chatbot = None
+        # 컴파일과 워밍업이 모두 끝난 뒤에만 True
+        self._ready = False
+        self._lock = asyncio.Lock()
+        self._last_attempt: Optional[float] = None
+
+        self.started_at: Optional[datetime] = None
+        self.ready_at: Optional[datetime] = None
+        self.compile_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.warmup: Dict[str, str] = {}
+
+        # (이름, 코루틴 함수) 목록 - 시작 시 순서대로 실행
+        self._warmers: List[Tuple[str, Callable[[], Awaitable[None]]]] = [
+            ("llm", _warm_up_llm),
+            ("http", _warm_up_http),
+        ]
+
+    @property
+    def is_ready(self) -> bool:
+        """그래프가 컴파일되어 요청을 처리할 수 있는지 여부"""
+        return self._ready
+
+    def add_warmer(self, name: str, warmer: Callable[[], Awaitable[None]]) -> None:
+        """시작 시 실행할 워밍업 작업을 등록합니다."""
+        self._warmers.append((name, warmer))
+
+    async def startup(self) -> None:
+        """그래프를 빌드/컴파일하고 클라이언트를 워밍업합니다."""
+        async with self._lock:
+            if self.is_ready:
+                return
+
+            self.started_at = datetime.now()
+            self._last_attempt = time.monotonic()
+            self.error = None
+
+            try:
+                # 에이전트 생성과 Gmail 인증은 블로킹 작업이므로 스레드에서 실행
+                started = time.perf_counter()
+                chatbot = await asyncio.to_thread(self._build)
+                self.compile_seconds = round(time.perf_counter() - started, 3)
+            except Exception as e:
+                self.error = f"그래프 초기화 실패: {str(e)}"
+                print(f"GraphRegistry Error: {self.error}")
+                return
+
+            if settings.GRAPH_WARMUP_ENABLED:
+                await self._warm_up()
+
+            # 워밍업이 끝난 뒤에 준비 상태로 전환
+            self._chatbot = chatbot
+            self.ready_at = datetime.now()
+            self._ready = True
+
+    async def retry_startup(self) -> None:
+        """
+        초기화에 실패한 경우 startup을 다시 시도합니다.
+        다른 시작 작업이 진행 중이거나, 마지막 시도 후 GRAPH_STARTUP_RETRY_INTERVAL이 지나지 않았으면 무시합니다.
+        """
+        if self.is_ready or self.error is None or self._lock.locked():
+            return
+        if self._last_attempt is not None and \
+                time.monotonic() - self._last_attempt < settings.GRAPH_STARTUP_RETRY_INTERVAL:
+            return
+        await self.startup()
+
+    async def shutdown(self) -> None:
+        """레지스트리를 초기 상태로 되돌립니다."""
+        async with self._lock:
+            self._ready = False
+            self._chatbot = None
+            self.ready_at = None
+
+    def get(self):
+        """
+        컴파일된 그래프를 반환합니다.
+
+        Raises:
+            GraphNotReadyError: 그래프가 아직 준비되지 않은 경우
+        """
+        if not self.is_ready:
+            raise GraphNotReadyError(self.error or "그래프가 아직 준비되지 않았습니다.")
+        return self._chatbot.compiled_graph
+
+    def status(self) -> Dict[str, Any]:
+        """준비 상태 정보를 반환합니다."""
+        return {
+            "ready": self.is_ready,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "ready_at": self.ready_at.isoformat() if self.ready_at else None,
+            "compile_seconds": self.compile_seconds,
+            "warmup": dict(self.warmup),
+            "error": self.error,
+        }
+
+    @staticmethod
+    def _build():
+        """그래프 설정을 생성하고 워크플로우를 컴파일합니다."""
+        chatbot = TravelChatGraph()
+        chatbot.start()
+        return chatbot
+
+    async def _warm_up(self) -> None:
+        """등록된 워밍업 작업을 실행합니다. 실패해도 준비 상태에는 영향을 주지 않습니다."""
+        for name, warmer in self._warmers:
+            try:
+                await asyncio.wait_for(warmer(), timeout=settings.GRAPH_WARMUP_TIMEOUT)
+                self.warmup[name] = "ok"
+            except Exception as e:
+                self.warmup[name] = f"failed: {type(e).__name__}"
+                print(f"GraphRegistry warm-up '{name}' failed: {str(e)}")
+
+
+# 전역 그래프 레지스트리 인스턴스
+graph_registry = GraphRegistry()
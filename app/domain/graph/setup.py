@@ -3,6 +3,8 @@ from typing import Hashable
 
 from langgraph.graph import StateGraph, END, START
 
+from app.config.settings import settings
+
 from app.domain.agents.calenderMaker.CalenderAgent import CalenderAgent
 from app.domain.agents.researcher.SearchAgent import SearchAgent
 from app.domain.agents.advisor.ChatAgent import ChatAgent
@@ -10,6 +12,14 @@ from app.domain.agents.supervisor.supervisor import Supervisor
 from app.domain.agents.mailAgent.MailAgent import MailAgent
 from app.domain.graph.AgentState import AgentState
 from app.domain.graph.agentNode import agent_node
+from app.domain.graph.edges import (
+    route_after_guarded_supervisor,
+    route_after_merge,
+    route_after_output_guardrail,
+    route_from_supervisor
+)
+from app.domain.graph.entryNode import guarded_supervisor_node
+from app.domain.graph.planNode import merge_node, plan_worker_node
 from app.domain.gaurdrails.guardrailNode import (
     input_guardrail_node,
     output_guardrail_node,
@@ -32,7 +42,6 @@ class GraphSetup:
         workflow = StateGraph(AgentState)
 
         # 가드레일 노드들 추가
-        workflow.add_node("input_guardrail", input_guardrail_node)
         workflow.add_node("output_guardrail", output_guardrail_node)
         workflow.add_node("guardrail_response", guardrail_response_node)
         workflow.add_node("output_guardrail_response", output_guardrail_response_node)
@@ -60,19 +69,42 @@ class GraphSetup:
         workflow.add_node("Chat", self.chat_agent.invoke)
         workflow.add_node("supervisor", self.supervisor.invoke)
 
+        # 복합 요청 계획을 병렬로 실행하는 워커와 결과를 합치는 merge 노드
+        plan_worker = functools.partial(
+            plan_worker_node,
+            workers={
+                "Researcher": search_node,
+                "Calender": calender_node,
+                "Mail": mail_node,
+                "Chat": self.chat_agent.invoke,
+            },
+        )
+        workflow.add_node("plan_worker", plan_worker)
+        workflow.add_node("merge", merge_node)
+        workflow.add_edge("plan_worker", "merge")
+        workflow.add_conditional_edges(
+            "merge",
+            route_after_merge,
+            {
+                "plan_worker": "plan_worker",
+                "FINISH": END
+            }
+        )
+
         # 에이전트에서 supervisor로의 엣지
         workflow.add_edge("Researcher", "output_guardrail")
         workflow.add_edge("Calender", "output_guardrail")
         workflow.add_edge("Mail", "output_guardrail")
         workflow.add_edge("Chat", "output_guardrail")
 
-        # 출력 가드레일에서 supervisor로의 조건부 엣지
+        # 출력 가드레일에서 supervisor로의 조건부 엣지 (종료 응답이면 바로 종료)
         workflow.add_conditional_edges(
             "output_guardrail", 
-            check_guardrail_blocked, 
+            route_after_output_guardrail, 
             {
                 "supervisor": "supervisor",
-                "output_guardrail_response": "output_guardrail_response"
+                "output_guardrail_response": "output_guardrail_response",
+                "FINISH": END
             }
         )
 
@@ -82,20 +114,35 @@ class GraphSetup:
             "Calender": "Calender", 
             "Mail": "Mail",
             "Chat": "Chat",
+            "plan_worker": "plan_worker",
             "FINISH": END
         }
-        workflow.add_conditional_edges("supervisor", lambda x: x["next"], conditional_map)
-
-        # 시작점 설정: 입력 가드레일 -> 조건부 분기
-        workflow.add_edge(START, "input_guardrail")
-        workflow.add_conditional_edges(
-            "input_guardrail",
-            check_guardrail_blocked,
-            {
-                "supervisor": "supervisor",
-                "guardrail_response": "guardrail_response"
-            }
-        )
+        workflow.add_conditional_edges("supervisor", route_from_supervisor, conditional_map)
+
+        if settings.GRAPH_OPTIMISTIC_ROUTING:
+            # 시작점 설정: 입력 가드레일과 첫 라우팅을 동시에 실행 -> 조건부 분기
+            workflow.add_node(
+                "guarded_supervisor",
+                functools.partial(guarded_supervisor_node, supervisor=self.supervisor)
+            )
+            workflow.add_edge(START, "guarded_supervisor")
+            workflow.add_conditional_edges(
+                "guarded_supervisor",
+                route_after_guarded_supervisor,
+                {**conditional_map, "guardrail_response": "guardrail_response"}
+            )
+        else:
+            # 시작점 설정: 입력 가드레일 -> 조건부 분기
+            workflow.add_node("input_guardrail", input_guardrail_node)
+            workflow.add_edge(START, "input_guardrail")
+            workflow.add_conditional_edges(
+                "input_guardrail",
+                check_guardrail_blocked,
+                {
+                    "supervisor": "supervisor",
+                    "guardrail_response": "guardrail_response"
+                }
+            )
 
         # 가드레일 응답 노드에서 종료
         workflow.add_edge("guardrail_response", END)
@@ -4,18 +4,56 @@ FastAPI 메인 애플리케이션
 멀티 에이전트 채팅 시스템의 API 진입점입니다.
 """
 
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from app.api.v1.admin import router as admin_router
 from app.api.v1.chat import router as chat_router
+from app.component.calendar.KakaoCalendar.KaKaoCalendarComponent import kakao_calendar_component
+from app.component.http.HttpClientPool import http_client_pool
+from app.component.search.cache.MemorySearchCache import search_cache
+from app.component.search.local.LocalSearchIndex import close_local_search_index
+from app.config.settings import settings
+from app.domain.gaurdrails.audit import guardrail_audit
+from app.domain.gaurdrails.guardrails import guardrail_system
+from app.domain.graph.memory import chat_memory
+from app.domain.graph.registry import graph_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작 시 그래프를 컴파일하고 워밍업합니다."""
+    await graph_registry.startup()
+    chat_memory.start_sweeper(settings.CHAT_MEMORY_SWEEP_INTERVAL)
+    search_cache.start_sweeper(
+        settings.SEARCH_CACHE_SWEEP_INTERVAL,
+        settings.SEARCH_CACHE_TTL + settings.SEARCH_CACHE_STALE_TTL
+    )
+    guardrail_system.start_watcher(settings.GUARDRAIL_PATTERNS_WATCH_INTERVAL)
+    kakao_calendar_component.start_sync(settings.CALENDAR_SYNC_INTERVAL)
+    yield
+    await kakao_calendar_component.stop_sync()
+    await guardrail_system.stop_watcher()
+    await guardrail_audit.stop()
+    await chat_memory.stop_sweeper()
+    await search_cache.stop_sweeper()
+    chat_memory.close()
+    search_cache.close()
+    close_local_search_index()
+    await graph_registry.shutdown()
+    await http_client_pool.aclose()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="Multi-Agent Chat API",
     description="LangChain과 LangGraph를 활용한 멀티 에이전트 채팅 시스템",
     version="1.0.0",
-    debug=True
+    debug=True,
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 추가
@@ -29,6 +67,7 @@ app.add_middleware(
 
 # API 라우터 등록
 app.include_router(chat_router, prefix="/api/v1")
+app.include_router(admin_router, prefix="/api/v1")
 
 @app.get("/")
 async def root():
@@ -43,14 +82,37 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """서버 상태를 확인하는 엔드포인트"""
+    """서버 상태를 확인하는 엔드포인트 (liveness와 readiness를 구분하여 보고)"""
     return {
         "status": "healthy",
+        "live": True,
+        "ready": graph_registry.is_ready,
+        "readiness": graph_registry.status(),
         "timestamp": datetime.now().isoformat(),
         "service": "Multi-Agent Chat API",
         "version": "1.0.0"
     }
 
+@app.get("/health/live")
+async def liveness_check():
+    """프로세스가 살아있는지 확인하는 엔드포인트"""
+    return {
+        "status": "alive",
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.get("/health/ready")
+async def readiness_check():
+    """그래프가 컴파일되어 요청을 처리할 수 있는지 확인하는 엔드포인트"""
+    status = graph_registry.status()
+    return JSONResponse(
+        status_code=200 if status["ready"] else 503,
+        content={
+            **status,
+            "timestamp": datetime.now().isoformat()
+        }
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,106 @@
+"""
+가드레일 매처 처리량 벤치마크
+
+패턴마다 re.findall을 반복하던 기존 방식과 컴파일된 PatternMatcher의
+처리량을 비교하고, 두 방식의 검사 결과가 같은지 확인합니다.
+
+실행: python -m benchmarks.guardrail_benchmark
+"""
+
+import random
+import re
+import time
+from typing import Dict, List
+
+from app.config.guardrail_patterns import (
+    FORBIDDEN_PATTERNS,
+    WARNING_PATTERNS,
+    SPAM_PATTERNS,
+    EMAIL_SPECIFIC_PATTERNS,
+    CALENDAR_SPECIFIC_PATTERNS,
+    SEARCH_SPECIFIC_PATTERNS,
+)
+from app.domain.gaurdrails.matcher import PatternMatcher
+
+CATEGORIES = {
+    "forbidden": FORBIDDEN_PATTERNS,
+    "spam": SPAM_PATTERNS,
+    "warning": WARNING_PATTERNS,
+    "email": EMAIL_SPECIFIC_PATTERNS["email_forbidden"],
+    "calendar": CALENDAR_SPECIFIC_PATTERNS["calendar_forbidden"],
+    "search": SEARCH_SPECIFIC_PATTERNS["search_forbidden"],
+}
+
+FILLER = [
+    "내일", "오후", "2시에", "회의", "일정", "등록해줘", "서울", "날씨", "검색", "결과를",
+    "메일로", "보내줘", "hello", "world", "meeting", "tomorrow", "오늘", "점심", "메뉴", "추천",
+]
+
+
+def legacy_scan(text: str) -> Dict[str, List[str]]:
+    """기존 GuardrailSystem과 같은 방식: 패턴마다 re.findall"""
+    text_lower = text.lower()
+    result = {}
+    for category, patterns in CATEGORIES.items():
+        matches = []
+        for pattern in patterns:
+            matches.extend(re.findall(pattern, text_lower, re.IGNORECASE))
+        result[category] = matches
+    return result
+
+
+def make_corpus(size: int, words_per_text: int, seed: int = 7) -> List[str]:
+    """일반 문장에 패턴 키워드와 경계 사례(조사 결합, 대소문자)를 섞은 텍스트를 만듭니다."""
+    rng = random.Random(seed)
+    keywords = []
+    for patterns in CATEGORIES.values():
+        for pattern in patterns:
+            keywords.extend(pattern[3:-3].split("|"))
+
+    corpus = []
+    for _ in range(size):
+        words = []
+        for _ in range(words_per_text):
+            roll = rng.random()
+            if roll < 0.08:
+                words.append(rng.choice(keywords))
+            elif roll < 0.10:
+                words.append(rng.choice(keywords) + rng.choice(["은", "를", "_1", ""]))
+            elif roll < 0.11:
+                words.append(rng.choice(keywords).upper())
+            else:
+                words.append(rng.choice(FILLER))
+        corpus.append(rng.choice([" ", ", ", ". "]).join(words))
+    return corpus
+
+
+def measure(fn, corpus: List[str], rounds: int) -> float:
+    """초당 처리 텍스트 수"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in corpus:
+            fn(text)
+    return rounds * len(corpus) / (time.perf_counter() - start)
+
+
+def main():
+    matcher = PatternMatcher(CATEGORIES)
+    print(f"patterns: {matcher.pattern_count}")
+
+    for words_per_text in (20, 200, 2000):
+        corpus = make_corpus(200, words_per_text)
+
+        mismatches = sum(1 for text in corpus if legacy_scan(text) != matcher.scan(text))
+        rounds = max(1, 2000 // words_per_text)
+        legacy = measure(legacy_scan, corpus, rounds)
+        compiled = measure(matcher.scan, corpus, rounds)
+
+        print(
+            f"{words_per_text:>5} words/text | legacy {legacy:>10.0f} texts/s | "
+            f"compiled {compiled:>10.0f} texts/s | speedup x{compiled / legacy:.1f} | "
+            f"mismatches {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+출력 가드레일 hop별 상태 크기 측정
+
+에이전트 → 출력 가드레일 → supervisor를 반복하는 그래프를 LLM 없이 실행하면서
+hop마다 상태의 메시지 수와 출력 가드레일이 검사한 메시지 수를 출력합니다.
+가드레일 노드가 변경분만 반환하므로 메시지 수는 hop 수에 비례해야 합니다.
+
+실행: python -m benchmarks.guardrail_state_growth
+"""
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph import END, START, StateGraph
+
+from app.domain.gaurdrails import guardrailNode
+from app.domain.gaurdrails.guardrailNode import input_guardrail_node, output_guardrail_node
+from app.domain.graph.AgentState import AgentState
+
+HOPS = 8
+HISTORY = 20
+
+scanned = []
+
+
+def agent(state):
+    return {
+        "messages": [HumanMessage(content=f"에이전트 응답 {state.get('hops', 0)}", name="Chat")],
+        "hops": state.get("hops", 0) + 1,
+    }
+
+
+def supervisor(state):
+    return {"next": "FINISH" if state.get("hops", 0) >= HOPS else "agent"}
+
+
+def main():
+    check_input_safety = guardrailNode.guardrail_system.check_input_safety
+
+    def counting_check(text):
+        scanned.append(text)
+        return check_input_safety(text)
+
+    guardrailNode.guardrail_system.check_input_safety = counting_check
+
+    workflow = StateGraph(AgentState)
+    workflow.add_node("input_guardrail", input_guardrail_node)
+    workflow.add_node("supervisor", supervisor)
+    workflow.add_node("agent", agent)
+    workflow.add_node("output_guardrail", output_guardrail_node)
+    workflow.add_edge(START, "input_guardrail")
+    workflow.add_edge("input_guardrail", "supervisor")
+    workflow.add_conditional_edges("supervisor", lambda state: state["next"], {"agent": "agent", "FINISH": END})
+    workflow.add_edge("agent", "output_guardrail")
+    workflow.add_edge("output_guardrail", "supervisor")
+    graph = workflow.compile()
+
+    history = [HumanMessage(content=f"이전 대화 {i}") for i in range(HISTORY)]
+    history.append(HumanMessage(content="오늘 일정 알려줘"))
+
+    print(f"history messages: {len(history)}")
+    printed = set()
+    for update in graph.stream(
+        {"messages": history, "hops": 0},
+        {"recursion_limit": 4 * HOPS + 4},
+        stream_mode="values"
+    ):
+        # 출력 가드레일 검사가 끝난 시점마다 한 줄씩 출력
+        if update.get("output_guardrail_checked") != len(update["messages"]) or update.get("hops", 0) in printed:
+            continue
+        printed.add(update.get("hops", 0))
+        print(
+            f"hops {update.get('hops', 0):>2} | messages {len(update['messages']):>3} | "
+            f"output guardrail watermark {update['output_guardrail_checked']:>3} | "
+            f"texts scanned so far {len(scanned):>3}"
+        )
+
+
+if __name__ == "__main__":
+    main()
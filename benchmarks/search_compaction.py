@@ -0,0 +1,95 @@
+"""
+검색 결과 압축 토큰 측정
+
+네이버 검색 API 형식의 결과(강조 태그, HTML 엔티티, 언론사 간 겹치는 기사 문장 포함)로
+검색 도구가 LLM에 전달하던 기존 문자열, 원본 항목 전체, 압축 결과의 토큰 수를 비교합니다.
+
+실행: python -m benchmarks.search_compaction
+"""
+
+import random
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from app.component.search.compactor import SearchResultCompactor
+from app.domain.graph.context import TokenCounter
+
+SENTENCES = [
+    "서울 지역은 내일 오전까지 &quot;강한 비&quot;가 내리겠습니다.",
+    "기상청은 <b>서울</b> 전역에 호우주의보를 발령했다고 밝혔습니다.",
+    "오후부터는 점차 그치겠으나 일부 지역은 밤까지 이어지겠습니다.",
+    "출근길 교통 혼잡이 예상되니 대중교통 이용을 권장합니다.",
+    "낮 최고 기온은 23도로 평년보다 조금 낮겠습니다.",
+    "주말에는 대체로 맑은 날씨가 이어질 전망입니다.",
+    "<b>날씨</b> 앱에서 실시간 강수 정보를 확인할 수 있습니다.",
+    "한강 공원 일부 구간은 침수 우려로 통제될 수 있습니다.",
+]
+
+TOOL_PREFIX = "✅ 검색이 완료되었습니다!\n\n🔍 검색 결과:\n"
+
+
+def make_items(vertical: str, count: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(count):
+        # 여러 언론사가 같은 기사 문장을 조금씩 다르게 잘라 싣는 경우를 흉내냄
+        start = rng.randrange(len(SENTENCES) - 3)
+        description = " ".join(SENTENCES[start:start + rng.randint(2, 3)]) + "..."
+        item = {
+            "title": f"<b>서울 날씨</b> {vertical} 소식 {i + 1} &amp; 전망",
+            "link": f"https://{vertical}.example.com/articles/{seed}-{i}?from=naver",
+            "description": description,
+        }
+        if vertical == "news":
+            item["originallink"] = item["link"].replace("example.com", "press.example.com")
+            item["pubDate"] = format_datetime(now - timedelta(hours=i * 5))
+        elif vertical == "blog":
+            item["bloggername"] = f"블로거{i}"
+            item["bloggerlink"] = f"blog.example.com/user{i}"
+            item["postdate"] = (now - timedelta(days=i)).strftime("%Y%m%d")
+        items.append(item)
+    return items
+
+
+def legacy_payload(items: List[Dict[str, Any]]) -> str:
+    """이전 NaverSearchComponent._parse_results와 search_tool이 만들던 문자열"""
+    return TOOL_PREFIX + " ".join(item["description"] for item in items)
+
+
+def main():
+    counter = TokenCounter()
+    compactor = SearchResultCompactor(counter)
+
+    print(f"{'case':<28} | {'legacy':>6} | {'raw items':>9} | {'compact':>7} | vs raw")
+    for vertical, count in (("kin", 5), ("news", 5), ("news", 10), ("blog", 10)):
+        items = make_items(vertical, count, seed=count)
+        raw = "\n".join(f"{item['title']} {item['link']} {item['description']}" for item in items)
+        legacy = counter.count_text(legacy_payload(items))
+        raw_tokens = counter.count_text(raw)
+        compact = counter.count_text(compactor.compact(items, token_budget=600))
+        print(
+            f"{vertical + ' x' + str(count):<28} | {legacy:>6} | {raw_tokens:>9} | {compact:>7} | "
+            f"-{1 - compact / raw_tokens:.0%}"
+        )
+
+    # 다중 검색 타입 결과 (5개 타입 x 5개)
+    items = [
+        {**item, "vertical": vertical}
+        for index, vertical in enumerate(("news", "blog", "webkr", "kin", "doc"))
+        for item in make_items(vertical, 5, seed=index)
+    ]
+    raw = "\n".join(f"{item['title']} {item['link']} {item['description']}" for item in items)
+    raw_tokens = counter.count_text(raw)
+    compact = counter.count_text(compactor.compact(items, token_budget=600))
+    print(
+        f"{'5 verticals x5 (budget 600)':<28} | {'-':>6} | {raw_tokens:>9} | {compact:>7} | "
+        f"-{1 - compact / raw_tokens:.0%}"
+    )
+    print()
+    print(compactor.compact(make_items("news", 5, seed=5), token_budget=600))
+
+
+if __name__ == "__main__":
+    main()